@@ -25,7 +25,15 @@ from .loader import (
 from .parser import parse_schema_file
 
 # Bit layout computation
-from .layout import compute_bit_layout, FieldLayout
+from .layout import (
+    compile_layouts,
+    compute_bit_layout,
+    field_constants,
+    layout_constants,
+    CompiledLayout,
+    FieldConstants,
+    FieldLayout,
+)
 
 # Output generation
 from .output import generate_output_schema
@@ -34,13 +42,35 @@ from .output import generate_output_schema
 from .validator import validate_data, validate_field_value
 
 # Encoding
-from .encoder import encode, normalize_value
+from .encoder import (
+    compile_encoder,
+    encode,
+    encode_columns,
+    encode_many,
+    normalize_value,
+)
 
 # Decoding
-from .decoder import decode, denormalize_value
+from .decoder import (
+    compile_decoder,
+    compile_extractor,
+    compile_record_class,
+    decode,
+    decode_columns,
+    decode_many,
+    denormalize_value,
+    extract_columns,
+    RawColumns,
+)
 
 # Code generation
-from .codegen import generate_dataclass_code
+from .codegen import (
+    compile_module,
+    exec_generated,
+    generate_c_source,
+    generate_dataclass_code,
+    generate_module_code,
+)
 
 # JSON Schema export
 from .jsonschema import generate_json_schema
@@ -78,6 +108,11 @@ __all__ = [
     # Layout computation
     "compute_bit_layout",
     "FieldLayout",
+    "field_constants",
+    "layout_constants",
+    "FieldConstants",
+    "compile_layouts",
+    "CompiledLayout",
     # Output generation
     "generate_output_schema",
     # Runtime validation
@@ -85,12 +120,26 @@ __all__ = [
     "validate_field_value",
     # Encoding
     "encode",
+    "encode_many",
+    "encode_columns",
+    "compile_encoder",
     "normalize_value",
     # Decoding
     "decode",
+    "decode_many",
+    "decode_columns",
+    "compile_decoder",
+    "compile_extractor",
+    "compile_record_class",
+    "extract_columns",
+    "RawColumns",
     "denormalize_value",
     # Code generation
     "generate_dataclass_code",
+    "exec_generated",
+    "generate_module_code",
+    "compile_module",
+    "generate_c_source",
     # JSON Schema export
     "generate_json_schema",
     # Visualization
@@ -2,6 +2,7 @@
 
 Usage:
     bitschema generate schema.yaml [--output file.py] [--class-name ClassName]
+                                   [--target {python,c}]
     bitschema jsonschema schema.yaml [--output file.json] [--indent N]
     bitschema visualize schema.yaml [--format {ascii,markdown}] [--output file.txt]
 """
@@ -14,14 +15,12 @@ from pathlib import Path
 from bitschema import (
     parse_schema_file,
     compute_bit_layout,
+    generate_c_source,
     generate_dataclass_code,
     generate_json_schema,
     visualize_bit_layout,
     ValidationError,
     SchemaError,
-    BoolFieldDefinition,
-    IntFieldDefinition,
-    EnumFieldDefinition,
 )
 
 
@@ -34,34 +33,14 @@ def _schema_fields_to_list(schema):
     Returns:
         List of field dicts suitable for compute_bit_layout
     """
-    fields_list = []
-    for name, field_def in schema.fields.items():
-        field_dict = {"name": name}
-        if isinstance(field_def, BoolFieldDefinition):
-            field_dict["type"] = "boolean"
-            field_dict["nullable"] = field_def.nullable
-        elif isinstance(field_def, IntFieldDefinition):
-            field_dict.update({
-                "type": "integer",
-                "min": field_def.min,
-                "max": field_def.max,
-                "nullable": field_def.nullable,
-            })
-        elif isinstance(field_def, EnumFieldDefinition):
-            field_dict.update({
-                "type": "enum",
-                "values": field_def.values,
-                "nullable": field_def.nullable,
-            })
-        fields_list.append(field_dict)
-    return fields_list
+    return schema.to_layout_inputs()
 
 
 def cmd_generate(args):
-    """Generate Python dataclass code from schema file.
+    """Generate Python dataclass code (or C kernels) from schema file.
 
     Args:
-        args: Parsed arguments with schema_file, output, class_name
+        args: Parsed arguments with schema_file, output, class_name, target
     """
     try:
         # Parse schema file
@@ -75,14 +54,19 @@ def cmd_generate(args):
         fields_list = _schema_fields_to_list(schema)
         layouts, total_bits = compute_bit_layout(fields_list)
 
-        # Generate dataclass code
-        code = generate_dataclass_code(schema, layouts)
+        # Generate dataclass code, or C source to compile ahead of time
+        if args.target == "c":
+            code = generate_c_source(schema, layouts)
+            kind = "C source"
+        else:
+            code = generate_dataclass_code(schema, layouts)
+            kind = "dataclass"
 
         # Write to output or stdout
         if args.output:
             output_path = Path(args.output)
             output_path.write_text(code)
-            print(f"Generated dataclass written to: {args.output}", file=sys.stderr)
+            print(f"Generated {kind} written to: {args.output}", file=sys.stderr)
         else:
             print(code)
 
@@ -172,8 +156,12 @@ def cmd_visualize(args):
         sys.exit(1)
 
 
-def main():
-    """Main CLI entry point."""
+def build_parser():
+    """Build the bitschema argument parser with all subcommands.
+
+    Returns:
+        argparse.ArgumentParser whose subcommands dispatch via args.func
+    """
     parser = argparse.ArgumentParser(
         prog="bitschema",
         description="BitSchema: Bit-level data packing with mathematical correctness",
@@ -211,6 +199,16 @@ def main():
         default=None,
         help="Override class name (default: derived from schema)",
     )
+    generate_parser.add_argument(
+        "--target",
+        type=str,
+        choices=["python", "c"],
+        default="python",
+        help=(
+            "Output language: python (dataclass) or c (encode/decode kernels "
+            "to build into a shared library at build time) (default: python)"
+        ),
+    )
     generate_parser.set_defaults(func=cmd_generate)
 
     # JSON Schema subcommand
@@ -267,8 +265,19 @@ def main():
     )
     visualize_parser.set_defaults(func=cmd_visualize)
 
+    return parser
+
+
+def main(argv=None):
+    """Main CLI entry point.
+
+    Args:
+        argv: Argument list to parse (default: sys.argv[1:])
+    """
+    parser = build_parser()
+
     # Parse arguments and dispatch
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     if hasattr(args, "func"):
         args.func(args)
@@ -4,10 +4,12 @@ Generates type-safe Python dataclass code with encode/decode methods
 that match runtime encoder/decoder behavior exactly.
 """
 
-import ast
+import functools
+import string
 import subprocess
 import textwrap
-from typing import Any
+from types import CodeType
+from typing import Any, NamedTuple
 
 from .models import (
     BitSchema,
@@ -18,7 +20,125 @@ from .models import (
     BitmaskFieldDefinition,
     FieldDefinition,
 )
-from .layout import FieldLayout
+from .layout import DATE_STEP_SECONDS, FieldLayout
+
+
+# Generated source and compiled code keyed on schema/layout shape; see
+# _cached_dataclass_code() and _cached_module_code(). Oldest entries are
+# evicted past the max size.
+_CODE_CACHE: dict[tuple, tuple[str, CodeType]] = {}
+_CODE_CACHE_MAXSIZE = 512
+
+# Source templates, dedented and parsed once at import time
+_MODULE_TMPL = string.Template(textwrap.dedent('''\
+    """Generated BitSchema dataclass: $name
+
+    Auto-generated from schema. Do not edit manually.
+
+    Fields ($total_bits bits total):
+    $field_list
+    """
+
+    $imports
+
+
+    $class_body
+    '''))
+
+_MULTI_MODULE_TMPL = string.Template(textwrap.dedent('''\
+    """Generated BitSchema dataclasses: $names
+
+    Auto-generated from schema. Do not edit manually.
+    """
+
+    $imports
+
+
+    $class_bodies
+    '''))
+
+_CLASS_TMPL = string.Template(textwrap.dedent('''\
+    @dataclass($options)
+    class $name:
+        """BitSchema-encoded dataclass ($total_bits bits total$note)."""
+
+    $fields
+
+    $encode
+
+    $encode_many
+
+    $decode
+
+    $columnar'''))
+
+_INDENT = "    "
+_INDENT2 = _INDENT * 2
+
+
+class _FieldPlan(NamedTuple):
+    """Per-field codegen inputs, derived once and shared by encode/decode.
+
+    Attributes:
+        name: Field name
+        field_def: Field definition with type and constraints
+        offset: Bit offset of the field (presence bit if nullable)
+        bits: Total bits, including any presence bit
+        nullable: Whether the field has a presence bit at offset
+        shift: Bit offset of the value bits
+        value_bits: Number of value bits
+        mask: (1 << value_bits) - 1
+        index_name: Module-level value -> index dict (enum fields)
+        values_name: Module-level index -> value tuple (enum fields)
+        min_date_name: Module-level parsed min_date (date fields)
+    """
+
+    name: str
+    field_def: FieldDefinition
+    offset: int
+    bits: int
+    nullable: bool
+    shift: int
+    value_bits: int
+    mask: int
+    index_name: str
+    values_name: str
+    min_date_name: str
+
+
+def _build_field_plan(
+    schema: BitSchema,
+    layouts: list[FieldLayout],
+    shared_enums: dict[tuple[str, ...], tuple[str, str]] | None = None,
+) -> list[_FieldPlan]:
+    """Derive the shift/mask/constant plan for every field in layout order.
+
+    Enum fields whose values are already in shared_enums (see
+    generate_enum_constants()) use the registered constant names.
+    """
+    plan = []
+    for layout in layouts:
+        value_bits = layout.bits - 1 if layout.nullable else layout.bits
+        index_name, values_name = _enum_constant_names(schema.name, layout.name)
+        field_def = schema.fields[layout.name]
+        if shared_enums and isinstance(field_def, EnumFieldDefinition):
+            index_name, values_name = shared_enums.get(
+                tuple(field_def.values), (index_name, values_name)
+            )
+        plan.append(_FieldPlan(
+            name=layout.name,
+            field_def=field_def,
+            offset=layout.offset,
+            bits=layout.bits,
+            nullable=layout.nullable,
+            shift=layout.offset + 1 if layout.nullable else layout.offset,
+            value_bits=value_bits,
+            mask=(1 << value_bits) - 1,
+            index_name=index_name,
+            values_name=values_name,
+            min_date_name=_date_constant_name(schema.name, layout.name),
+        ))
+    return plan
 
 
 def generate_field_type_hint(field_name: str, field_def: FieldDefinition) -> str:
@@ -100,287 +220,627 @@ def generate_field_definitions(schema: BitSchema) -> str:
     return "\n".join(lines)
 
 
-def _generate_normalize_expression(field_name: str, field_def: FieldDefinition) -> str:
+def _enum_constant_names(class_name: str, field_name: str) -> tuple[str, str]:
+    """Return the module-level (index dict, values tuple) names for an enum field.
+
+    Names include the class so several generated classes can share a module.
+    """
+    return f"_ENUM_{class_name}_{field_name}", f"_VALUES_{class_name}_{field_name}"
+
+
+def _date_constant_name(class_name: str, field_name: str) -> str:
+    """Return the module-level parsed min_date name for a date field."""
+    return f"_MIN_DATE_{class_name}_{field_name}"
+
+
+def _generate_normalize_expression(
+    field_name: str,
+    field_def: FieldDefinition,
+    index_name: str,
+    value: str | None = None,
+    min_date_name: str | None = None,
+) -> str:
     """Generate normalization expression for a field value.
 
     Args:
         field_name: Name of the field
         field_def: Field definition with type and constraints
+        index_name: Module-level value -> index dict (enum fields only)
+        value: Expression holding the field value (default: self.{field_name})
+        min_date_name: Module-level parsed min_date (date fields only;
+            default: parse min_date inline)
 
     Returns:
         Python expression string that normalizes the field value
 
     Examples:
-        >>> _generate_normalize_expression("active", BoolFieldDefinition(type="bool"))
+        >>> _generate_normalize_expression("active", BoolFieldDefinition(type="bool"), "")
         '1 if self.active else 0'
     """
+    if value is None:
+        value = f"self.{field_name}"
+
     if isinstance(field_def, BoolFieldDefinition):
-        return f"1 if self.{field_name} else 0"
+        return f"1 if {value} else 0"
     elif isinstance(field_def, IntFieldDefinition):
         min_value = field_def.min if field_def.min is not None else 0
         if min_value != 0:
-            return f"self.{field_name} - {min_value}"
+            return f"{value} - {min_value}"
         else:
-            return f"self.{field_name}"
+            return value
     elif isinstance(field_def, EnumFieldDefinition):
-        values_repr = repr(field_def.values)
-        return f"{values_repr}.index(self.{field_name})"
+        return f"{index_name}[{value}]"
     elif isinstance(field_def, DateFieldDefinition):
-        # Date normalization is more complex - handled inline in encode method
-        return None  # Signal to use inline code block
+        min_date = min_date_name or f'datetime.datetime.fromisoformat("{field_def.min_date}")'
+        # Convert date to datetime for consistent handling
+        as_datetime = (
+            f"({value} if isinstance({value}, datetime.datetime) "
+            f"else datetime.datetime.combine({value}, datetime.time()))"
+        )
+        delta = f"({as_datetime} - {min_date})"
+        if field_def.resolution == "day":
+            return f"{delta}.days"
+        # Whole seconds since min_date, floored to units of resolution with
+        # integer math exactly as the runtime encoder does
+        step_seconds = DATE_STEP_SECONDS[field_def.resolution]
+        return f"((_delta := {delta}).days * 86400 + _delta.seconds) // {step_seconds}"
     elif isinstance(field_def, BitmaskFieldDefinition):
-        # Bitmask normalization is more complex - handled inline in encode method
-        return None  # Signal to use inline code block
+        flag_terms = " | ".join(
+            f"({1 << flag_position} if {value}.get({flag_name!r}, False) else 0)"
+            for flag_name, flag_position in field_def.flags.items()
+        )
+        return f"({flag_terms})"
     else:
         raise ValueError(f"Unknown field type: {type(field_def)}")
 
 
-def _generate_date_encoding_inline(lines: list[str], field_name: str, field_def: DateFieldDefinition, indent: str) -> None:
-    """Generate inline date encoding logic."""
-    min_date = field_def.min_date
-    resolution = field_def.resolution
+def _generate_encode_term(field: _FieldPlan, value: str | None = None) -> str | None:
+    """Generate the packed-bits term one field contributes to encode().
+
+    Args:
+        field: Field plan entry
+        value: Expression holding the field value (default: self.{name})
+
+    Returns:
+        Expression yielding the field's bits in place, or None for a
+        zero-width field that contributes nothing
+    """
+    if value is None:
+        value = f"self.{field.name}"
+
+    if field.value_bits > 0:
+        normalize_expr = _generate_normalize_expression(
+            field.name, field.field_def, field.index_name, value, field.min_date_name
+        )
+        if isinstance(field.field_def, BoolFieldDefinition):
+            # 0 or 1 already fits the single value bit
+            value_term = f"(({normalize_expr}) << {field.shift})"
+        else:
+            value_term = f"((({normalize_expr}) & {field.mask}) << {field.shift})"
+    else:
+        value_term = None
+
+    if field.nullable:
+        present = f"(1 << {field.offset})"
+        if value_term is not None:
+            present = f"{present} | {value_term}"
+        return f"(0 if {value} is None else {present})"
+    return value_term
+
 
-    lines.append(f'{indent}min_date = datetime.datetime.fromisoformat("{min_date}")')
-    lines.append(f'{indent}value = self.{field_name}')
-    lines.append(f'{indent}# Convert date to datetime for consistent handling')
-    lines.append(f'{indent}if isinstance(value, datetime.date) and not isinstance(value, datetime.datetime):')
-    lines.append(f'{indent}    value = datetime.datetime.combine(value, datetime.datetime.min.time())')
+def generate_enum_constants(
+    schema: BitSchema,
+    shared_enums: dict[tuple[str, ...], tuple[str, str]] | None = None,
+) -> str:
+    """Generate module-level enum lookup constants for generated code.
 
-    if resolution == "day":
-        lines.append(f'{indent}normalized = (value - min_date).days')
-    elif resolution == "hour":
-        lines.append(f'{indent}normalized = int((value - min_date).total_seconds() / 3600)')
-    elif resolution == "minute":
-        lines.append(f'{indent}normalized = int((value - min_date).total_seconds() / 60)')
-    elif resolution == "second":
-        lines.append(f'{indent}normalized = int((value - min_date).total_seconds())')
+    Args:
+        schema: BitSchema with field definitions
+        shared_enums: Registry of enum values -> (index dict, values tuple)
+            names already declared in the module. Enums found here are not
+            redeclared; new ones are added. Pass the same dict for every
+            class of a module (and to _build_field_plan()) so identical
+            vocabularies share one pair of constants. Default: no sharing.
+
+    Returns:
+        _ENUM_{class}_{field} (value -> index dict, used by encode) and
+        _VALUES_{class}_{field} (index -> value tuple, used by decode)
+        assignments per distinct enum, or an empty string if there is
+        nothing new to declare
 
+    Example:
+        >>> schema = BitSchema(
+        ...     version="1",
+        ...     name="Job",
+        ...     fields={"status": EnumFieldDefinition(type="enum", values=["idle", "done"])},
+        ... )
+        >>> print(generate_enum_constants(schema))
+        _ENUM_Job_status = {'idle': 0, 'done': 1}
+        _VALUES_Job_status = ('idle', 'done')
+    """
+    lines = []
+    for field_name, field_def in schema.fields.items():
+        if isinstance(field_def, EnumFieldDefinition):
+            index_name, values_name = _enum_constant_names(schema.name, field_name)
+            if shared_enums is not None:
+                key = tuple(field_def.values)
+                if key in shared_enums:
+                    continue
+                shared_enums[key] = (index_name, values_name)
+            index = {value: i for i, value in enumerate(field_def.values)}
+            lines.append(f"{index_name} = {index!r}")
+            lines.append(f"{values_name} = {tuple(field_def.values)!r}")
+    return "\n".join(lines)
+
+
+def generate_date_constants(schema: BitSchema) -> str:
+    """Generate module-level parsed min_date constants for generated code.
+
+    Args:
+        schema: BitSchema with field definitions
 
-def _generate_bitmask_encoding_inline(lines: list[str], field_name: str, field_def: BitmaskFieldDefinition, indent: str) -> None:
-    """Generate inline bitmask encoding logic."""
-    flags_repr = repr(field_def.flags)
+    Returns:
+        _MIN_DATE_{class}_{field} assignments, one per date field, so
+        encode() and decode() do not re-parse the ISO string on every call;
+        empty string if the schema has no date fields
 
-    lines.append(f'{indent}flags_def = {flags_repr}')
-    lines.append(f'{indent}normalized = 0')
-    lines.append(f'{indent}for flag_name, flag_position in flags_def.items():')
-    lines.append(f'{indent}    if self.{field_name}.get(flag_name, False):')
-    lines.append(f'{indent}        normalized |= (1 << flag_position)')
+    Example:
+        >>> print(generate_date_constants(schema))
+        _MIN_DATE_Event_at = datetime.datetime.fromisoformat('2024-01-01')
+    """
+    return "\n".join(
+        f"{_date_constant_name(schema.name, field_name)} = "
+        f"datetime.datetime.fromisoformat({field_def.min_date!r})"
+        for field_name, field_def in schema.fields.items()
+        if isinstance(field_def, DateFieldDefinition)
+    )
 
 
-def generate_encode_method(schema: BitSchema, layouts: list[FieldLayout]) -> str:
-    """Generate encode() method using LSB-first accumulator pattern.
+def generate_encode_method(
+    schema: BitSchema,
+    layouts: list[FieldLayout],
+    plan: list[_FieldPlan] | None = None,
+) -> str:
+    """Generate encode() method as a single fused shift-OR expression.
 
     Args:
         schema: BitSchema with field definitions
         layouts: Field layouts with bit offsets and constraints
+        plan: Field plan from _build_field_plan() (default: derived from
+            schema and layouts)
 
     Returns:
         Encode method source code
 
     Algorithm:
-        Mirrors encoder.py logic:
-        1. Initialize accumulator = 0
-        2. For each field:
-           - If nullable and None: skip (presence bit = 0)
-           - If nullable and value: set presence bit, pack value at offset+1
-           - If non-nullable: normalize and pack at offset
-        3. Return accumulator
+        Mirrors encoder.py logic with offsets and masks inlined as literals.
+        Every field contributes one term to the return expression:
+        - non-nullable: (normalized & mask) << offset
+        - nullable: 0 if None, else presence bit | value at offset+1
+        The terms are OR'ed together (no accumulator round trips).
+
+    Note:
+        Enum fields look up their index in the module-level _ENUM_{class}_{field}
+        dict emitted by generate_enum_constants().
     """
+    if plan is None:
+        plan = _build_field_plan(schema, layouts)
+
     lines = []
     lines.append("def encode(self) -> int:")
-    lines.append('    """Encode this instance to 64-bit integer."""')
-    lines.append("    accumulator = 0")
-    lines.append("")
-
-    for layout in layouts:
-        field_name = layout.name
-        field_def = schema.fields[field_name]
-
-        # Add comment with bit position
-        lines.append(f"    # {field_name}: offset={layout.offset}, bits={layout.bits}")
-
-        if layout.nullable:
-            # Nullable field: handle None case
-            lines.append(f"    if self.{field_name} is not None:")
-            lines.append(f"        # Presence bit at offset {layout.offset}")
-            lines.append(f"        accumulator |= 1 << {layout.offset}")
-
-            # Generate normalization logic for value
-            normalize_expr = _generate_normalize_expression(field_name, field_def)
-
-            # Pack value at offset+1
-            value_bits = layout.bits - 1
-            if value_bits > 0:
-                mask = (1 << value_bits) - 1
-                lines.append(f"        # Value bits at offset {layout.offset + 1}")
-
-                if normalize_expr is None:
-                    # Complex normalization - handle inline
-                    if isinstance(field_def, DateFieldDefinition):
-                        _generate_date_encoding_inline(lines, field_name, field_def, "        ")
-                        lines.append(f"        accumulator |= (normalized & {mask}) << {layout.offset + 1}")
-                    elif isinstance(field_def, BitmaskFieldDefinition):
-                        _generate_bitmask_encoding_inline(lines, field_name, field_def, "        ")
-                        lines.append(f"        accumulator |= (normalized & {mask}) << {layout.offset + 1}")
-                else:
-                    lines.append(f"        normalized = {normalize_expr}")
-                    lines.append(f"        accumulator |= (normalized & {mask}) << {layout.offset + 1}")
-            lines.append("")
-        else:
-            # Non-nullable field: normalize and pack directly
-            normalize_expr = _generate_normalize_expression(field_name, field_def)
-
-            if normalize_expr is None:
-                # Complex normalization - handle inline
-                if isinstance(field_def, DateFieldDefinition):
-                    _generate_date_encoding_inline(lines, field_name, field_def, "    ")
-                elif isinstance(field_def, BitmaskFieldDefinition):
-                    _generate_bitmask_encoding_inline(lines, field_name, field_def, "    ")
-            else:
-                lines.append(f"    normalized = {normalize_expr}")
-
-            # Create mask and pack
-            if layout.bits > 0:
-                mask = (1 << layout.bits) - 1
-                lines.append(f"    accumulator |= (normalized & {mask}) << {layout.offset}")
-            lines.append("")
-
-    lines.append("    return accumulator")
+    lines.append(f'{_INDENT}"""Encode this instance to 64-bit integer."""')
+    lines.extend(_generate_packed_expression(plan, f"{_INDENT}return "))
 
     return "\n".join(lines)
 
 
-def _generate_denormalize_statements(
-    field_name: str, field_def: FieldDefinition, indent: str = "    "
+def _generate_packed_expression(
+    plan: list[_FieldPlan], prefix: str, values: dict[str, str] | None = None
 ) -> list[str]:
-    """Generate denormalization statements for a field value.
+    """Generate the OR of every field's encode term as source lines.
+
+    Args:
+        plan: Field plan entries in layout order
+        prefix: Text before the expression (e.g. "    return ")
+        values: Field name -> value expression (default: self.{name})
+
+    Returns:
+        Source lines, one term per line with its offset/bits comment
+    """
+    terms = []
+    for field in plan:
+        value = values[field.name] if values is not None else None
+        term = _generate_encode_term(field, value)
+        if term is not None:
+            terms.append(f"{term}  # {field.name}: offset={field.offset}, bits={field.bits}")
+
+    if not terms:
+        return [f"{prefix}0"]
+
+    indent = " " * (len(prefix) - len(prefix.lstrip()))
+    lines = [f"{prefix}("]
+    for i, term in enumerate(terms):
+        lines.append(f"{indent}{_INDENT}{term}" if i == 0 else f"{indent}{_INDENT}| {term}")
+    lines.append(f"{indent})")
+    return lines
+
+
+def _generate_denormalize_expression(
+    field_def: FieldDefinition,
+    value_offset: int,
+    value_bits: int,
+    values_name: str,
+    source: str | None = None,
+    min_date_name: str | None = None,
+) -> str:
+    """Generate an expression that extracts and denormalizes a field value.
 
     Args:
-        field_name: Name of the field
         field_def: Field definition with type and constraints
-        indent: Indentation prefix for generated statements
+        value_offset: Bit offset of the value (after any presence bit)
+        value_bits: Number of value bits
+        values_name: Module-level values tuple to index (enum fields only)
+        source: Name already holding the extracted value bits (default:
+            extract them from 'encoded' with a shift and mask)
+        min_date_name: Module-level parsed min_date (date fields only;
+            default: parse min_date inline)
 
     Returns:
-        List of Python statement strings that denormalize the extracted value
+        Python expression string reading the value from 'encoded'
 
-    Note:
-        Assumes 'extracted' variable contains the raw bit value.
+    Examples:
+        >>> _generate_denormalize_expression(BoolFieldDefinition(type="bool"), 3, 1, "")
+        'bool((encoded >> 3) & 1)'
     """
+    mask = (1 << value_bits) - 1
+    if source is None:
+        shifted = f"(encoded >> {value_offset}) & {mask}"
+        raw = f"({shifted})"
+    else:
+        shifted = raw = source
+
     if isinstance(field_def, BoolFieldDefinition):
-        return [f"{indent}{field_name}_value = bool(extracted)"]
+        return f"bool{raw}" if value_bits > 0 else "True"
     elif isinstance(field_def, IntFieldDefinition):
         min_value = field_def.min if field_def.min is not None else 0
+        if value_bits == 0:
+            return repr(min_value)
         if min_value != 0:
-            return [f"{indent}{field_name}_value = extracted + {min_value}"]
-        else:
-            return [f"{indent}{field_name}_value = extracted"]
+            return f"{raw} + {min_value}"
+        return raw
     elif isinstance(field_def, EnumFieldDefinition):
-        values_repr = repr(field_def.values)
-        return [f"{indent}{field_name}_value = {values_repr}[extracted]"]
+        if value_bits == 0:
+            return repr(field_def.values[0])
+        return f"{values_name}[{shifted}]"
     elif isinstance(field_def, DateFieldDefinition):
-        min_date = field_def.min_date
-        resolution = field_def.resolution
-        statements = [
-            f'{indent}min_date = datetime.datetime.fromisoformat("{min_date}")',
+        min_date = min_date_name or f'datetime.datetime.fromisoformat("{field_def.min_date}")'
+        unit = {"day": "days", "hour": "hours", "minute": "minutes", "second": "seconds"}[
+            field_def.resolution
         ]
-        if resolution == "day":
-            statements.append(f'{indent}{field_name}_value = (min_date + datetime.timedelta(days=extracted)).date()')
-        elif resolution == "hour":
-            statements.append(f'{indent}{field_name}_value = min_date + datetime.timedelta(hours=extracted)')
-        elif resolution == "minute":
-            statements.append(f'{indent}{field_name}_value = min_date + datetime.timedelta(minutes=extracted)')
-        elif resolution == "second":
-            statements.append(f'{indent}{field_name}_value = min_date + datetime.timedelta(seconds=extracted)')
-        return statements
+        expr = f"{min_date} + datetime.timedelta({unit}={raw})"
+        if field_def.resolution == "day":
+            return f"({expr}).date()"
+        return expr
     elif isinstance(field_def, BitmaskFieldDefinition):
-        flags_repr = repr(field_def.flags)
-        return [
-            f'{indent}flags_def = {flags_repr}',
-            f'{indent}{field_name}_value = {{}}',
-            f'{indent}for flag_name, flag_position in flags_def.items():',
-            f'{indent}    {field_name}_value[flag_name] = bool(extracted & (1 << flag_position))',
-        ]
+        if source is None:
+            flag_bits = {
+                flag_name: f"(encoded >> {value_offset + position}) & 1"
+                for flag_name, position in field_def.flags.items()
+            }
+        else:
+            flag_bits = {
+                flag_name: f"({source} >> {position}) & 1"
+                for flag_name, position in field_def.flags.items()
+            }
+        items = ", ".join(
+            f"{flag_name!r}: bool({bits})" for flag_name, bits in flag_bits.items()
+        )
+        return f"{{{items}}}"
     else:
         raise ValueError(f"Unknown field type: {type(field_def)}")
 
 
-def generate_decode_method(schema: BitSchema, layouts: list[FieldLayout]) -> str:
-    """Generate decode() classmethod using bit extraction pattern.
+def generate_decode_method(
+    schema: BitSchema,
+    layouts: list[FieldLayout],
+    plan: list[_FieldPlan] | None = None,
+) -> str:
+    """Generate decode() classmethod as a single straight-line constructor call.
 
     Args:
         schema: BitSchema with field definitions
         layouts: Field layouts with bit offsets and constraints
+        plan: Field plan from _build_field_plan() (default: derived from
+            schema and layouts)
 
     Returns:
         Decode method source code
 
     Algorithm:
-        Mirrors decoder.py logic:
-        1. Extract bits at each offset
-        2. Denormalize to semantic values
-        3. Handle nullable presence bits
-        4. Return cls(...) with all fields
+        Mirrors decoder.py logic with shifts and masks inlined as literals:
+        each keyword argument of the returned cls(...) call extracts its
+        bits, denormalizes them, and for nullable fields yields None when
+        the presence bit is clear. No temporaries are assigned.
+
+        Byte-aligned layouts (see _struct_format()) instead unpack every
+        field with one call to the module-level _STRUCT_{class} emitted by
+        generate_struct_constant(), then denormalize the unpacked values.
+
+    Note:
+        Enum fields index the module-level _VALUES_{class}_{field} tuple emitted by
+        generate_enum_constants().
     """
     lines = []
     lines.append("@classmethod")
     lines.append("def decode(cls, encoded: int) -> 'ActiveFlag':")
-    lines.append('    """Decode 64-bit integer to instance."""')
+    lines.append(f'{_INDENT}"""Decode 64-bit integer to instance."""')
+
+    if plan is None:
+        plan = _build_field_plan(schema, layouts)
+
+    sources = {}
+    if _struct_format(plan) is not None:
+        sources = {field.name: f"v_{field.name}" for field in plan}
+        targets = ", ".join(sources.values())
+        if len(sources) == 1:
+            targets += ","
+        lines.append(
+            f"{_INDENT}{targets} = {_struct_constant_name(schema.name)}"
+            '.unpack(encoded.to_bytes(8, "little"))'
+        )
+
+    lines.append(f"{_INDENT}return cls(")
+    for field in plan:
+        expr = _generate_decode_expression(field, sources.get(field.name))
+        lines.append(
+            f"{_INDENT2}{field.name}={expr},  # offset={field.offset}, bits={field.bits}"
+        )
 
-    field_assignments = []
+    lines.append(f"{_INDENT})")
 
-    for layout in layouts:
-        field_name = layout.name
-        field_def = schema.fields[field_name]
-
-        lines.append(f"    # {field_name}: offset={layout.offset}, bits={layout.bits}")
-
-        if layout.nullable:
-            # Nullable field: check presence bit
-            lines.append(f"    presence = (encoded >> {layout.offset}) & 1")
-            lines.append(f"    if presence == 0:")
-            lines.append(f"        {field_name}_value = None")
-            lines.append(f"    else:")
-
-            # Extract value at offset+1
-            value_offset = layout.offset + 1
-            value_bits = layout.bits - 1
-            if value_bits > 0:
-                mask = (1 << value_bits) - 1
-                lines.append(f"        extracted = (encoded >> {value_offset}) & {mask}")
-                # Denormalize
-                lines.extend(_generate_denormalize_statements(field_name, field_def, "        "))
-            else:
-                lines.append(f"        {field_name}_value = True")  # Boolean with 0 value bits
+    return "\n".join(lines)
 
-            field_assignments.append(f"{field_name}={field_name}_value")
-        else:
-            # Non-nullable field: extract directly
-            if layout.bits > 0:
-                mask = (1 << layout.bits) - 1
-                lines.append(f"    extracted = (encoded >> {layout.offset}) & {mask}")
-                # Denormalize
-                lines.extend(_generate_denormalize_statements(field_name, field_def, "    "))
-            else:
-                # Zero bits means constant value
-                if isinstance(field_def, EnumFieldDefinition):
-                    lines.append(f"    {field_name}_value = {repr(field_def.values[0])}")
 
-            field_assignments.append(f"{field_name}={field_name}_value")
+def _generate_decode_expression(field: _FieldPlan, source: str | None = None) -> str:
+    """Generate the expression decoding one field from 'encoded'.
+
+    Nullable fields yield None when their presence bit is clear; the
+    presence and value bits are adjacent, so one shift and mask into _raw
+    reads both (bit 0 is presence, _raw >> 1 the value). If source is given,
+    it names a variable already holding the field's value bits.
+    """
+    if field.nullable and source is None:
+        source = "(_raw >> 1)"
+    expr = _generate_denormalize_expression(
+        field.field_def, field.shift, field.value_bits, field.values_name, source,
+        field.min_date_name,
+    )
+    if field.nullable:
+        field_mask = (1 << (field.value_bits + 1)) - 1
+        expr = (
+            f"None if not ((_raw := (encoded >> {field.offset}) & {field_mask}) & 1) "
+            f"else {expr}"
+        )
+    return expr
+
+
+# struct codes for unsigned little-endian fields, keyed on bit width
+_STRUCT_CODES = {8: "B", 16: "H", 32: "I", 64: "Q"}
+
+
+def _struct_format(plan: list[_FieldPlan]) -> str | None:
+    """Return a struct format unpacking every field of a byte-aligned layout.
+
+    A layout qualifies when every field is non-nullable, starts on a byte
+    boundary and is exactly 8, 16, 32 or 64 bits wide. Unused bytes become
+    pad bytes so the format always spans the 8 bytes of a 64-bit value.
+
+    Returns:
+        Format string such as "<BHxxxxx", or None if the layout is not
+        byte-aligned
+    """
+    if not plan:
+        return None
+
+    codes = []
+    position = 0
+    for field in plan:
+        if field.nullable or field.offset % 8 or field.bits not in _STRUCT_CODES:
+            return None
+        # Unpacked values come back in offset order, which must match the plan
+        if field.offset < position:
+            return None
+        codes.append("x" * ((field.offset - position) // 8))
+        codes.append(_STRUCT_CODES[field.bits])
+        position = field.offset + field.bits
+    if position > 64:
+        return None
+    codes.append("x" * ((64 - position) // 8))
+
+    return "<" + "".join(codes)
+
+
+def _struct_constant_name(class_name: str) -> str:
+    """Return the module-level struct.Struct name used by a class's decode()."""
+    return f"_STRUCT_{class_name}"
+
+
+def generate_struct_constant(
+    schema: BitSchema,
+    layouts: list[FieldLayout],
+    plan: list[_FieldPlan] | None = None,
+) -> str:
+    """Generate the module-level struct.Struct used by a byte-aligned decode().
+
+    Args:
+        schema: BitSchema with field definitions
+        layouts: Field layouts with bit offsets and constraints
+        plan: Field plan from _build_field_plan() (default: derived from
+            schema and layouts)
+
+    Returns:
+        A _STRUCT_{class} = struct.Struct(...) assignment, or an empty
+        string if the layout is not byte-aligned
+
+    Example:
+        >>> print(generate_struct_constant(schema, layouts))  # 8-bit + 16-bit ints
+        _STRUCT_Pixel = struct.Struct('<BHxxxxx')
+    """
+    if plan is None:
+        plan = _build_field_plan(schema, layouts)
+    fmt = _struct_format(plan)
+    if fmt is None:
+        return ""
+    return f"{_struct_constant_name(schema.name)} = struct.Struct({fmt!r})"
+
+
+def generate_columnar_methods(
+    schema: BitSchema,
+    layouts: list[FieldLayout],
+    plan: list[_FieldPlan] | None = None,
+) -> str:
+    """Generate encode_columns()/decode_columns() batch classmethods.
+
+    Args:
+        schema: BitSchema with field definitions
+        layouts: Field layouts with bit offsets and constraints
+        plan: Field plan from _build_field_plan() (default: derived from
+            schema and layouts)
+
+    Returns:
+        Source code for both classmethods
+
+    Algorithm:
+        Works on columns (field name -> list of values) rather than on
+        instances. encode_columns() is one list comprehension over the
+        zipped columns using the same fused shift-OR expression as encode();
+        decode_columns() runs one comprehension per field over the whole
+        batch. Neither builds an instance per record.
+
+    Note:
+        decode_columns() iterates encoded_values once per field, so it must
+        be a sequence rather than a one-shot iterator.
+    """
+    if plan is None:
+        plan = _build_field_plan(schema, layouts)
+
+    names = [field.name for field in plan]
+    loop_vars = {name: f"v_{name}" for name in names}
+
+    lines = []
+    lines.append("@classmethod")
+    lines.append("def encode_columns(cls, columns: dict[str, list]) -> list[int]:")
+    lines.append(f'{_INDENT}"""Encode equal-length columns (field name -> values) to integers."""')
+    if names:
+        targets = ", ".join(loop_vars[name] for name in names)
+        sources = ", ".join(f"columns[{name!r}]" for name in names)
+        lines.append(f"{_INDENT}return [")
+        lines.extend(_generate_packed_expression(plan, _INDENT2, loop_vars))
+        if len(names) == 1:
+            targets += ","
+        lines.append(f"{_INDENT2}for {targets} in zip({sources}, strict=True)")
+        lines.append(f"{_INDENT}]")
+    else:
+        lines.append(f"{_INDENT}return []")
+
+    lines.append("")
+    lines.append("@classmethod")
+    lines.append("def decode_columns(cls, encoded_values: list[int]) -> dict[str, list]:")
+    lines.append(f'{_INDENT}"""Decode a sequence of integers to columns (field name -> values)."""')
+    lines.append(f"{_INDENT}return {{")
+    for field in plan:
+        expr = _generate_decode_expression(field)
+        lines.append(
+            f"{_INDENT2}{field.name!r}: [{expr} for encoded in encoded_values],"
+            f"  # offset={field.offset}, bits={field.bits}"
+        )
+    lines.append(f"{_INDENT}}}")
+
+    return "\n".join(lines)
+
+
+def _getter_constant_name(class_name: str) -> str:
+    """Return the module-level attrgetter name used by a class's encode_many()."""
+    return f"_GET_{class_name}"
+
+
+def generate_getter_constant(schema: BitSchema) -> str:
+    """Generate the module-level attrgetter constant for encode_many().
+
+    Args:
+        schema: BitSchema with field definitions
+
+    Returns:
+        A _GET_{class} = operator.attrgetter(...) assignment over every field,
+        or an empty string if the schema has no fields
+
+    Example:
+        >>> print(generate_getter_constant(schema))  # fields active, age
+        _GET_Person = operator.attrgetter('active', 'age')
+    """
+    if not schema.fields:
+        return ""
+    names = ", ".join(repr(name) for name in schema.fields)
+    return f"{_getter_constant_name(schema.name)} = operator.attrgetter({names})"
+
+
+def generate_encode_many_method(
+    schema: BitSchema,
+    layouts: list[FieldLayout],
+    plan: list[_FieldPlan] | None = None,
+) -> str:
+    """Generate encode_many() classmethod for sequences of instances.
+
+    Args:
+        schema: BitSchema with field definitions
+        layouts: Field layouts with bit offsets and constraints
+        plan: Field plan from _build_field_plan() (default: derived from
+            schema and layouts)
+
+    Returns:
+        encode_many() classmethod source code
 
-        lines.append("")
+    Algorithm:
+        map() applies the module-level _GET_{class} attrgetter to every
+        instance, fetching all field values in one C-level call per
+        instance; the unpacked values feed the same fused shift-OR
+        expression as encode(), inside one list comprehension.
+    """
+    if plan is None:
+        plan = _build_field_plan(schema, layouts)
 
-    # Return statement
-    lines.append(f"    return cls({', '.join(field_assignments)})")
+    # attrgetter is emitted in schema field order; unpack in that order
+    loop_vars = {name: f"v_{name}" for name in schema.fields}
+
+    lines = []
+    lines.append("@classmethod")
+    lines.append("def encode_many(cls, instances) -> list[int]:")
+    lines.append(f'{_INDENT}"""Encode an iterable of instances to 64-bit integers."""')
+    if loop_vars:
+        # A single-name attrgetter returns the bare value, which the
+        # single loop target then binds directly
+        targets = ", ".join(loop_vars.values())
+        getter = _getter_constant_name(schema.name)
+        lines.append(f"{_INDENT}return [")
+        lines.extend(_generate_packed_expression(plan, _INDENT2, loop_vars))
+        lines.append(f"{_INDENT2}for {targets} in map({getter}, instances)")
+        lines.append(f"{_INDENT}]")
+    else:
+        lines.append(f"{_INDENT}return [0 for _ in instances]")
 
     return "\n".join(lines)
 
 
-def generate_dataclass_code(schema: BitSchema, layouts: list[FieldLayout]) -> str:
+def generate_dataclass_code(
+    schema: BitSchema, layouts: list[FieldLayout], lean: bool = False
+) -> str:
     """Generate complete dataclass code from schema and layouts.
 
     Args:
         schema: BitSchema with field definitions
         layouts: Field layouts with bit offsets
+        lean: Omit __eq__, __repr__ and __match_args__ for classes only
+            used to encode/decode (default: False)
 
     Returns:
         Complete Python source code for dataclass
@@ -388,15 +848,265 @@ def generate_dataclass_code(schema: BitSchema, layouts: list[FieldLayout]) -> st
     Structure:
         - Module docstring
         - Imports
-        - @dataclass decorator
+        - @dataclass(slots=True) decorator (with eq=False, repr=False,
+          match_args=False when lean=True)
         - Class with fields
         - encode() method
+        - encode_many() classmethod
         - decode() classmethod
+        - encode_columns()/decode_columns() batch classmethods
+
+    Note:
+        Output is cached per schema/layout shape, so repeat calls for an
+        identical schema skip generation, formatting and validation.
+    """
+    return _cached_dataclass_code(schema, layouts, lean)[0]
+
+
+def exec_generated(
+    schema: BitSchema,
+    layouts: list[FieldLayout],
+    namespace: dict[str, Any] | None = None,
+    lean: bool = False,
+) -> dict[str, Any]:
+    """Execute generated dataclass code for a schema into a namespace.
+
+    Runs the cached compiled code object, so repeat calls never re-parse
+    or re-compile the generated source.
+
+    Args:
+        schema: BitSchema with field definitions
+        layouts: Field layouts with bit offsets
+        namespace: Namespace to execute into (default: new dict)
+        lean: Omit __eq__, __repr__ and __match_args__ (default: False)
+
+    Returns:
+        The namespace, holding the generated class under schema.name
+
+    Example:
+        >>> Person = exec_generated(schema, layouts)["Person"]
+        >>> Person(active=True, age=42).encode()
+        85
+    """
+    if namespace is None:
+        namespace = {}
+    exec(_cached_dataclass_code(schema, layouts, lean)[1], namespace)
+    return namespace
+
+
+def _cached_dataclass_code(
+    schema: BitSchema, layouts: list[FieldLayout], lean: bool = False
+) -> tuple[str, CodeType]:
+    """Return (source, code object) for a schema, generating on first use."""
+    key = (schema.model_dump_json(), repr(layouts), lean)
+    entry = _CODE_CACHE.get(key)
+    if entry is None:
+        code = _build_dataclass_code(schema, layouts, lean)
+        entry = (code, _compile_generated(code))
+        if len(_CODE_CACHE) >= _CODE_CACHE_MAXSIZE:
+            del _CODE_CACHE[next(iter(_CODE_CACHE))]
+        _CODE_CACHE[key] = entry
+    return entry
+
+
+def _build_dataclass_code(
+    schema: BitSchema, layouts: list[FieldLayout], lean: bool = False
+) -> str:
+    """Build, format and validate dataclass source (uncached)."""
+    class_body, constants, modules = _generate_class_parts(
+        schema, layouts, lean=lean
+    )
+
+    code = _MODULE_TMPL.substitute(
+        name=schema.name,
+        total_bits=sum(layout.bits for layout in layouts),
+        field_list="\n".join(_generate_field_summary(schema, layouts)),
+        imports=_generate_imports(constants, modules),
+        class_body=class_body,
+    )
+
+    # Format code
+    code = format_generated_code(code)
+
+    # Validate before returning
+    validate_generated_code(code)
+
+    return code
+
+
+def generate_module_code(
+    items: list[tuple[BitSchema, list[FieldLayout]]], lean: bool = False
+) -> str:
+    """Generate one module holding a dataclass for each schema.
+
+    Args:
+        items: (schema, layouts) pairs; schema names must be unique
+        lean: Omit __eq__, __repr__ and __match_args__ (default: False)
+
+    Returns:
+        Python source with a single import header, the enum lookup
+        constants of every schema, and one dataclass per schema
+
+    Raises:
+        ValueError: If two schemas share a class name
+    """
+    return _cached_module_code(items, lean)[0]
+
+
+def compile_module(
+    items: list[tuple[BitSchema, list[FieldLayout]]], lean: bool = False
+) -> dict[str, type]:
+    """Compile and execute generated classes for many schemas in one pass.
+
+    The module from generate_module_code() is compiled once (and cached)
+    and executed with a single exec into a fresh namespace.
+
+    Args:
+        items: (schema, layouts) pairs; schema names must be unique
+        lean: Omit __eq__, __repr__ and __match_args__ (default: False)
+
+    Returns:
+        Dict mapping each schema name to its generated class
+
+    Example:
+        >>> classes = compile_module([(person, person_layouts), (job, job_layouts)])
+        >>> classes["Person"](active=True, age=42).encode()
+        85
+    """
+    namespace: dict[str, Any] = {}
+    exec(_cached_module_code(items, lean)[1], namespace)
+    return {schema.name: namespace[schema.name] for schema, _ in items}
+
+
+def _cached_module_code(
+    items: list[tuple[BitSchema, list[FieldLayout]]], lean: bool = False
+) -> tuple[str, CodeType]:
+    """Return (source, code object) for a multi-schema module, cached."""
+    key = (
+        tuple((schema.model_dump_json(), repr(layouts)) for schema, layouts in items),
+        lean,
+    )
+    entry = _CODE_CACHE.get(key)
+    if entry is None:
+        code = _build_module_code(items, lean)
+        entry = (code, _compile_generated(code))
+        if len(_CODE_CACHE) >= _CODE_CACHE_MAXSIZE:
+            del _CODE_CACHE[next(iter(_CODE_CACHE))]
+        _CODE_CACHE[key] = entry
+    return entry
+
+
+def _build_module_code(
+    items: list[tuple[BitSchema, list[FieldLayout]]], lean: bool = False
+) -> str:
+    """Build, format and validate multi-schema module source (uncached)."""
+    names = [schema.name for schema, _ in items]
+    duplicates = sorted({name for name in names if names.count(name) > 1})
+    if duplicates:
+        raise ValueError(f"Duplicate schema names: {', '.join(duplicates)}")
+
+    class_bodies = []
+    all_constants = []
+    modules: set[str] = set()
+    # Identical enum vocabularies share one pair of module-level constants
+    shared_enums: dict[tuple[str, ...], tuple[str, str]] = {}
+    for schema, layouts in items:
+        class_body, constants, class_modules = _generate_class_parts(
+            schema, layouts, shared_enums, lean
+        )
+        class_bodies.append(class_body)
+        if constants:
+            all_constants.append(constants)
+        modules |= class_modules
+
+    code = _MULTI_MODULE_TMPL.substitute(
+        names=", ".join(names),
+        imports=_generate_imports("\n".join(all_constants), modules),
+        class_bodies="\n\n\n".join(class_bodies),
+    )
+
+    code = format_generated_code(code)
+    validate_generated_code(code)
+    return code
+
+
+def _generate_class_parts(
+    schema: BitSchema,
+    layouts: list[FieldLayout],
+    shared_enums: dict[tuple[str, ...], tuple[str, str]] | None = None,
+    lean: bool = False,
+) -> tuple[str, str, set[str]]:
+    """Generate a class body plus what its module must provide.
+
+    Args:
+        schema: BitSchema with field definitions
+        layouts: Field layouts with bit offsets
+        shared_enums: Module-wide enum constant registry (see
+            generate_enum_constants())
+        lean: Omit __eq__, __repr__ and __match_args__
+
+    Returns:
+        (class source, module-level constants source, modules to import)
     """
-    # Calculate total bits
-    total_bits = sum(layout.bits for layout in layouts)
+    if shared_enums is None:
+        shared_enums = {}
+    # Register enum constants first so the plan can refer to shared names
+    constants = generate_enum_constants(schema, shared_enums)
+
+    # One plan feeds both encode() and decode()
+    plan = _build_field_plan(schema, layouts, shared_enums)
+
+    # Fix the class name in the decode() return type hint
+    decode_method = generate_decode_method(schema, layouts, plan)
+    decode_method = decode_method.replace("'ActiveFlag'", f"'{schema.name}'")
+
+    class_body = _CLASS_TMPL.substitute(
+        options=(
+            "slots=True, eq=False, repr=False, match_args=False" if lean else "slots=True"
+        ),
+        note="; no __eq__/__repr__/__match_args__" if lean else "",
+        name=schema.name,
+        total_bits=sum(layout.bits for layout in layouts),
+        fields=textwrap.indent(generate_field_definitions(schema), _INDENT),
+        encode=textwrap.indent(generate_encode_method(schema, layouts, plan), _INDENT),
+        encode_many=textwrap.indent(
+            generate_encode_many_method(schema, layouts, plan), _INDENT
+        ),
+        decode=textwrap.indent(decode_method, _INDENT),
+        columnar=textwrap.indent(generate_columnar_methods(schema, layouts, plan), _INDENT),
+    )
+
+    # Modules the generated code refers to
+    modules = {"operator"}
+    if any(isinstance(schema.fields[layout.name], DateFieldDefinition) for layout in layouts):
+        modules.add("datetime")
+
+    struct_constant = generate_struct_constant(schema, layouts, plan)
+    if struct_constant:
+        modules.add("struct")
+
+    dates = generate_date_constants(schema)
+    getter = generate_getter_constant(schema)
+    constants = "\n".join(
+        part for part in (constants, dates, getter, struct_constant) if part
+    )
+
+    return class_body, constants, modules
+
+
+def _generate_imports(constants: str, modules: set[str]) -> str:
+    """Generate the import header, followed by module-level constants."""
+    lines = ["from dataclasses import dataclass"]
+    lines.extend(f"import {module}" for module in sorted(modules))
+
+    # Module-level lookup constants used by encode() and decode()
+    if constants:
+        lines.extend(["", constants])
+    return "\n".join(lines)
+
 
-    # Build field list for docstring
+def _generate_field_summary(schema: BitSchema, layouts: list[FieldLayout]) -> list[str]:
+    """Generate the per-field lines of the module docstring."""
     field_list = []
     for layout in layouts:
         field_def = schema.fields[layout.name]
@@ -411,66 +1121,151 @@ def generate_dataclass_code(schema: BitSchema, layouts: list[FieldLayout]) -> st
             constraints_str = f" ({field_def.min_date}..{field_def.max_date}, {field_def.resolution})"
         elif isinstance(field_def, BitmaskFieldDefinition):
             flag_names = ', '.join(list(field_def.flags.keys())[:3])
-            if len(field_def.flags) > 3:
-                flag_names += '...'
-            constraints_str = f" (flags: {flag_names})"
-        field_list.append(f"    {layout.name}: {type_hint}{constraints_str}")
-
-    field_list_str = "\n".join(field_list)
-
-    # Module docstring
-    module_doc = f'''"""Generated BitSchema dataclass: {schema.name}
-
-Auto-generated from schema. Do not edit manually.
-
-Fields ({total_bits} bits total):
-{field_list_str}
-"""'''
-
-    # Imports
-    imports = "from dataclasses import dataclass"
-
-    # Check if we need datetime imports
-    has_date_field = any(isinstance(schema.fields[layout.name], DateFieldDefinition) for layout in layouts)
-    if has_date_field:
-        imports += "\nimport datetime"
-
-    # Class definition
-    class_lines = []
-    class_lines.append("@dataclass")
-    class_lines.append(f"class {schema.name}:")
-    class_lines.append(f'    """BitSchema-encoded dataclass ({total_bits} bits total)."""')
-    class_lines.append("")
-
-    # Add fields
-    field_defs = generate_field_definitions(schema)
-    for line in field_defs.split("\n"):
-        class_lines.append(f"    {line}")
-    class_lines.append("")
-
-    # Add encode method
-    encode_method = generate_encode_method(schema, layouts)
-    for line in encode_method.split("\n"):
-        class_lines.append(f"    {line}")
-    class_lines.append("")
-
-    # Add decode method
-    decode_method = generate_decode_method(schema, layouts)
-    # Fix the class name in return type hint
-    decode_method = decode_method.replace("'ActiveFlag'", f"'{schema.name}'")
-    for line in decode_method.split("\n"):
-        class_lines.append(f"    {line}")
+            ellipsis = '...' if len(field_def.flags) > 3 else ''
+            constraints_str = f" (flags: {flag_names}{ellipsis})"
+        field_list.append(f"{_INDENT}{layout.name}: {type_hint}{constraints_str}")
+    return field_list
 
-    # Combine all parts
-    code = f"{module_doc}\n\n{imports}\n\n\n" + "\n".join(class_lines) + "\n"
 
-    # Format code
-    code = format_generated_code(code)
+# C99/C11 keywords, plus the identifiers the generated kernels declare
+# themselves; field names become C parameter names, so none of these can be
+# used as one
+_C_RESERVED_NAMES = frozenset({
+    "auto", "break", "case", "char", "const", "continue", "default", "do",
+    "double", "else", "enum", "extern", "float", "for", "goto", "if",
+    "inline", "int", "long", "register", "restrict", "return", "short",
+    "signed", "sizeof", "static", "struct", "switch", "typedef", "union",
+    "unsigned", "void", "volatile", "while", "_Alignas", "_Alignof",
+    "_Atomic", "_Bool", "_Complex", "_Generic", "_Imaginary", "_Noreturn",
+    "_Static_assert", "_Thread_local", "encoded", "int64_t", "uint64_t",
+})
 
-    # Validate before returning
-    validate_generated_code(code)
 
-    return code
+def generate_c_source(schema: BitSchema, layouts: list[FieldLayout]) -> str:
+    """Generate C encode/decode kernels for a schema.
+
+    Emits a self-contained C99 translation unit with two functions that
+    inline the same offsets and masks as the generated Python class:
+
+        uint64_t encode_{name}(<one parameter per field>);
+        void decode_{name}(uint64_t encoded, <one out-pointer per field>);
+
+    Args:
+        schema: BitSchema with field definitions
+        layouts: Field layouts with bit offsets and constraints
+
+    Returns:
+        C source code (not compiled; build it with any C compiler and load
+        it with ctypes or cffi)
+
+    Raises:
+        ValueError: If the schema has date or bitmask fields, which have no
+            plain C value representation, or a field named after a C keyword
+            (or after one of the kernels' own identifiers, such as encoded)
+
+    Parameter mapping:
+        - bool: int (0 or 1)
+        - int: int64_t (semantic value; min is subtracted/added in C)
+        - enum: int (index into the schema's values list)
+        - nullable fields add a leading int {field}_present parameter;
+          decode writes 0 to the value when the field is absent, selecting
+          it without a branch (value * presence bit)
+    """
+    plan = _build_field_plan(schema, layouts)
+
+    c_types = {}
+    for field in plan:
+        if field.name in _C_RESERVED_NAMES:
+            raise ValueError(
+                f"C generation cannot use field name '{field.name}': it is a "
+                f"reserved C identifier"
+            )
+        if isinstance(field.field_def, BoolFieldDefinition):
+            c_types[field.name] = "int"
+        elif isinstance(field.field_def, IntFieldDefinition):
+            c_types[field.name] = "int64_t"
+        elif isinstance(field.field_def, EnumFieldDefinition):
+            c_types[field.name] = "int"
+        else:
+            raise ValueError(
+                f"C generation does not support {field.field_def.type} field '{field.name}'"
+            )
+
+    params = []
+    out_params = []
+    terms = []
+    assignments = []
+    for field in plan:
+        c_type = c_types[field.name]
+        if field.nullable:
+            params.append(f"int {field.name}_present")
+            out_params.append(f"int *{field.name}_present")
+        params.append(f"{c_type} {field.name}")
+        out_params.append(f"{c_type} *{field.name}")
+
+        min_value = 0
+        if isinstance(field.field_def, IntFieldDefinition) and field.field_def.min:
+            min_value = field.field_def.min
+
+        # Encode term: (normalized & mask) << shift, plus presence bit
+        if field.value_bits > 0:
+            if isinstance(field.field_def, BoolFieldDefinition):
+                normalized = f"(uint64_t)({field.name} != 0)"
+            elif min_value:
+                normalized = f"(uint64_t)({field.name} - {min_value})"
+            else:
+                normalized = f"(uint64_t){field.name}"
+            value_term = f"(({normalized} & {field.mask}ULL) << {field.shift})"
+        else:
+            value_term = None
+        if field.nullable:
+            present = f"(1ULL << {field.offset})"
+            if value_term is not None:
+                present = f"{present} | {value_term}"
+            terms.append(f"({field.name}_present ? ({present}) : 0ULL)")
+        elif value_term is not None:
+            terms.append(value_term)
+
+        # Decode assignment: ((encoded >> shift) & mask) + min
+        if field.value_bits > 0:
+            value = f"({c_type})((encoded >> {field.shift}) & {field.mask}ULL)"
+            if min_value:
+                value = f"{value} + {min_value}"
+        else:
+            value = str(min_value)
+        if field.nullable:
+            assignments.append(
+                f"    *{field.name}_present = (int)((encoded >> {field.offset}) & 1ULL);"
+            )
+            # Branchless select: multiply by the 0/1 presence bit
+            value = f"({c_type})*{field.name}_present * ({value})"
+        assignments.append(
+            f"    *{field.name} = {value};  /* offset={field.offset}, bits={field.bits} */"
+        )
+
+    lines = []
+    lines.append(f"/* Generated BitSchema C kernels: {schema.name} */")
+    lines.append("/* Auto-generated from schema. Do not edit manually. */")
+    lines.append("#include <stdint.h>")
+    lines.append("")
+    lines.append(f"uint64_t encode_{schema.name}({', '.join(params) or 'void'})")
+    lines.append("{")
+    if terms:
+        lines.append(f"    return {terms[0]}")
+        lines.extend(f"        | {term}" for term in terms[1:])
+        lines[-1] += ";"
+    else:
+        lines.append("    return 0ULL;")
+    lines.append("}")
+    lines.append("")
+    lines.append(
+        f"void decode_{schema.name}({', '.join(['uint64_t encoded', *out_params])})"
+    )
+    lines.append("{")
+    lines.extend(assignments)
+    lines.append("}")
+
+    return "\n".join(lines) + "\n"
 
 
 def format_generated_code(code: str) -> str:
@@ -514,5 +1309,16 @@ def validate_generated_code(code: str) -> bool:
     Raises:
         SyntaxError: If code is not valid Python
     """
-    ast.parse(code)
+    _compile_generated(code)
     return True
+
+
+@functools.lru_cache(maxsize=256)
+def _compile_generated(code: str) -> CodeType:
+    """Compile generated source once; the code object doubles as validation.
+
+    compile() goes straight to bytecode without building Python AST
+    objects, and the cache lets generate_dataclass_code() reuse the code
+    object from validation instead of compiling the source twice.
+    """
+    return compile(code, "<bitschema>", "exec", dont_inherit=True)
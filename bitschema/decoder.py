@@ -4,10 +4,25 @@ Transforms 64-bit integers back to Python dictionaries using field layouts.
 Implements bit extraction, denormalization, and nullable field handling.
 """
 
-from typing import Any
-from datetime import datetime, timedelta
+from array import array
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from typing import Any, Callable, Iterable, NamedTuple
+from datetime import date, timedelta
 
-from .layout import FieldLayout
+from .layout import (
+    CompiledLayout,
+    FieldConstants,
+    FieldLayout,
+    compile_layouts,
+    layout_constants,
+)
+
+
+# Specialized decoders, extractors and record classes keyed on (kind, layout
+# shape); see compile_decoder(), compile_extractor() and compile_record_class()
+_DECODER_CACHE: dict[tuple[str, str], Callable[[int], Any]] = {}
 
 
 def denormalize_value(extracted: int, layout: FieldLayout) -> Any:
@@ -43,51 +58,87 @@ def denormalize_value(extracted: int, layout: FieldLayout) -> Any:
         >>> denormalize_value(1, layout)
         'active'
     """
-    if layout.type == "boolean":
-        # Convert 0/1 to False/True
-        return bool(extracted)
+    constants = layout_constants(layout)
+    # Unknown types have type_code -1, which selects _denormalize_unknown
+    return _DENORMALIZERS[constants.type_code](extracted, layout, constants)
 
-    elif layout.type == "integer":
-        # Denormalize: add min to convert unsigned to signed
-        min_value = layout.constraints.get("min", 0)
-        return extracted + min_value
 
-    elif layout.type == "enum":
-        # Convert index to enum value
-        values = layout.constraints["values"]
-        return values[extracted]
-
-    elif layout.type == "date":
-        min_date_str = layout.constraints["min_date"]
-        min_date = datetime.fromisoformat(min_date_str)
-        resolution = layout.constraints["resolution"]
-
-        # Calculate datetime by adding offset to min_date
-        if resolution == "day":
-            result = (min_date + timedelta(days=extracted)).date()
-        elif resolution == "hour":
-            result = min_date + timedelta(hours=extracted)
-        elif resolution == "minute":
-            result = min_date + timedelta(minutes=extracted)
-        elif resolution == "second":
-            result = min_date + timedelta(seconds=extracted)
-        else:
-            raise ValueError(f"Invalid date resolution: {resolution}")
+def _denormalize_boolean(
+    extracted: int, layout: FieldLayout, constants: FieldConstants
+) -> bool:
+    """Convert 0/1 to False/True."""
+    return bool(extracted)
+
 
-        return result
+def _denormalize_integer(
+    extracted: int, layout: FieldLayout, constants: FieldConstants
+) -> int:
+    """Add min to convert unsigned to signed."""
+    return extracted + constants.min_value
 
-    elif layout.type == "bitmask":
-        flags_def = layout.constraints["flags"]
 
-        result = {}
-        for flag_name, flag_position in flags_def.items():
-            result[flag_name] = bool(extracted & (1 << flag_position))
+def _denormalize_enum(
+    extracted: int, layout: FieldLayout, constants: FieldConstants
+) -> str:
+    """Convert index to enum value."""
+    return constants.enum_values[extracted]
 
-        return result
 
+def _denormalize_date(
+    extracted: int, layout: FieldLayout, constants: FieldConstants
+) -> Any:
+    """Add the offset, in resolution units, to min_date."""
+    resolution = constants.resolution
+
+    # Day offsets are plain ordinal arithmetic; finer resolutions scale a
+    # shared one-unit timedelta instead of building one from keywords
+    if resolution == "day":
+        result = date.fromordinal(constants.min_ordinal + extracted)
+    elif resolution in _DATE_STEPS:
+        result = constants.min_date + _DATE_STEPS[resolution] * extracted
     else:
-        # Should never happen if layout is valid
-        raise ValueError(f"Unknown field type: {layout.type}")
+        raise ValueError(f"Invalid date resolution: {resolution}")
+
+    return result
+
+
+def _denormalize_bitmask(
+    extracted: int, layout: FieldLayout, constants: FieldConstants
+) -> dict[str, bool]:
+    """Expand packed flag bits to a flag name -> bool dict."""
+    return {
+        flag_name: bool(extracted & (1 << flag_position))
+        for flag_name, flag_position in constants.flags
+    }
+
+
+def _denormalize_unknown(
+    extracted: int, layout: FieldLayout, constants: FieldConstants
+) -> Any:
+    """Reject a layout whose type has no denormalizer."""
+    # Should never happen if layout is valid
+    raise ValueError(f"Unknown field type: {layout.type}")
+
+
+# Date resolution -> one unit, for batch date decoding
+_DATE_STEPS = {
+    "day": timedelta(days=1),
+    "hour": timedelta(hours=1),
+    "minute": timedelta(minutes=1),
+    "second": timedelta(seconds=1),
+}
+
+
+# Indexed by FieldConstants.type_code (see layout.TYPE_CODES); the last entry
+# doubles as the target of type_code -1, so dispatch needs no range check
+_DENORMALIZERS = (
+    _denormalize_boolean,
+    _denormalize_integer,
+    _denormalize_enum,
+    _denormalize_date,
+    _denormalize_bitmask,
+    _denormalize_unknown,
+)
 
 
 def decode(encoded: int, layouts: list[FieldLayout]) -> dict:
@@ -139,37 +190,444 @@ def decode(encoded: int, layouts: list[FieldLayout]) -> dict:
     """
     result = {}
 
-    for layout in layouts:
-        if layout.nullable:
-            # Nullable field: check presence bit first
-            presence_offset = layout.offset
-            presence = (encoded >> presence_offset) & 1
+    for layout, constants in compile_layouts(layouts).fields:
+        # Nullable field: presence bit 0 means None (presence_bit is 0 for
+        # non-nullable fields)
+        presence_bit = constants.presence_bit
+        if presence_bit and not encoded & presence_bit:
+            result[layout.name] = None
+            continue
+
+        # Extract value bits (after any presence bit)
+        extracted = (encoded >> constants.value_offset) & constants.mask
+
+        # Denormalize and store
+        result[layout.name] = _DENORMALIZERS[constants.type_code](
+            extracted, layout, constants
+        )
+
+    return result
+
+
+def decode_many(
+    encoded_values: Iterable[int], layouts: list[FieldLayout], record: bool = False
+) -> list[Any]:
+    """Decode a sequence of 64-bit integers to dictionaries using shared layouts.
+
+    Batch counterpart of decode(): every value is unpacked with the same
+    layouts, in order, using the specialized decoder from compile_decoder().
+
+    Args:
+        encoded_values: Iterable of integers with packed field data
+        layouts: Field layouts in declaration order
+        record: Return namedtuple records (see compile_record_class())
+            instead of dicts (default: False)
+
+    Returns:
+        List of decoded dicts (or records), one per encoded value
+
+    Example:
+        >>> layouts = [
+        ...     FieldLayout(name="active", type="boolean", offset=0, bits=1,
+        ...                 constraints={}, nullable=False),
+        ... ]
+        >>> decode_many([1, 0], layouts)
+        [{'active': True}, {'active': False}]
+    """
+    decode_one = compile_decoder(layouts, record=record)
+    return [decode_one(encoded) for encoded in encoded_values]
+
+
+def compile_decoder(
+    layouts: list[FieldLayout], record: bool = False
+) -> Callable[[int], Any]:
+    """Build a decode function specialized to one set of layouts.
+
+    Generates and compiles a function whose body is a single dict literal
+    with every offset, mask and min value inlined as a constant, so each
+    call does straight-line shifts and masks with no per-field branching
+    on layout.type or constraint lookups. Results are identical to
+    decode(), which remains the interpreted reference implementation.
+
+    Args:
+        layouts: Field layouts in declaration order
+        record: Return instances of compile_record_class(layouts) instead of
+            dicts (default: False). A fixed-arity tuple is cheaper to build
+            and smaller than a dict; use record._asdict() where a dict is
+            needed.
+
+    Returns:
+        Function mapping an encoded integer to a dict (or record) of decoded
+        values. Cached per layout shape, so repeat calls return the same
+        function.
+
+    Example:
+        >>> layouts = [
+        ...     FieldLayout(name="active", type="boolean", offset=0, bits=1,
+        ...                 constraints={}, nullable=False),
+        ...     FieldLayout(name="age", type="integer", offset=1, bits=7,
+        ...                 constraints={"min": 0, "max": 127}, nullable=False)
+        ... ]
+        >>> decode_person = compile_decoder(layouts)
+        >>> decode_person(85)
+        {'active': True, 'age': 42}
+        >>> compile_decoder(layouts, record=True)(85)
+        Record(active=True, age=42)
+    """
+    key = ("record" if record else "decode", repr(layouts))
+    decoder = _DECODER_CACHE.get(key)
+    if decoder is None:
+        record_class = compile_record_class(layouts) if record else None
+        decoder = _build_decoder(layouts, record_class)
+        _DECODER_CACHE[key] = decoder
+    return decoder
+
+
+def compile_record_class(layouts: list[FieldLayout]) -> type:
+    """Build a namedtuple class with one field per layout, in layout order.
+
+    Args:
+        layouts: Field layouts in declaration order
+
+    Returns:
+        A collections.namedtuple class named Record. Cached per layout
+        shape, so repeat calls return the same class.
+
+    Raises:
+        ValueError: If a field name is not a valid namedtuple field name
+            (for example a keyword or a name starting with an underscore)
+
+    Example:
+        >>> Record = compile_record_class(layouts)
+        >>> Record._fields
+        ('active', 'age')
+    """
+    key = ("record_class", repr(layouts))
+    record_class = _DECODER_CACHE.get(key)
+    if record_class is None:
+        record_class = namedtuple("Record", [layout.name for layout in layouts])
+        _DECODER_CACHE[key] = record_class
+    return record_class
+
 
-            if presence == 0:
-                # Field is None
-                result[layout.name] = None
+def compile_extractor(layouts: list[FieldLayout]) -> Callable[[int], tuple]:
+    """Build a function extracting the raw (normalized) bits of every field.
+
+    The integer-only core of compile_decoder(): the generated function
+    returns a tuple of unsigned field values in layout order, computed with
+    inlined shifts and masks and no denormalization. Absent nullable fields
+    yield None. Useful when the raw values feed numeric processing directly,
+    or when only some fields need to be denormalized.
+
+    Args:
+        layouts: Field layouts in declaration order
+
+    Returns:
+        Function mapping an encoded integer to a tuple of raw field values.
+        Cached per layout shape, so repeat calls return the same function.
+
+    Example:
+        >>> layouts = [
+        ...     FieldLayout(name="active", type="boolean", offset=0, bits=1,
+        ...                 constraints={}, nullable=False),
+        ...     FieldLayout(name="temp", type="integer", offset=1, bits=5,
+        ...                 constraints={"min": -10, "max": 10}, nullable=False)
+        ... ]
+        >>> compile_extractor(layouts)(11)  # temp = 5 - 10 = -5
+        (1, 5)
+    """
+    key = ("extract", repr(layouts))
+    extractor = _DECODER_CACHE.get(key)
+    if extractor is None:
+        # One shift and mask per field on purpose: splitting encoded into
+        # byte lanes first (to_bytes, then small-int shifts per lane) only
+        # wins for values above ~2**60 and loses for anything shorter, and
+        # multiply-based SWAR gathers collide for most non-aligned layouts
+        items = []
+        for layout in layouts:
+            if layout.nullable:
+                raw = _nullable_expression(layout, "_raw >> 1")
             else:
-                # Field has value: extract from offset+1
-                value_offset = layout.offset + 1
-                value_bits = layout.bits - 1  # Exclude presence bit
+                raw = _raw_expression(layout)
+            items.append(f"        {raw},")
+        source = "\n".join(["def extract(encoded):", "    return (", *items, "    )"])
+        namespace: dict[str, Any] = {}
+        exec(compile(source, "<bitschema extractor>", "exec"), namespace)
+        extractor = _DECODER_CACHE[key] = namespace["extract"]
+    return extractor
+
+
+def _raw_expression(layout: FieldLayout) -> str:
+    """Source expression extracting a field's value bits from 'encoded'."""
+    if layout.nullable:
+        value_offset = layout.offset + 1
+        value_bits = layout.bits - 1
+    else:
+        value_offset = layout.offset
+        value_bits = layout.bits
+    return f"((encoded >> {value_offset}) & {(1 << value_bits) - 1})"
+
+
+def _nullable_expression(layout: FieldLayout, expr: str) -> str:
+    """Wrap expr, written against _raw, in a fused presence check.
+
+    The presence bit and value bits are adjacent, so one shift and mask of
+    'encoded' yields both: bit 0 of _raw is presence, _raw >> 1 the value.
+    """
+    field_mask = (1 << layout.bits) - 1
+    return f"{expr} if (_raw := (encoded >> {layout.offset}) & {field_mask}) & 1 else None"
 
-                # Create mask for value width
-                mask = (1 << value_bits) - 1
 
-                # Extract value bits
-                extracted = (encoded >> value_offset) & mask
+def _build_decoder(
+    layouts: list[FieldLayout], record_class: type | None = None
+) -> Callable[[int], Any]:
+    """Generate, compile and return a specialized decoder (uncached).
 
-                # Denormalize and store
-                result[layout.name] = denormalize_value(extracted, layout)
+    Builds a dict literal, or a positional record_class call when given.
+    """
+    # Constants the generated source refers to by name
+    namespace: dict[str, Any] = {"_fromordinal": date.fromordinal}
+    items = []
+
+    for i, layout in enumerate(layouts):
+        constants = layout_constants(layout)
+        # Nullable fields read presence and value bits with one shift into
+        # _raw (see _nullable_expression); others read straight from encoded
+        if layout.nullable:
+            source, value_offset, raw = "_raw", 1, "(_raw >> 1)"
+        else:
+            source, value_offset, raw = "encoded", layout.offset, _raw_expression(layout)
+
+        if layout.type == "boolean":
+            expr = f"bool{raw}"
+        elif layout.type == "integer":
+            min_value = constants.min_value
+            expr = f"{raw} + {min_value}" if min_value else raw
+        elif layout.type == "enum":
+            namespace[f"_values_{i}"] = constants.enum_values
+            expr = f"_values_{i}[{raw}]"
+        elif layout.type == "date":
+            resolution = constants.resolution
+            if resolution not in _DATE_STEPS:
+                raise ValueError(f"Invalid date resolution: {resolution}")
+            if resolution == "day":
+                expr = f"_fromordinal({constants.min_ordinal} + {raw})"
+            else:
+                namespace[f"_min_date_{i}"] = constants.min_date
+                namespace[f"_step_{i}"] = _DATE_STEPS[resolution]
+                expr = f"_min_date_{i} + _step_{i} * {raw}"
+        elif layout.type == "bitmask":
+            flags = ", ".join(
+                f"{flag_name!r}: bool(({source} >> {value_offset + position}) & 1)"
+                for flag_name, position in constants.flags
+            )
+            expr = f"{{{flags}}}"
         else:
-            # Non-nullable field: extract directly from offset
-            # Create mask for field width
-            mask = (1 << layout.bits) - 1
+            raise ValueError(f"Unknown field type: {layout.type}")
 
-            # Extract bits at offset
-            extracted = (encoded >> layout.offset) & mask
+        if layout.nullable:
+            expr = _nullable_expression(layout, expr)
+        if record_class is None:
+            items.append(f"        {layout.name!r}: {expr},")
+        else:
+            items.append(f"        {expr},")
 
-            # Denormalize to semantic value
-            result[layout.name] = denormalize_value(extracted, layout)
+    if record_class is None:
+        body = ["    return {", *items, "    }"]
+    else:
+        namespace["_Record"] = record_class
+        body = ["    return _Record(", *items, "    )"]
+    source = "\n".join(["def decode(encoded):", *body])
+    exec(compile(source, "<bitschema decoder>", "exec"), namespace)
+    return namespace["decode"]
 
-    return result
+
+def decode_columns(
+    encoded_values: Iterable[int],
+    layouts: list[FieldLayout] | CompiledLayout,
+    workers: int = 1,
+) -> dict[str, list]:
+    """Decode 64-bit integers to column-oriented data (field name -> values).
+
+    Columnar counterpart of decode_many(): each field is extracted across the
+    whole batch before moving on to the next field, so shifts and masks are
+    computed once per field rather than once per record, and no per-record
+    dict is built.
+
+    Args:
+        encoded_values: Iterable of integers with packed field data
+        layouts: Field layouts in declaration order, or a CompiledLayout
+            from compile_layouts() to reuse precomputed per-field constants
+            across batches
+        workers: Number of processes to split the batch across (default: 1,
+            decode in this process). Worth it only for very large batches,
+            where decoding outweighs sending chunks to worker processes.
+
+    Returns:
+        Dictionary mapping each field name to a list of decoded values,
+        one per encoded value
+
+    Example:
+        >>> layouts = [
+        ...     FieldLayout(name="active", type="boolean", offset=0, bits=1,
+        ...                 constraints={}, nullable=False),
+        ...     FieldLayout(name="age", type="integer", offset=1, bits=7,
+        ...                 constraints={"min": 0, "max": 127}, nullable=False)
+        ... ]
+        >>> decode_columns([85, 2], layouts)
+        {'active': [True, False], 'age': [42, 1]}
+    """
+    # Every field walks the batch, so materialize one-shot iterators once
+    encoded_values = list(encoded_values)
+    if not isinstance(layouts, CompiledLayout):
+        layouts = compile_layouts(layouts)
+    if workers > 1:
+        return _decode_columns_parallel(encoded_values, layouts, workers)
+    columns = {}
+
+    for name, value_offset, mask, presence_offset, layout, constants in zip(
+        layouts.names,
+        layouts.value_offsets,
+        layouts.masks,
+        layouts.presence_offsets,
+        layouts.layouts,
+        layouts.constants,
+    ):
+        if presence_offset is not None:
+            # One shift reads presence (bit 0) and value (above it) together
+            field_mask = (mask << 1) | 1
+            raw = [
+                field_bits >> 1
+                if (field_bits := (encoded >> presence_offset) & field_mask) & 1
+                else None
+                for encoded in encoded_values
+            ]
+        else:
+            raw = [(encoded >> value_offset) & mask for encoded in encoded_values]
+
+        columns[name] = _denormalize_column(raw, layout, constants)
+
+    return columns
+
+
+def _decode_columns_parallel(
+    encoded_values: list[int], layouts: CompiledLayout, workers: int
+) -> dict[str, list]:
+    """Decode contiguous chunks in worker processes and concatenate the columns."""
+    chunk_size = -(-len(encoded_values) // workers) or 1
+    chunks = [
+        encoded_values[start:start + chunk_size]
+        for start in range(0, len(encoded_values), chunk_size)
+    ]
+
+    columns: dict[str, list] = {name: [] for name in layouts.names}
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        # map() yields results in chunk order, so rows keep their positions
+        for chunk_columns in executor.map(decode_columns, chunks, repeat(layouts)):
+            for name, values in chunk_columns.items():
+                columns[name].extend(values)
+    return columns
+
+
+# Unsigned array typecodes, narrowest first (itemsizes are platform-dependent)
+_ARRAY_TYPECODES = sorted("BHILQ", key=lambda code: array(code).itemsize)
+
+
+class RawColumns(NamedTuple):
+    """Column-oriented raw field bits returned by extract_columns().
+
+    Attributes:
+        values: Field name -> array.array of unsigned field values, using the
+            narrowest typecode that holds the field's value bits. Enum
+            columns hold value indexes; absent nullable entries hold 0.
+        presence: Nullable field name -> validity bitmap, one bit per row,
+            LSB-first within each byte (bit i % 8 of byte i // 8 is row i)
+    """
+
+    values: dict[str, array]
+    presence: dict[str, bytes]
+
+
+def extract_columns(
+    encoded_values: Iterable[int], layouts: list[FieldLayout] | CompiledLayout
+) -> RawColumns:
+    """Extract raw field bits into compact typed arrays, one per field.
+
+    Numeric counterpart of decode_columns(): values are left normalized
+    (integer minus min, enum index, date offset, bitmask bits) and stored in
+    array.array columns sized to each field's width, e.g. 1 byte per row for
+    fields of up to 8 value bits instead of a pointer to a Python object.
+    Presence of nullable fields is kept in a separate packed bitmap.
+
+    Args:
+        encoded_values: Iterable of integers with packed field data
+        layouts: Field layouts in declaration order, or a CompiledLayout
+
+    Returns:
+        RawColumns with value arrays for every field and presence bitmaps
+        for nullable fields
+
+    Example:
+        >>> columns = extract_columns([85, 2], layouts)
+        >>> columns.values["age"]
+        array('B', [42, 1])
+    """
+    encoded_values = list(encoded_values)
+    if not isinstance(layouts, CompiledLayout):
+        layouts = compile_layouts(layouts)
+    values = {}
+    presence = {}
+
+    for name, value_offset, mask, presence_offset in zip(
+        layouts.names, layouts.value_offsets, layouts.masks, layouts.presence_offsets
+    ):
+        typecode = next(
+            code for code in _ARRAY_TYPECODES
+            if array(code).itemsize * 8 >= mask.bit_length()
+        )
+        values[name] = array(
+            typecode, [(encoded >> value_offset) & mask for encoded in encoded_values]
+        )
+        if presence_offset is not None:
+            # Last row is the most significant bit; little-endian bytes
+            # then put row i at bit i % 8 of byte i // 8
+            bits = "".join(
+                "1" if (encoded >> presence_offset) & 1 else "0"
+                for encoded in reversed(encoded_values)
+            )
+            presence[name] = int(bits or "0", 2).to_bytes(
+                (len(encoded_values) + 7) // 8, "little"
+            )
+
+    return RawColumns(values, presence)
+
+
+def _denormalize_column(
+    raw: list[int | None], layout: FieldLayout, constants: FieldConstants
+) -> list[Any]:
+    """Denormalize a column of extracted bits; None entries stay None."""
+    if layout.type == "boolean":
+        return [None if value is None else bool(value) for value in raw]
+    elif layout.type == "integer":
+        min_value = constants.min_value
+        return [None if value is None else value + min_value for value in raw]
+    elif layout.type == "enum":
+        values = constants.enum_values
+        return [None if value is None else values[value] for value in raw]
+    elif layout.type == "date" and constants.resolution in _DATE_STEPS:
+        # One add (day ordinals) or multiply-add per value
+        if constants.resolution == "day":
+            min_ordinal = constants.min_ordinal
+            return [
+                None if value is None else date.fromordinal(min_ordinal + value)
+                for value in raw
+            ]
+        min_date = constants.min_date
+        step = _DATE_STEPS[constants.resolution]
+        return [None if value is None else min_date + step * value for value in raw]
+    else:
+        denormalize = _DENORMALIZERS[constants.type_code]
+        return [
+            None if value is None else denormalize(value, layout, constants)
+            for value in raw
+        ]
@@ -4,12 +4,22 @@ Computes deterministic bit offsets and widths for fields, ensuring total
 bit count stays within 64-bit limit. Core mathematical correctness guarantee.
 """
 
+import json
+import sys
+from functools import lru_cache
 from typing import NamedTuple
 from datetime import datetime
 
 from .errors import SchemaError
 
 
+# Field type -> FieldConstants.type_code; codes index per-type dispatch tables
+TYPE_CODES = {"boolean": 0, "integer": 1, "enum": 2, "date": 3, "bitmask": 4}
+
+# Date resolution -> seconds per unit
+DATE_STEP_SECONDS = {"day": 86400, "hour": 3600, "minute": 60, "second": 1}
+
+
 class FieldLayout(NamedTuple):
     """Layout information for a single field.
 
@@ -34,6 +44,143 @@ class FieldLayout(NamedTuple):
     nullable: bool = False
 
 
+class FieldConstants(NamedTuple):
+    """Per-field constants derived from a FieldLayout by field_constants().
+
+    Attributes:
+        value_offset: Bit offset of the value (offset + 1 if nullable)
+        presence_bit: The presence bit, 1 << offset (0 if not nullable)
+        mask: Mask for the value bits, excluding any presence bit
+        min_value: Integer min constraint (0 for other types or no min)
+        max_value: Integer max constraint, or the largest value the bits
+            hold if there is none (0 for other types)
+        enum_values: Enum values as a tuple of interned strings (None for
+            other types)
+        enum_index: Enum value -> index dict (None for other types)
+        min_date: Parsed date min_date (None for other types or no min_date)
+        resolution: Date resolution (None for other types)
+        step_seconds: Seconds per resolution unit (None for other types or
+            an unknown resolution)
+        min_ordinal: Proleptic Gregorian ordinal of min_date (None if
+            min_date is None)
+        flags: Bitmask (flag name, bit position) pairs (None for other types)
+        type_code: Index of type in TYPE_CODES (-1 if unknown)
+    """
+
+    value_offset: int
+    presence_bit: int
+    mask: int
+    min_value: int
+    max_value: int
+    enum_values: tuple | None
+    enum_index: dict | None
+    min_date: datetime | None
+    resolution: str | None
+    step_seconds: int | None
+    min_ordinal: int | None
+    flags: tuple[tuple[str, int], ...] | None
+    type_code: int
+
+
+def field_constants(layout: FieldLayout) -> FieldConstants:
+    """Derive the encode/decode constants for one field layout.
+
+    Computed from the layout's current constraints on every call; encode and
+    decode paths use the cached layout_constants() instead. Missing
+    optional constraints fall back to the defaults documented on
+    FieldConstants rather than raising.
+
+    Args:
+        layout: Field layout with type and constraints
+
+    Returns:
+        FieldConstants for the field
+
+    Example:
+        >>> layout = FieldLayout(name="temp", type="integer", offset=3, bits=6,
+        ...                      constraints={"min": -10, "max": 20}, nullable=True)
+        >>> constants = field_constants(layout)
+        >>> constants.value_offset, constants.mask, constants.min_value
+        (4, 31, -10)
+    """
+    constraints = layout.constraints
+    value_bits = layout.bits - 1 if layout.nullable else layout.bits
+    mask = (1 << value_bits) - 1 if value_bits > 0 else 0
+    min_value = max_value = 0
+    enum_values = enum_index = min_date = None
+    resolution = step_seconds = min_ordinal = flags = None
+
+    if layout.type == "integer":
+        min_value = constraints.get("min")
+        if min_value is None:
+            min_value = 0
+        max_value = constraints.get("max")
+        if max_value is None:
+            max_value = min_value + mask
+    elif layout.type == "enum":
+        # Interned, so decoded enum strings are shared across layouts and
+        # compare equal to other interned strings by identity
+        enum_values = tuple(
+            sys.intern(value) if isinstance(value, str) else value
+            for value in constraints.get("values", ())
+        )
+        enum_index = {value: i for i, value in enumerate(enum_values)}
+    elif layout.type == "date":
+        resolution = constraints.get("resolution")
+        step_seconds = DATE_STEP_SECONDS.get(resolution)
+        min_date_str = constraints.get("min_date")
+        if min_date_str is not None:
+            min_date = datetime.fromisoformat(min_date_str)
+            min_ordinal = min_date.toordinal()
+    elif layout.type == "bitmask":
+        flags = tuple(constraints.get("flags", {}).items())
+
+    return FieldConstants(
+        value_offset=layout.offset + 1 if layout.nullable else layout.offset,
+        presence_bit=1 << layout.offset if layout.nullable else 0,
+        mask=mask,
+        min_value=min_value,
+        max_value=max_value,
+        enum_values=enum_values,
+        enum_index=enum_index,
+        min_date=min_date,
+        resolution=resolution,
+        step_seconds=step_seconds,
+        min_ordinal=min_ordinal,
+        flags=flags,
+        type_code=TYPE_CODES.get(layout.type, -1),
+    )
+
+
+# FieldConstants per FieldLayout object, keyed on id(); each entry keeps its
+# layout alive so the id cannot be reused while it is cached
+_CONSTANTS_CACHE: dict[int, tuple[FieldLayout, FieldConstants]] = {}
+_CONSTANTS_CACHE_MAXSIZE = 4096
+
+
+def layout_constants(layout: FieldLayout) -> FieldConstants:
+    """Return field_constants(layout), derived once per FieldLayout object.
+
+    encode(), decode() and the batch and compiled paths read constants
+    through here, so repeated calls with the same layouts do only shifts,
+    masks and table lookups. Constraints are treated as read-only once a
+    layout has been used; to change them build a new FieldLayout (e.g. with
+    layout._replace(constraints=...)).
+
+    Args:
+        layout: Field layout with type and constraints
+
+    Returns:
+        FieldConstants for the field, shared across calls
+    """
+    entry = _CONSTANTS_CACHE.get(id(layout))
+    if entry is None:
+        if len(_CONSTANTS_CACHE) >= _CONSTANTS_CACHE_MAXSIZE:
+            del _CONSTANTS_CACHE[next(iter(_CONSTANTS_CACHE))]
+        entry = _CONSTANTS_CACHE[id(layout)] = (layout, field_constants(layout))
+    return entry[1]
+
+
 def compute_field_bits(field: dict) -> int:
     """Compute minimum required bits for a field.
 
@@ -117,6 +264,11 @@ def compute_bit_layout(fields: list[dict]) -> tuple[list[FieldLayout], int]:
     Assigns sequential bit offsets starting from 0, preserving field order.
     Validates total bit count stays within 64-bit limit.
 
+    Field bit widths are memoized on the JSON form of fields, so repeated
+    calls with an equal schema skip recomputing them. Every call still
+    builds new FieldLayout objects with their own constraint dicts. Fields
+    that are not JSON-serializable are computed without caching.
+
     Args:
         fields: List of field definition dicts
 
@@ -152,14 +304,30 @@ def compute_bit_layout(fields: list[dict]) -> tuple[list[FieldLayout], int]:
         >>> total
         8
     """
+    # Keys are deliberately not sorted: bitmask flag order is significant
+    # (it is the key order of decoded flag dicts)
+    try:
+        key = json.dumps(fields)
+    except TypeError:
+        return _compute_bit_layout(fields, [compute_field_bits(field) for field in fields])
+    return _compute_bit_layout(fields, _compute_field_bits_cached(key))
+
+
+@lru_cache(maxsize=256)
+def _compute_field_bits_cached(key: str) -> tuple[int, ...]:
+    """compute_field_bits() for each field, cached on the JSON form of fields."""
+    return tuple(compute_field_bits(field) for field in json.loads(key))
+
+
+def _compute_bit_layout(
+    fields: list[dict], field_bits: list[int] | tuple[int, ...]
+) -> tuple[list[FieldLayout], int]:
+    """Build layouts for fields given each field's value bits."""
     layouts = []
     offset = 0
 
     # Compute layout for each field in order
-    for field in fields:
-        # Compute required bits for value
-        bits = compute_field_bits(field)
-
+    for field, bits in zip(fields, field_bits):
         # Check if field is nullable (default to False if not specified)
         nullable = field.get("nullable", False)
 
@@ -206,3 +374,86 @@ def compute_bit_layout(fields: list[dict]) -> tuple[list[FieldLayout], int]:
         )
 
     return layouts, total_bits
+
+
+class CompiledLayout(NamedTuple):
+    """Struct-of-arrays view of a layout list for batch processing.
+
+    Each attribute is a tuple with one entry per field, in layout order, so
+    batch code can derive per-field constants once (by index or zip) instead
+    of recomputing them from FieldLayout attributes and constraint dicts.
+
+    Attributes:
+        layouts: The source FieldLayout entries
+        constants: FieldConstants for each layout (see layout_constants())
+        fields: (layout, constants) pairs, for loops that need both
+        names: Field names
+        types: Field types
+        value_offsets: Bit offset of each value (after any presence bit)
+        masks: Value mask, (1 << value_bits) - 1
+        presence_offsets: Presence bit offset, or None for non-nullable fields
+        min_values: Integer min (0 for non-integer fields)
+
+    Example:
+        >>> compiled = compile_layouts(layouts)
+        >>> compiled.value_offsets, compiled.masks
+        ((0, 2), (1, 127))
+    """
+
+    layouts: tuple[FieldLayout, ...]
+    constants: tuple[FieldConstants, ...]
+    fields: tuple[tuple[FieldLayout, FieldConstants], ...]
+    names: tuple[str, ...]
+    types: tuple[str, ...]
+    value_offsets: tuple[int, ...]
+    masks: tuple[int, ...]
+    presence_offsets: tuple[int | None, ...]
+    min_values: tuple[int, ...]
+
+
+# (layouts copy, CompiledLayout) per layout sequence, keyed on its id(); the
+# copy is compared on lookup, so a mutated or reused sequence recompiles
+_COMPILED_CACHE: dict[int, tuple[list[FieldLayout], CompiledLayout]] = {}
+_COMPILED_CACHE_MAXSIZE = 1024
+
+
+def compile_layouts(layouts: list[FieldLayout]) -> CompiledLayout:
+    """Convert a layout list into its struct-of-arrays CompiledLayout.
+
+    Compiled once per layout sequence and shared across calls, so encode()
+    and decode() pay one lookup per record rather than deriving constants
+    per field.
+
+    Args:
+        layouts: Field layouts in bit order
+
+    Returns:
+        CompiledLayout with per-field constants precomputed
+    """
+    entry = _COMPILED_CACHE.get(id(layouts))
+    if entry is None or entry[0] != layouts:
+        if len(_COMPILED_CACHE) >= _COMPILED_CACHE_MAXSIZE:
+            del _COMPILED_CACHE[next(iter(_COMPILED_CACHE))]
+        entry = _COMPILED_CACHE[id(layouts)] = (
+            layouts[:],
+            _compile_layouts(layouts),
+        )
+    return entry[1]
+
+
+def _compile_layouts(layouts: list[FieldLayout]) -> CompiledLayout:
+    """Build the CompiledLayout for compile_layouts()."""
+    constants = tuple(layout_constants(layout) for layout in layouts)
+    return CompiledLayout(
+        layouts=tuple(layouts),
+        constants=constants,
+        fields=tuple(zip(layouts, constants)),
+        names=tuple(layout.name for layout in layouts),
+        types=tuple(layout.type for layout in layouts),
+        value_offsets=tuple(c.value_offset for c in constants),
+        masks=tuple(c.mask for c in constants),
+        presence_offsets=tuple(
+            layout.offset if layout.nullable else None for layout in layouts
+        ),
+        min_values=tuple(c.min_value for c in constants),
+    )
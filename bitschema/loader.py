@@ -13,6 +13,12 @@ from pydantic import ValidationError as PydanticValidationError
 from .models import BitSchema
 from .errors import SchemaError
 
+# orjson is an optional, faster drop-in for json.loads
+try:
+    from orjson import loads as _fast_json_loads
+except ImportError:
+    _fast_json_loads = json.loads
+
 
 def load_schema(file_path: str | Path) -> BitSchema:
     """Load and validate schema from JSON or YAML file.
@@ -33,14 +39,18 @@ def load_schema(file_path: str | Path) -> BitSchema:
     if not path.exists():
         raise FileNotFoundError(f"Schema file not found: {path}")
 
-    # Read file content
+    # Read file content. JSON is read as bytes: both JSON parsers decode
+    # UTF-8 themselves, which is cheaper than a text-layer read
+    suffix = path.suffix.lower()
     try:
-        content = path.read_text(encoding="utf-8")
+        if suffix == ".json":
+            content = path.read_bytes()
+        else:
+            content = path.read_text(encoding="utf-8")
     except Exception as e:
         raise SchemaError(f"Failed to read schema file '{path}': {e}")
 
     # Determine format and parse
-    suffix = path.suffix.lower()
     if suffix == ".json":
         return load_from_json(content, str(path))
     elif suffix in (".yaml", ".yml"):
@@ -51,11 +61,11 @@ def load_schema(file_path: str | Path) -> BitSchema:
         )
 
 
-def load_from_json(json_content: str, source_name: str = "<json>") -> BitSchema:
+def load_from_json(json_content: str | bytes, source_name: str = "<json>") -> BitSchema:
     """Parse and validate schema from JSON string.
 
     Args:
-        json_content: JSON string containing schema definition
+        json_content: JSON string (or UTF-8 bytes) containing schema definition
         source_name: Name to use in error messages (default: "<json>")
 
     Returns:
@@ -64,11 +74,16 @@ def load_from_json(json_content: str, source_name: str = "<json>") -> BitSchema:
     Raises:
         SchemaError: If JSON is invalid or validation fails
     """
-    # Parse JSON
+    # Parse JSON. orjson is stricter than the stdlib (e.g. integers beyond
+    # 64 bits, NaN), so anything it rejects is re-parsed with json.loads:
+    # acceptance and error messages stay exactly those of the stdlib
     try:
-        data = json.loads(json_content)
-    except json.JSONDecodeError as e:
-        raise SchemaError(f"Invalid JSON in '{source_name}': {e}")
+        data = _fast_json_loads(json_content)
+    except ValueError:
+        try:
+            data = json.loads(json_content)
+        except (json.JSONDecodeError, UnicodeDecodeError) as e:
+            raise SchemaError(f"Invalid JSON in '{source_name}': {e}")
 
     # Validate with Pydantic
     return _validate_schema_data(data, source_name)
@@ -95,9 +110,18 @@ def load_from_yaml(yaml_content: str, source_name: str = "<yaml>") -> BitSchema:
             "PyYAML is required for YAML support. Install with: pip install pyyaml"
         )
 
-    # Parse YAML
+    # Parse YAML. yaml.safe_load always uses the pure-Python SafeLoader;
+    # libyaml's CSafeLoader is the same safe loader implemented in C
+    safe_loader = getattr(yaml, "CSafeLoader", None)
     try:
-        data = yaml.safe_load(yaml_content)
+        if safe_loader is None:
+            data = yaml.safe_load(yaml_content)
+        else:
+            loader = safe_loader(yaml_content)
+            try:
+                data = loader.get_single_data()
+            finally:
+                loader.dispose()
     except yaml.YAMLError as e:
         raise SchemaError(f"Invalid YAML in '{source_name}': {e}")
 
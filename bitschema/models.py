@@ -217,6 +217,86 @@ class BitmaskFieldDefinition(BaseModel):
 FieldDefinition = IntFieldDefinition | BoolFieldDefinition | EnumFieldDefinition | DateFieldDefinition | BitmaskFieldDefinition
 
 
+def _bool_to_layout(name: str, field_def: BoolFieldDefinition) -> dict:
+    return {"name": name, "type": "boolean", "nullable": field_def.nullable}
+
+
+def _int_to_layout(name: str, field_def: IntFieldDefinition) -> dict:
+    return {
+        "name": name,
+        "type": "integer",
+        "min": field_def.min,
+        "max": field_def.max,
+        "nullable": field_def.nullable,
+    }
+
+
+def _enum_to_layout(name: str, field_def: EnumFieldDefinition) -> dict:
+    return {
+        "name": name,
+        "type": "enum",
+        "values": field_def.values,
+        "nullable": field_def.nullable,
+    }
+
+
+def _date_to_layout(name: str, field_def: DateFieldDefinition) -> dict:
+    return {
+        "name": name,
+        "type": "date",
+        "min_date": field_def.min_date,
+        "max_date": field_def.max_date,
+        "resolution": field_def.resolution,
+        "nullable": field_def.nullable,
+    }
+
+
+def _bitmask_to_layout(name: str, field_def: BitmaskFieldDefinition) -> dict:
+    return {
+        "name": name,
+        "type": "bitmask",
+        "flags": field_def.flags,
+        "nullable": field_def.nullable,
+    }
+
+
+# Field definition class -> layout input converter (one hash lookup per
+# field instead of an isinstance chain)
+_TO_LAYOUT = {
+    BoolFieldDefinition: _bool_to_layout,
+    IntFieldDefinition: _int_to_layout,
+    EnumFieldDefinition: _enum_to_layout,
+    DateFieldDefinition: _date_to_layout,
+    BitmaskFieldDefinition: _bitmask_to_layout,
+}
+
+
+def _date_bits(field_def: DateFieldDefinition) -> int:
+    """Bits for the number of resolution units between min and max date."""
+    min_dt = datetime.fromisoformat(field_def.min_date)
+    max_dt = datetime.fromisoformat(field_def.max_date)
+    if field_def.resolution == "day":
+        total_units = (max_dt - min_dt).days
+    elif field_def.resolution == "hour":
+        total_units = int((max_dt - min_dt).total_seconds() / 3600)
+    elif field_def.resolution == "minute":
+        total_units = int((max_dt - min_dt).total_seconds() / 60)
+    else:
+        total_units = int((max_dt - min_dt).total_seconds())
+    return (total_units - 1).bit_length() if total_units > 0 else 0
+
+
+# Field definition class -> value bits (excluding any presence bit)
+_FIELD_BITS = {
+    BoolFieldDefinition: lambda field_def: 1,
+    IntFieldDefinition: lambda field_def: field_def.bits,
+    EnumFieldDefinition: lambda field_def: field_def.bits_required,
+    DateFieldDefinition: _date_bits,
+    # Bitmask bits = max(flag_positions) + 1
+    BitmaskFieldDefinition: lambda field_def: max(field_def.flags.values()) + 1,
+}
+
+
 class BitSchema(BaseModel):
     """Complete schema definition with validation.
 
@@ -254,36 +334,7 @@ class BitSchema(BaseModel):
     @model_validator(mode="after")
     def validate_total_bits(self) -> "BitSchema":
         """Ensure total schema fits in 64 bits."""
-        total_bits = 0
-
-        for field_name, field_def in self.fields.items():
-            if isinstance(field_def, IntFieldDefinition):
-                total_bits += field_def.bits
-            elif isinstance(field_def, BoolFieldDefinition):
-                total_bits += 1
-            elif isinstance(field_def, EnumFieldDefinition):
-                total_bits += field_def.bits_required
-            elif isinstance(field_def, DateFieldDefinition):
-                # Calculate date field bits based on resolution
-                min_dt = datetime.fromisoformat(field_def.min_date)
-                max_dt = datetime.fromisoformat(field_def.max_date)
-                if field_def.resolution == "day":
-                    total_units = (max_dt - min_dt).days
-                elif field_def.resolution == "hour":
-                    total_units = int((max_dt - min_dt).total_seconds() / 3600)
-                elif field_def.resolution == "minute":
-                    total_units = int((max_dt - min_dt).total_seconds() / 60)
-                elif field_def.resolution == "second":
-                    total_units = int((max_dt - min_dt).total_seconds())
-                total_bits += (total_units - 1).bit_length() if total_units > 0 else 0
-            elif isinstance(field_def, BitmaskFieldDefinition):
-                # Bitmask bits = max(flag_positions) + 1
-                max_position = max(field_def.flags.values())
-                total_bits += max_position + 1
-
-            # Add presence bit if nullable
-            if field_def.nullable:
-                total_bits += 1
+        total_bits = self.calculate_total_bits()
 
         if total_bits > 64:
             raise ValueError(
@@ -293,35 +344,26 @@ class BitSchema(BaseModel):
 
         return self
 
+    def to_layout_inputs(self) -> list[dict]:
+        """Convert fields to the list-of-dicts format compute_bit_layout expects.
+
+        Returns:
+            One dict per field, in definition order
+
+        Example:
+            >>> schema = BitSchema(name="Flags", fields={"active": BoolFieldDefinition()})
+            >>> schema.to_layout_inputs()
+            [{'name': 'active', 'type': 'boolean', 'nullable': False}]
+        """
+        return [
+            _TO_LAYOUT[type(field_def)](name, field_def)
+            for name, field_def in self.fields.items()
+        ]
+
     def calculate_total_bits(self) -> int:
         """Calculate total bits required for this schema."""
-        total = 0
-        for field_def in self.fields.values():
-            if isinstance(field_def, IntFieldDefinition):
-                total += field_def.bits
-            elif isinstance(field_def, BoolFieldDefinition):
-                total += 1
-            elif isinstance(field_def, EnumFieldDefinition):
-                total += field_def.bits_required
-            elif isinstance(field_def, DateFieldDefinition):
-                # Calculate date field bits based on resolution
-                min_dt = datetime.fromisoformat(field_def.min_date)
-                max_dt = datetime.fromisoformat(field_def.max_date)
-                if field_def.resolution == "day":
-                    total_units = (max_dt - min_dt).days
-                elif field_def.resolution == "hour":
-                    total_units = int((max_dt - min_dt).total_seconds() / 3600)
-                elif field_def.resolution == "minute":
-                    total_units = int((max_dt - min_dt).total_seconds() / 60)
-                elif field_def.resolution == "second":
-                    total_units = int((max_dt - min_dt).total_seconds())
-                total += (total_units - 1).bit_length() if total_units > 0 else 0
-            elif isinstance(field_def, BitmaskFieldDefinition):
-                # Bitmask bits = max(flag_positions) + 1
-                max_position = max(field_def.flags.values())
-                total += max_position + 1
-
-            if field_def.nullable:
-                total += 1
-
-        return total
+        # Each field's value bits, plus a presence bit if nullable
+        return sum(
+            _FIELD_BITS[type(field_def)](field_def) + field_def.nullable
+            for field_def in self.fields.values()
+        )
@@ -39,7 +39,8 @@ def parse_schema_file(file_path: str | Path) -> BitSchema:
         MySchema
 
     Security:
-        Uses yaml.safe_load() for YAML parsing to prevent code execution attacks.
+        Uses a safe YAML loader (libyaml's CSafeLoader when available,
+        otherwise yaml.safe_load()) to prevent code execution attacks.
     """
     from .loader import load_schema
     return load_schema(file_path)
@@ -6,11 +6,75 @@ that are available to all test modules in the BitSchema test suite.
 Includes Hypothesis composite strategies for generating test data.
 """
 
+import os
+from pathlib import Path
+
 import pytest
-from hypothesis import strategies as st
+from hypothesis import Phase, settings, strategies as st
+
+
+# Hypothesis profiles
+#
+# "fast" skips shrinking and the example database so green CI runs only pay
+# for generation. It is loaded when the CI environment variable is set (or
+# HYPOTHESIS_PROFILE=fast); local runs keep Hypothesis' defaults. Example
+# counts stay with each test's own @settings.
+settings.register_profile(
+    "fast",
+    phases=[Phase.explicit, Phase.generate],
+    database=None,
+    derandomize=True,
+    deadline=None,
+)
+_profile = os.environ.get("HYPOTHESIS_PROFILE") or ("fast" if os.environ.get("CI") else None)
+if _profile:
+    settings.load_profile(_profile)
 
 
 # Shared fixtures for BitSchema tests
+#
+# Under pytest-xdist each worker is its own process, so "session" fixtures
+# run once per worker. --dist=loadfile keeps a file's tests on one worker,
+# so a fixture used by a single file is built once.
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _warmup_bitschema():
+    """Exercise encode/decode once per session before any test runs.
+
+    Pays one-time import and first-call costs up front so they are not
+    attributed to whichever test happens to run first.
+    """
+    from bitschema import FieldLayout, decode, encode
+
+    layouts = [
+        FieldLayout(
+            name="x",
+            type="integer",
+            offset=0,
+            bits=1,
+            constraints={"min": 0, "max": 1},
+            nullable=False,
+        )
+    ]
+    for _ in range(3):
+        decode(encode({"x": 0}, layouts), layouts)
+
+
+@pytest.fixture(scope="session")
+def valid_json_schema():
+    """Parse tests/fixtures/valid_schema.json once per session."""
+    from bitschema.parser import parse_schema_file
+
+    return parse_schema_file(Path(__file__).parent / "fixtures" / "valid_schema.json")
+
+
+@pytest.fixture(scope="session")
+def valid_yaml_schema():
+    """Parse tests/fixtures/valid_schema.yaml once per session."""
+    from bitschema.parser import parse_schema_file
+
+    return parse_schema_file(Path(__file__).parent / "fixtures" / "valid_schema.yaml")
 
 
 # Hypothesis composite strategies for property-based testing
@@ -5,140 +5,217 @@ bit-packing correctness at min/max values, zero-bit fields, and nullable
 combinations.
 """
 
+import itertools
+import sys
+from functools import lru_cache
+
 import pytest
-from hypothesis import given, strategies as st, settings
+from hypothesis import example, given, strategies as st, settings
+
+from bitschema import encode, decode, encode_many, decode_many, FieldLayout
+
+
+# Layouts are built once at import time and shared by every example.
+# Identical constraint dicts are interned through _c() so layouts that share
+# a range or value set also share one constraints object.
+
+_CONSTRAINTS_CACHE = {}
+
+
+def _c(**constraints):
+    """Return the shared constraints dict for the given keyword constraints."""
+    return _CONSTRAINTS_CACHE.setdefault(frozenset(constraints.items()), constraints)
+
+
+_VALUES_ONLY = ("only",)
+_VALUES_ABCD = ("a", "b", "c", "d")
+
+
+@lru_cache(maxsize=None)
+def _field(name, type_, offset, bits, nullable=False, **constraints):
+    """Return the shared FieldLayout for a field definition.
+
+    Repeated definitions (same name, type, offset, bits, constraints) resolve
+    to a single FieldLayout instance.
+    """
+    return FieldLayout(
+        name=name,
+        type=type_,
+        offset=offset,
+        bits=bits,
+        constraints=_c(**constraints),
+        nullable=nullable,
+    )
+
+
+_LAYOUTS_UBYTE = [_field("byte_field", "integer", 0, 8, min=0, max=255)]
+
+_LAYOUTS_SBYTE = [_field("signed_byte", "integer", 0, 8, min=-128, max=127)]
+
+_LAYOUTS_NEGATIVE_RANGE = [
+    # (1000 - (-1000)).bit_length() = 11 bits
+    _field("offset_value", "integer", 0, 11, min=-1000, max=1000)
+]
+
+_LAYOUTS_CONSTANT_INT = [
+    # No bits needed for single value
+    _field("constant", "integer", 0, 0, min=42, max=42)
+]
+
+_LAYOUTS_MAX_FIELD = [_field("max_field", "integer", 0, 63, min=0, max=2**63 - 1)]
+
+_LAYOUTS_OFF_BY_ONE = [
+    # 2 values (99, 100)
+    _field("edge_case", "integer", 0, 1, min=99, max=100)
+]
+
+_LAYOUTS_THREE_BYTES = [
+    _field(f"field{i + 1}", "integer", i * 8, 8, min=0, max=255) for i in range(3)
+]
+
+_LAYOUTS_CONSTANT_ENUM = [_field("constant", "enum", 0, 0, values=_VALUES_ONLY)]
+
+_LAYOUTS_BINARY_ENUM = [_field("binary_choice", "enum", 0, 1, values=("yes", "no"))]
+
+_ENUM_256 = tuple(sys.intern(f"value_{i}") for i in range(256))
+
+_LAYOUTS_ENUM_256 = [_field("large_enum", "enum", 0, 8, values=_ENUM_256)]
+
+_LAYOUTS_ENUM_ABCD = [_field("status", "enum", 0, 2, values=_VALUES_ABCD)]
+
+_LAYOUTS_ENUM_XYZ = [
+    # 3 values need 2 bits (not fully utilized)
+    _field("choice", "enum", 0, 2, values=("x", "y", "z"))
+]
+
+_LAYOUTS_FLAG_LSB = [_field("flag", "boolean", 0, 1)]
+
+_LAYOUTS_FLAG_HIGH = [_field("high_flag", "boolean", 60, 1)]
+
+_LAYOUTS_FOUR_FLAGS = [_field(f"flag{i + 1}", "boolean", i, 1) for i in range(4)]
+
+_LAYOUTS_OPTIONAL_FLAG = [
+    # 1 presence + 1 value
+    _field("optional_flag", "boolean", 0, 2, nullable=True)
+]
+
+_LAYOUTS_OPTIONAL_INT = [
+    # 1 presence + 8 value
+    _field("optional_int", "integer", 0, 9, nullable=True, min=-128, max=127)
+]
+
+_LAYOUTS_OPTIONAL_CONSTANT = [
+    # 1 presence + 0 value
+    _field("optional_constant", "enum", 0, 1, nullable=True, values=_VALUES_ONLY)
+]
+
+_LAYOUTS_THREE_OPTIONAL = [
+    # 1 presence + 7 value each
+    _field(f"field{i + 1}", "integer", i * 8, 8, nullable=True, min=0, max=100)
+    for i in range(3)
+]
+
+_LAYOUTS_FLAG_AND_OPTIONALS = [
+    _field("flag", "boolean", 0, 1),
+    _field("opt1", "integer", 1, 8, nullable=True, min=0, max=100),
+    _field("opt2", "enum", 9, 3, nullable=True, values=("a", "b", "c")),
+]
+
+_LAYOUTS_OPT_FLAG_OFFSET_0 = [_field("opt_flag", "boolean", 0, 2, nullable=True)]
+
+_LAYOUTS_OPT_FLAG_OFFSET_30 = [
+    _field("padding", "integer", 0, 30, min=0, max=2**30 - 1),
+    _field("opt_flag", "boolean", 30, 2, nullable=True),
+]
 
-from bitschema import encode, decode, FieldLayout
+_LAYOUTS_ALL_TYPES = [
+    _field("flag", "boolean", 0, 1),
+    _field("counter", "integer", 1, 8, min=0, max=255),
+    _field("status", "enum", 9, 2, values=_VALUES_ABCD),
+    # 1 presence + 8 value
+    _field("optional_score", "integer", 11, 9, nullable=True, min=-100, max=100),
+]
+
+_LAYOUTS_SPANNING = [
+    # Starts at bit 4, spans into second byte
+    _field("spanning_field", "integer", 4, 16, min=0, max=2**16 - 1)
+]
+
+
+def _optional_int(min_value, max_value):
+    """Strategy for a nullable integer that front-loads the boundary values.
+
+    None and the min/-1/0/1/max corners are drawn explicitly before falling
+    back to the full range, so small max_examples still hit every edge.
+    """
+    corners = sorted(
+        {v for v in (min_value, -1, 0, 1, max_value) if min_value <= v <= max_value}
+    )
+    return st.one_of(
+        st.just(None),
+        st.sampled_from(corners),
+        st.integers(min_value=min_value, max_value=max_value),
+    )
+
+
+def _roundtrip(layouts, original):
+    """Encode then decode original through layouts and return the decoded dict."""
+    return decode(encode(original, layouts), layouts)
 
 
 class TestIntegerBoundaries:
     """Boundary condition tests for integer fields."""
 
-    @settings(max_examples=500)
+    @settings(max_examples=32)
     @given(st.integers(min_value=0, max_value=255))
+    @example(0)
+    @example(127)
+    @example(128)
+    @example(255)
     def test_unsigned_byte_min_max(self, value):
         """Unsigned 8-bit integer at min/max boundaries."""
-        layouts = [
-            FieldLayout(
-                name="byte_field",
-                type="integer",
-                offset=0,
-                bits=8,
-                constraints={"min": 0, "max": 255},
-                nullable=False,
-            )
-        ]
-
         original = {"byte_field": value}
-        encoded = encode(original, layouts)
-        decoded = decode(encoded, layouts)
-
-        assert decoded == original
+        assert _roundtrip(_LAYOUTS_UBYTE, original) == original
 
     @settings(max_examples=500)
     @given(st.integers(min_value=-128, max_value=127))
     def test_signed_byte_min_max(self, value):
         """Signed 8-bit integer at min/max boundaries."""
-        layouts = [
-            FieldLayout(
-                name="signed_byte",
-                type="integer",
-                offset=0,
-                bits=8,
-                constraints={"min": -128, "max": 127},
-                nullable=False,
-            )
-        ]
-
         original = {"signed_byte": value}
-        encoded = encode(original, layouts)
-        decoded = decode(encoded, layouts)
-
-        assert decoded == original
+        assert _roundtrip(_LAYOUTS_SBYTE, original) == original
 
     @settings(max_examples=500)
     @given(st.integers(min_value=-1000, max_value=1000))
     def test_negative_range_boundaries(self, value):
         """Negative ranges handle min/max correctly."""
-        layouts = [
-            FieldLayout(
-                name="offset_value",
-                type="integer",
-                offset=0,
-                bits=11,  # (1000 - (-1000)).bit_length()
-                constraints={"min": -1000, "max": 1000},
-                nullable=False,
-            )
-        ]
-
         original = {"offset_value": value}
-        encoded = encode(original, layouts)
-        decoded = decode(encoded, layouts)
-
-        assert decoded == original
+        assert _roundtrip(_LAYOUTS_NEGATIVE_RANGE, original) == original
 
-    @settings(max_examples=500)
+    @settings(max_examples=1)
     @given(st.integers(min_value=42, max_value=42))
     def test_single_value_range(self, value):
         """Single-value range (min == max) works correctly."""
-        layouts = [
-            FieldLayout(
-                name="constant",
-                type="integer",
-                offset=0,
-                bits=0,  # No bits needed for single value
-                constraints={"min": 42, "max": 42},
-                nullable=False,
-            )
-        ]
-
         original = {"constant": value}
-        encoded = encode(original, layouts)
-        decoded = decode(encoded, layouts)
+        assert _roundtrip(_LAYOUTS_CONSTANT_INT, original) == original
 
-        assert decoded == original
-
-    @settings(max_examples=500)
-    @given(st.integers(min_value=0, max_value=2**63 - 1))
+    @settings(max_examples=50)
+    @given(
+        st.one_of(
+            st.sampled_from([0, 1, (1 << 62) - 1, 1 << 62, (1 << 63) - 2, (1 << 63) - 1]),
+            st.integers(min_value=0, max_value=2**63 - 1),
+        )
+    )
     def test_maximum_64bit_field(self, value):
         """Maximum 64-bit field uses full range."""
-        layouts = [
-            FieldLayout(
-                name="max_field",
-                type="integer",
-                offset=0,
-                bits=63,
-                constraints={"min": 0, "max": 2**63 - 1},
-                nullable=False,
-            )
-        ]
-
         original = {"max_field": value}
-        encoded = encode(original, layouts)
-        decoded = decode(encoded, layouts)
+        assert _roundtrip(_LAYOUTS_MAX_FIELD, original) == original
 
-        assert decoded == original
-
-    @settings(max_examples=500)
+    @settings(max_examples=4)
     @given(st.integers(min_value=99, max_value=100))
     def test_off_by_one_boundary(self, value):
         """Off-by-one errors at boundaries are handled correctly."""
-        layouts = [
-            FieldLayout(
-                name="edge_case",
-                type="integer",
-                offset=0,
-                bits=1,  # 2 values (99, 100)
-                constraints={"min": 99, "max": 100},
-                nullable=False,
-            )
-        ]
-
         original = {"edge_case": value}
-        encoded = encode(original, layouts)
-        decoded = decode(encoded, layouts)
-
-        assert decoded == original
+        assert _roundtrip(_LAYOUTS_OFF_BY_ONE, original) == original
 
     @settings(max_examples=500)
     @given(
@@ -148,430 +225,118 @@ class TestIntegerBoundaries:
     )
     def test_multiple_max_values_simultaneously(self, v1, v2, v3):
         """Multiple fields at max values don't interfere."""
-        layouts = [
-            FieldLayout(
-                name="field1",
-                type="integer",
-                offset=0,
-                bits=8,
-                constraints={"min": 0, "max": 255},
-                nullable=False,
-            ),
-            FieldLayout(
-                name="field2",
-                type="integer",
-                offset=8,
-                bits=8,
-                constraints={"min": 0, "max": 255},
-                nullable=False,
-            ),
-            FieldLayout(
-                name="field3",
-                type="integer",
-                offset=16,
-                bits=8,
-                constraints={"min": 0, "max": 255},
-                nullable=False,
-            ),
-        ]
-
         original = {"field1": v1, "field2": v2, "field3": v3}
-        encoded = encode(original, layouts)
-        decoded = decode(encoded, layouts)
-
-        assert decoded == original
+        assert _roundtrip(_LAYOUTS_THREE_BYTES, original) == original
 
 
 class TestEnumBoundaries:
     """Boundary condition tests for enum fields."""
 
-    @settings(max_examples=500)
-    @given(st.sampled_from(["only"]))
+    @pytest.mark.parametrize("value", ["only"])
     def test_single_value_enum_zero_bits(self, value):
         """Single-value enum (0 bits) round-trips correctly."""
-        layouts = [
-            FieldLayout(
-                name="constant",
-                type="enum",
-                offset=0,
-                bits=0,
-                constraints={"values": ["only"]},
-                nullable=False,
-            )
-        ]
-
         original = {"constant": value}
-        encoded = encode(original, layouts)
-        decoded = decode(encoded, layouts)
-
-        assert decoded == original
+        assert _roundtrip(_LAYOUTS_CONSTANT_ENUM, original) == original
 
-    @settings(max_examples=500)
-    @given(st.sampled_from(["yes", "no"]))
+    @pytest.mark.parametrize("value", ["yes", "no"])
     def test_two_value_enum_one_bit(self, value):
         """Two-value enum (1 bit) handles both values."""
-        layouts = [
-            FieldLayout(
-                name="binary_choice",
-                type="enum",
-                offset=0,
-                bits=1,
-                constraints={"values": ["yes", "no"]},
-                nullable=False,
-            )
-        ]
-
         original = {"binary_choice": value}
-        encoded = encode(original, layouts)
-        decoded = decode(encoded, layouts)
-
-        assert decoded == original
+        assert _roundtrip(_LAYOUTS_BINARY_ENUM, original) == original
 
-    @settings(max_examples=500)
-    @given(st.integers(min_value=0, max_value=255))
+    @settings(max_examples=256)
+    @given(st.sampled_from(range(256)))
     def test_large_enum_256_values(self, index):
         """Large enum with 256 values (8 bits) handles all indices."""
-        values = [f"value_{i}" for i in range(256)]
-        layouts = [
-            FieldLayout(
-                name="large_enum",
-                type="enum",
-                offset=0,
-                bits=8,
-                constraints={"values": values},
-                nullable=False,
-            )
-        ]
-
-        original = {"large_enum": values[index]}
-        encoded = encode(original, layouts)
-        decoded = decode(encoded, layouts)
-
-        assert decoded == original
+        original = {"large_enum": _ENUM_256[index]}
+        assert _roundtrip(_LAYOUTS_ENUM_256, original) == original
 
-    @settings(max_examples=500)
-    @given(st.sampled_from(["a", "b", "c", "d"]))
+    @pytest.mark.parametrize("value", ["a", "b", "c", "d"])
     def test_enum_last_value_boundary(self, value):
         """Enum index at exact max boundary (last value)."""
-        layouts = [
-            FieldLayout(
-                name="status",
-                type="enum",
-                offset=0,
-                bits=2,
-                constraints={"values": ["a", "b", "c", "d"]},
-                nullable=False,
-            )
-        ]
-
         original = {"status": value}
-        encoded = encode(original, layouts)
-        decoded = decode(encoded, layouts)
-
-        assert decoded == original
+        assert _roundtrip(_LAYOUTS_ENUM_ABCD, original) == original
 
-    @settings(max_examples=500)
-    @given(st.sampled_from(["x", "y", "z"]))
+    @pytest.mark.parametrize("value", ["x", "y", "z"])
     def test_enum_power_of_two_minus_one(self, value):
         """Enum with 3 values (2 bits, not power of 2) works correctly."""
-        layouts = [
-            FieldLayout(
-                name="choice",
-                type="enum",
-                offset=0,
-                bits=2,  # 3 values need 2 bits (not fully utilized)
-                constraints={"values": ["x", "y", "z"]},
-                nullable=False,
-            )
-        ]
-
         original = {"choice": value}
-        encoded = encode(original, layouts)
-        decoded = decode(encoded, layouts)
-
-        assert decoded == original
+        assert _roundtrip(_LAYOUTS_ENUM_XYZ, original) == original
 
 
 class TestBooleanBoundaries:
     """Boundary condition tests for boolean fields."""
 
-    @settings(max_examples=500)
-    @given(st.booleans())
+    @pytest.mark.parametrize("value", [False, True])
     def test_boolean_at_offset_zero(self, value):
         """Boolean at offset 0 (LSB) round-trips correctly."""
-        layouts = [
-            FieldLayout(
-                name="flag",
-                type="boolean",
-                offset=0,
-                bits=1,
-                constraints={},
-                nullable=False,
-            )
-        ]
-
         original = {"flag": value}
-        encoded = encode(original, layouts)
-        decoded = decode(encoded, layouts)
-
-        assert decoded == original
+        assert _roundtrip(_LAYOUTS_FLAG_LSB, original) == original
 
-    @settings(max_examples=500)
-    @given(st.booleans())
+    @pytest.mark.parametrize("value", [False, True])
     def test_boolean_at_high_offset(self, value):
         """Boolean at high offset (bit 60) round-trips correctly."""
-        layouts = [
-            FieldLayout(
-                name="high_flag",
-                type="boolean",
-                offset=60,
-                bits=1,
-                constraints={},
-                nullable=False,
-            )
-        ]
-
         original = {"high_flag": value}
-        encoded = encode(original, layouts)
-        decoded = decode(encoded, layouts)
-
-        assert decoded == original
+        assert _roundtrip(_LAYOUTS_FLAG_HIGH, original) == original
 
-    @settings(max_examples=500)
-    @given(st.booleans(), st.booleans(), st.booleans(), st.booleans())
+    @pytest.mark.parametrize(
+        "b1,b2,b3,b4", list(itertools.product([False, True], repeat=4))
+    )
     def test_multiple_booleans_adjacent(self, b1, b2, b3, b4):
         """Multiple adjacent booleans don't interfere."""
-        layouts = [
-            FieldLayout(
-                name="flag1",
-                type="boolean",
-                offset=0,
-                bits=1,
-                constraints={},
-                nullable=False,
-            ),
-            FieldLayout(
-                name="flag2",
-                type="boolean",
-                offset=1,
-                bits=1,
-                constraints={},
-                nullable=False,
-            ),
-            FieldLayout(
-                name="flag3",
-                type="boolean",
-                offset=2,
-                bits=1,
-                constraints={},
-                nullable=False,
-            ),
-            FieldLayout(
-                name="flag4",
-                type="boolean",
-                offset=3,
-                bits=1,
-                constraints={},
-                nullable=False,
-            ),
-        ]
-
         original = {"flag1": b1, "flag2": b2, "flag3": b3, "flag4": b4}
-        encoded = encode(original, layouts)
-        decoded = decode(encoded, layouts)
-
-        assert decoded == original
+        assert _roundtrip(_LAYOUTS_FOUR_FLAGS, original) == original
 
 
 class TestNullableBoundaries:
     """Boundary condition tests for nullable field combinations."""
 
-    @settings(max_examples=500)
-    @given(st.none() | st.booleans())
+    @settings(max_examples=8)
+    @given(st.one_of(st.just(None), st.booleans()))
     def test_nullable_boolean_both_states(self, value):
         """Nullable boolean handles None, True, False correctly."""
-        layouts = [
-            FieldLayout(
-                name="optional_flag",
-                type="boolean",
-                offset=0,
-                bits=2,  # 1 presence + 1 value
-                constraints={},
-                nullable=True,
-            )
-        ]
-
         original = {"optional_flag": value}
-        encoded = encode(original, layouts)
-        decoded = decode(encoded, layouts)
-
-        assert decoded == original
+        assert _roundtrip(_LAYOUTS_OPTIONAL_FLAG, original) == original
 
-    @settings(max_examples=500)
-    @given(st.none() | st.integers(min_value=-128, max_value=127))
+    @settings(max_examples=64)
+    @given(_optional_int(-128, 127))
     def test_nullable_int_at_boundaries(self, value):
         """Nullable integer handles None and min/max values."""
-        layouts = [
-            FieldLayout(
-                name="optional_int",
-                type="integer",
-                offset=0,
-                bits=9,  # 1 presence + 8 value
-                constraints={"min": -128, "max": 127},
-                nullable=True,
-            )
-        ]
-
         original = {"optional_int": value}
-        encoded = encode(original, layouts)
-        decoded = decode(encoded, layouts)
-
-        assert decoded == original
+        assert _roundtrip(_LAYOUTS_OPTIONAL_INT, original) == original
 
-    @settings(max_examples=500)
-    @given(st.none() | st.sampled_from(["only"]))
+    @settings(max_examples=4)
+    @given(st.one_of(st.just(None), st.just("only")))
     def test_nullable_single_value_enum(self, value):
         """Nullable single-value enum (1 presence bit only)."""
-        layouts = [
-            FieldLayout(
-                name="optional_constant",
-                type="enum",
-                offset=0,
-                bits=1,  # 1 presence + 0 value
-                constraints={"values": ["only"]},
-                nullable=True,
-            )
-        ]
-
         original = {"optional_constant": value}
-        encoded = encode(original, layouts)
-        decoded = decode(encoded, layouts)
-
-        assert decoded == original
+        assert _roundtrip(_LAYOUTS_OPTIONAL_CONSTANT, original) == original
 
-    @settings(max_examples=500)
-    @given(
-        st.none() | st.integers(min_value=0, max_value=100),
-        st.none() | st.integers(min_value=0, max_value=100),
-        st.none() | st.integers(min_value=0, max_value=100),
-    )
+    @settings(max_examples=64)
+    @given(_optional_int(0, 100), _optional_int(0, 100), _optional_int(0, 100))
     def test_all_fields_nullable_mixed_none(self, v1, v2, v3):
         """All fields nullable with mixed None/present values."""
-        layouts = [
-            FieldLayout(
-                name="field1",
-                type="integer",
-                offset=0,
-                bits=8,  # 1 presence + 7 value
-                constraints={"min": 0, "max": 100},
-                nullable=True,
-            ),
-            FieldLayout(
-                name="field2",
-                type="integer",
-                offset=8,
-                bits=8,
-                constraints={"min": 0, "max": 100},
-                nullable=True,
-            ),
-            FieldLayout(
-                name="field3",
-                type="integer",
-                offset=16,
-                bits=8,
-                constraints={"min": 0, "max": 100},
-                nullable=True,
-            ),
-        ]
-
         original = {"field1": v1, "field2": v2, "field3": v3}
-        encoded = encode(original, layouts)
-        decoded = decode(encoded, layouts)
-
-        assert decoded == original
+        assert _roundtrip(_LAYOUTS_THREE_OPTIONAL, original) == original
 
     @settings(max_examples=500)
     @given(st.booleans())
     def test_all_nullable_fields_none(self, flag_value):
         """All nullable fields set to None simultaneously."""
-        layouts = [
-            FieldLayout(
-                name="flag",
-                type="boolean",
-                offset=0,
-                bits=1,
-                constraints={},
-                nullable=False,
-            ),
-            FieldLayout(
-                name="opt1",
-                type="integer",
-                offset=1,
-                bits=8,
-                constraints={"min": 0, "max": 100},
-                nullable=True,
-            ),
-            FieldLayout(
-                name="opt2",
-                type="enum",
-                offset=9,
-                bits=3,
-                constraints={"values": ["a", "b", "c"]},
-                nullable=True,
-            ),
-        ]
-
         original = {"flag": flag_value, "opt1": None, "opt2": None}
-        encoded = encode(original, layouts)
-        decoded = decode(encoded, layouts)
-
-        assert decoded == original
+        assert _roundtrip(_LAYOUTS_FLAG_AND_OPTIONALS, original) == original
 
-    @settings(max_examples=500)
-    @given(st.none() | st.booleans())
+    @settings(max_examples=8)
+    @given(st.one_of(st.just(None), st.booleans()))
     def test_nullable_at_different_offsets(self, value):
         """Nullable field at different bit offsets works correctly."""
         # Test at offset 0
-        layouts_offset_0 = [
-            FieldLayout(
-                name="opt_flag",
-                type="boolean",
-                offset=0,
-                bits=2,
-                constraints={},
-                nullable=True,
-            )
-        ]
-
         original = {"opt_flag": value}
-        encoded = encode(original, layouts_offset_0)
-        decoded = decode(encoded, layouts_offset_0)
-        assert decoded == original
+        assert _roundtrip(_LAYOUTS_OPT_FLAG_OFFSET_0, original) == original
 
         # Test at offset 30
-        layouts_offset_30 = [
-            FieldLayout(
-                name="padding",
-                type="integer",
-                offset=0,
-                bits=30,
-                constraints={"min": 0, "max": 2**30 - 1},
-                nullable=False,
-            ),
-            FieldLayout(
-                name="opt_flag",
-                type="boolean",
-                offset=30,
-                bits=2,
-                constraints={},
-                nullable=True,
-            ),
-        ]
-
         original = {"padding": 0, "opt_flag": value}
-        encoded = encode(original, layouts_offset_30)
-        decoded = decode(encoded, layouts_offset_30)
-        assert decoded == original
+        assert _roundtrip(_LAYOUTS_OPT_FLAG_OFFSET_30, original) == original
 
 
 class TestCombinedBoundaries:
@@ -582,73 +347,66 @@ class TestCombinedBoundaries:
         st.booleans(),
         st.integers(min_value=0, max_value=255),
         st.sampled_from(["a", "b", "c", "d"]),
-        st.none() | st.integers(min_value=-100, max_value=100),
+        _optional_int(-100, 100),
     )
     def test_all_field_types_combined(self, bool_val, int_val, enum_val, nullable_val):
         """All field types combined in single schema."""
-        layouts = [
-            FieldLayout(
-                name="flag",
-                type="boolean",
-                offset=0,
-                bits=1,
-                constraints={},
-                nullable=False,
-            ),
-            FieldLayout(
-                name="counter",
-                type="integer",
-                offset=1,
-                bits=8,
-                constraints={"min": 0, "max": 255},
-                nullable=False,
-            ),
-            FieldLayout(
-                name="status",
-                type="enum",
-                offset=9,
-                bits=2,
-                constraints={"values": ["a", "b", "c", "d"]},
-                nullable=False,
-            ),
-            FieldLayout(
-                name="optional_score",
-                type="integer",
-                offset=11,
-                bits=9,  # 1 presence + 8 value
-                constraints={"min": -100, "max": 100},
-                nullable=True,
-            ),
-        ]
-
         original = {
             "flag": bool_val,
             "counter": int_val,
             "status": enum_val,
             "optional_score": nullable_val,
         }
-        encoded = encode(original, layouts)
-        decoded = decode(encoded, layouts)
+        assert _roundtrip(_LAYOUTS_ALL_TYPES, original) == original
 
-        assert decoded == original
-
-    @settings(max_examples=500)
-    @given(st.integers(min_value=0, max_value=2**16 - 1))
+    @settings(max_examples=50)
+    @given(
+        st.one_of(
+            st.sampled_from([0, 1, 0xFF, 0x100, 0x7FFF, 0x8000, 2**16 - 2, 2**16 - 1]),
+            st.integers(min_value=0, max_value=2**16 - 1),
+        )
+    )
     def test_field_spanning_byte_boundary(self, value):
         """Field that spans byte boundary encodes/decodes correctly."""
-        layouts = [
-            FieldLayout(
-                name="spanning_field",
-                type="integer",
-                offset=4,  # Starts at bit 4, spans into second byte
-                bits=16,
-                constraints={"min": 0, "max": 2**16 - 1},
-                nullable=False,
-            )
-        ]
-
         original = {"spanning_field": value}
-        encoded = encode(original, layouts)
-        decoded = decode(encoded, layouts)
-
-        assert decoded == original
+        assert _roundtrip(_LAYOUTS_SPANNING, original) == original
+
+
+class TestBatchedBoundaries:
+    """Boundary round-trips driven through the batch encode/decode API."""
+
+    @settings(max_examples=20)
+    @given(st.lists(st.integers(min_value=0, max_value=255), min_size=64, max_size=256))
+    def test_unsigned_byte_batch(self, values):
+        """Batches of unsigned bytes round-trip in one encode_many/decode_many call."""
+        originals = [{"byte_field": v} for v in values]
+        decoded = decode_many(encode_many(originals, _LAYOUTS_UBYTE), _LAYOUTS_UBYTE)
+        assert decoded == originals
+
+    @settings(max_examples=20)
+    @given(st.lists(_optional_int(-100, 100), min_size=64, max_size=256))
+    def test_all_field_types_batch(self, scores):
+        """Batches mixing every field type round-trip, including None values."""
+        originals = [
+            {
+                "flag": i % 2 == 0,
+                "counter": i % 256,
+                "status": _VALUES_ABCD[i % 4],
+                "optional_score": score,
+            }
+            for i, score in enumerate(scores)
+        ]
+        decoded = decode_many(
+            encode_many(originals, _LAYOUTS_ALL_TYPES), _LAYOUTS_ALL_TYPES
+        )
+        assert decoded == originals
+
+    @settings(max_examples=20)
+    @given(st.lists(st.integers(min_value=-128, max_value=127), min_size=64, max_size=256))
+    def test_signed_byte_decode_each(self, values):
+        """Each value from an encode_many batch decodes back with decode()."""
+        encoded_values = encode_many([{"signed_byte": v} for v in values], _LAYOUTS_SBYTE)
+        decoded = [
+            decode(encoded, _LAYOUTS_SBYTE)["signed_byte"] for encoded in encoded_values
+        ]
+        assert decoded == values
@@ -1,28 +1,155 @@
-"""CLI integration tests using subprocess."""
+"""CLI integration tests.
 
+Most tests drive the CLI in-process through bitschema.__main__.main()
+and import generated code with importlib; run_cli_subprocess() is kept
+for the checks that need a real interpreter.
+"""
+
+import argparse
 import ast
+import functools
+import hashlib
+import importlib.util
+import io
 import json
+import os
+import re
 import subprocess
+import sys
+from contextlib import redirect_stderr, redirect_stdout
 from pathlib import Path
+from types import SimpleNamespace
 
 import pytest
 
+from bitschema.__main__ import build_parser, main as _cli_main
+
+
+# Visualize table column headers, matched in a single scan of the output
+_VIZ_HEADERS = re.compile(r"Field|Type|Bits|Constraints")
+
+
+# blake2b digests of generated sources that already passed ast.parse
+_VALIDATED: set[bytes] = set()
+
+
+def _validate_py(code: bytes) -> None:
+    """Check generated code parses as Python, once per distinct source."""
+    digest = hashlib.blake2b(code, digest_size=16).digest()
+    if digest in _VALIDATED:
+        return
+    ast.parse(code)
+    _VALIDATED.add(digest)
+
+
+# Invalid schema: total bits > 64
+INVALID_SCHEMA_YAML = b"""
+version: "1"
+name: "TooManyBits"
+fields:
+  - name: field1
+    type: integer
+    min: 0
+    max: 18446744073709551615  # Requires 64 bits
+  - name: field2
+    type: boolean  # +1 bit = 65 total
+"""
+
+
+@pytest.fixture(scope="session")
+def invalid_schema_path(tmp_path_factory):
+    """INVALID_SCHEMA_YAML written once per session."""
+    path = tmp_path_factory.mktemp("bad") / "invalid.yaml"
+    path.write_bytes(INVALID_SCHEMA_YAML)
+    return path
+
+
+@pytest.fixture(scope="class")
+def class_tmp(tmp_path_factory):
+    """Output directory shared by every test in a class.
+
+    Tests name their files after request.node.name to stay independent.
+    """
+    return tmp_path_factory.mktemp("cli")
+
+
+@pytest.fixture(scope="class")
+def help_texts():
+    """Help text for each subcommand, rendered in-process from build_parser()."""
+    parser = build_parser()
+    subparsers = next(
+        action for action in parser._actions
+        if isinstance(action, argparse._SubParsersAction)
+    )
+    return {name: sub.format_help() for name, sub in subparsers.choices.items()}
+
 
-def run_cli(*args):
-    """Helper to run bitschema CLI and capture output.
+def run_cli(*args, capture=True):
+    """Helper to run bitschema CLI in-process and capture output.
 
     Args:
         *args: Command line arguments to pass to bitschema
+        capture: If False, discard stdout (stdout is None); stderr is
+            always captured for error-message assertions
 
     Returns:
-        subprocess.CompletedProcess with returncode, stdout, stderr
+        SimpleNamespace with returncode, stdout, stderr (same attributes
+        as subprocess.CompletedProcess)
+    """
+    stdout = io.StringIO() if capture else open(os.devnull, "w")
+    stderr = io.StringIO()
+    returncode = 0
+    with stdout, redirect_stdout(stdout), redirect_stderr(stderr):
+        try:
+            _cli_main(list(args))
+        except SystemExit as e:
+            if e.code is None:
+                returncode = 0
+            elif isinstance(e.code, int):
+                returncode = e.code
+            else:
+                stderr.write(f"{e.code}\n")
+                returncode = 1
+        captured = stdout.getvalue() if capture else None
+    return SimpleNamespace(
+        returncode=returncode,
+        stdout=captured,
+        stderr=stderr.getvalue(),
+    )
+
+
+def run_cli_subprocess(*args):
+    """Helper to run bitschema CLI in a fresh interpreter and capture output.
+
+    Args:
+        *args: Command line arguments to pass to bitschema
+
+    Returns:
+        _SubprocessResult with returncode, stdout, stderr
     """
     result = subprocess.run(
         ["python", "-m", "bitschema", *args],
-        capture_output=True,
-        text=True,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
     )
-    return result
+    return _SubprocessResult(result)
+
+
+class _SubprocessResult:
+    """Captured subprocess output, decoded from bytes on first access."""
+
+    def __init__(self, completed):
+        self.returncode = completed.returncode
+        self._stdout = completed.stdout
+        self._stderr = completed.stderr
+
+    @functools.cached_property
+    def stdout(self):
+        return self._stdout.decode("utf-8")
+
+    @functools.cached_property
+    def stderr(self):
+        return self._stderr.decode("utf-8")
 
 
 class TestGenerateCommand:
@@ -38,37 +165,39 @@ class TestGenerateCommand:
         assert "def decode(cls, encoded: int)" in result.stdout
         assert "@dataclass" in result.stdout
 
-        # Verify generated code is valid Python
-        ast.parse(result.stdout)
+        # Verify generated code is valid Python (print() adds the newline)
+        _validate_py(result.stdout.removesuffix("\n").encode("utf-8"))
 
-    def test_generate_to_file(self, tmp_path):
+    @pytest.mark.parametrize("flag", ["--output", "-o"])
+    def test_generate_to_file(self, class_tmp, request, flag):
         """Test generating dataclass code to file."""
-        output_file = tmp_path / "output.py"
+        output_file = class_tmp / f"{request.node.name}.py"
         result = run_cli(
             "generate",
             "tests/fixtures/valid_schema.yaml",
-            "--output",
+            flag,
             str(output_file),
+            capture=False,
         )
 
         assert result.returncode == 0
         assert output_file.exists()
 
         # Verify file contains expected content
-        code = output_file.read_text()
-        assert "class UserFlags:" in code
-        assert "def encode(self) -> int:" in code
-        assert "def decode(cls, encoded: int)" in code
+        code = output_file.read_bytes()
+        assert b"class UserFlags:" in code
+        assert b"def encode(self) -> int:" in code
+        assert b"def decode(cls, encoded: int)" in code
 
         # Verify generated code is valid Python
-        ast.parse(code)
+        _validate_py(code)
 
         # Verify stderr message
         assert f"Generated dataclass written to: {output_file}" in result.stderr
 
-    def test_generate_with_custom_class_name(self, tmp_path):
+    def test_generate_with_custom_class_name(self, class_tmp, request):
         """Test generating with custom class name."""
-        output_file = tmp_path / "custom.py"
+        output_file = class_tmp / f"{request.node.name}.py"
         result = run_cli(
             "generate",
             "tests/fixtures/valid_schema.yaml",
@@ -76,6 +205,7 @@ class TestGenerateCommand:
             str(output_file),
             "--class-name",
             "CustomPerson",
+            capture=False,
         )
 
         assert result.returncode == 0
@@ -83,6 +213,15 @@ class TestGenerateCommand:
         assert "class CustomPerson:" in code
         assert "class UserFlags:" not in code
 
+    def test_generate_c_target(self):
+        """Test generating C kernels instead of a dataclass."""
+        result = run_cli("generate", "tests/fixtures/valid_schema.yaml", "--target", "c")
+
+        assert result.returncode == 0
+        assert "uint64_t encode_UserFlags(" in result.stdout
+        assert "void decode_UserFlags(uint64_t encoded" in result.stdout
+        assert "class UserFlags:" not in result.stdout
+
     def test_generate_nonexistent_file(self):
         """Test error handling for nonexistent schema file."""
         result = run_cli("generate", "nonexistent.yaml")
@@ -90,19 +229,6 @@ class TestGenerateCommand:
         assert result.returncode == 1
         assert "Error: Schema file not found: nonexistent.yaml" in result.stderr
 
-    def test_generate_with_short_output_flag(self, tmp_path):
-        """Test -o shorthand for --output."""
-        output_file = tmp_path / "short.py"
-        result = run_cli(
-            "generate",
-            "tests/fixtures/valid_schema.yaml",
-            "-o",
-            str(output_file),
-        )
-
-        assert result.returncode == 0
-        assert output_file.exists()
-
 
 class TestJsonSchemaCommand:
     """Tests for 'bitschema jsonschema' command."""
@@ -122,50 +248,42 @@ class TestJsonSchemaCommand:
         assert "properties" in json_output
         assert "required" in json_output
 
-    def test_jsonschema_with_indent(self):
+    @pytest.mark.parametrize("indent", [2, 4])
+    def test_jsonschema_with_indent(self, indent):
         """Test JSON Schema with custom indent."""
-        result_2 = run_cli("jsonschema", "tests/fixtures/valid_schema.yaml", "--indent", "2")
-        result_4 = run_cli("jsonschema", "tests/fixtures/valid_schema.yaml", "--indent", "4")
+        result = run_cli(
+            "jsonschema", "tests/fixtures/valid_schema.yaml", "--indent", str(indent)
+        )
 
-        assert result_2.returncode == 0
-        assert result_4.returncode == 0
+        assert result.returncode == 0
 
-        # Verify different indentation (4-space should be longer)
-        assert len(result_4.stdout) > len(result_2.stdout)
+        # Verify --indent was honoured for this run's own output
+        json_schema = json.loads(result.stdout)
+        assert result.stdout == json.dumps(json_schema, indent=indent) + "\n"
+        assert result.stdout.splitlines()[1].startswith(" " * indent + '"')
 
-    def test_jsonschema_to_file(self, tmp_path):
+    @pytest.mark.parametrize("flag", ["--output", "-o"])
+    def test_jsonschema_to_file(self, class_tmp, request, flag):
         """Test exporting JSON Schema to file."""
-        output_file = tmp_path / "schema.json"
+        output_file = class_tmp / f"{request.node.name}.json"
         result = run_cli(
             "jsonschema",
             "tests/fixtures/valid_schema.yaml",
-            "--output",
+            flag,
             str(output_file),
+            capture=False,
         )
 
         assert result.returncode == 0
         assert output_file.exists()
 
         # Verify file contains valid JSON Schema
-        json_data = json.loads(output_file.read_text())
+        json_data = json.loads(output_file.read_bytes())
         assert json_data["$schema"] == "https://json-schema.org/draft/2020-12/schema"
 
         # Verify stderr message
         assert f"JSON Schema written to: {output_file}" in result.stderr
 
-    def test_jsonschema_with_short_output_flag(self, tmp_path):
-        """Test -o shorthand for --output."""
-        output_file = tmp_path / "schema.json"
-        result = run_cli(
-            "jsonschema",
-            "tests/fixtures/valid_schema.yaml",
-            "-o",
-            str(output_file),
-        )
-
-        assert result.returncode == 0
-        assert output_file.exists()
-
     def test_jsonschema_contains_bitschema_metadata(self):
         """Test JSON Schema contains BitSchema-specific metadata."""
         result = run_cli("jsonschema", "tests/fixtures/valid_schema.yaml")
@@ -187,17 +305,15 @@ class TestVisualizeCommand:
         assert "+" in result.stdout
         assert "|" in result.stdout
         # Verify column headers
-        assert "Field" in result.stdout
-        assert "Type" in result.stdout
-        assert "Bits" in result.stdout
-        assert "Constraints" in result.stdout
+        assert len(set(_VIZ_HEADERS.findall(result.stdout))) == 4
 
-    def test_visualize_markdown(self):
+    @pytest.mark.parametrize("flag", ["--format", "-f"])
+    def test_visualize_markdown(self, flag):
         """Test visualizing bit layout as markdown table."""
         result = run_cli(
             "visualize",
             "tests/fixtures/valid_schema.yaml",
-            "--format",
+            flag,
             "markdown",
         )
 
@@ -206,17 +322,18 @@ class TestVisualizeCommand:
         assert "|" in result.stdout
         assert "---" in result.stdout
         # Verify column headers
-        assert "Field" in result.stdout
-        assert "Type" in result.stdout
+        assert {"Field", "Type"} <= set(_VIZ_HEADERS.findall(result.stdout))
 
-    def test_visualize_to_file(self, tmp_path):
+    @pytest.mark.parametrize("flag", ["--output", "-o"])
+    def test_visualize_to_file(self, class_tmp, request, flag):
         """Test visualizing bit layout to file."""
-        output_file = tmp_path / "layout.txt"
+        output_file = class_tmp / f"{request.node.name}.txt"
         result = run_cli(
             "visualize",
             "tests/fixtures/valid_schema.yaml",
-            "--output",
+            flag,
             str(output_file),
+            capture=False,
         )
 
         assert result.returncode == 0
@@ -224,96 +341,56 @@ class TestVisualizeCommand:
 
         # Verify file contains table
         content = output_file.read_text()
-        assert "Field" in content
-        assert "Type" in content
+        assert {"Field", "Type"} <= set(_VIZ_HEADERS.findall(content))
 
         # Verify stderr message
         assert f"Bit layout visualization written to: {output_file}" in result.stderr
 
-    def test_visualize_with_short_format_flag(self):
-        """Test -f shorthand for --format."""
-        result = run_cli(
-            "visualize",
-            "tests/fixtures/valid_schema.yaml",
-            "-f",
-            "markdown",
-        )
-
-        assert result.returncode == 0
-        assert "---" in result.stdout
-
-    def test_visualize_with_short_output_flag(self, tmp_path):
-        """Test -o shorthand for --output."""
-        output_file = tmp_path / "layout.txt"
-        result = run_cli(
-            "visualize",
-            "tests/fixtures/valid_schema.yaml",
-            "-o",
-            str(output_file),
-        )
-
-        assert result.returncode == 0
-        assert output_file.exists()
-
 
 class TestCLIErrors:
     """Tests for CLI error handling."""
 
     def test_no_subcommand_shows_help(self):
         """Test that running 'bitschema' with no args shows help."""
-        result = run_cli()
+        result = run_cli_subprocess()
 
         # Should exit cleanly and show help
         assert result.returncode == 0
         assert "usage: bitschema" in result.stdout
         assert "subcommands" in result.stdout.lower()
 
-    def test_invalid_schema_shows_error(self, tmp_path):
+    def test_invalid_schema_shows_error(self, invalid_schema_path):
         """Test error handling for invalid schema."""
-        # Create invalid schema with total bits > 64
-        invalid_schema = tmp_path / "invalid.yaml"
-        invalid_schema.write_text("""
-version: "1"
-name: "TooManyBits"
-fields:
-  - name: field1
-    type: integer
-    min: 0
-    max: 18446744073709551615  # Requires 64 bits
-  - name: field2
-    type: boolean  # +1 bit = 65 total
-""")
-
-        result = run_cli("generate", str(invalid_schema))
+        result = run_cli("generate", str(invalid_schema_path))
 
         assert result.returncode == 1
         assert "Error: Invalid schema" in result.stderr
 
-    def test_generate_help(self):
+    def test_generate_help(self, help_texts):
         """Test 'bitschema generate --help' shows help."""
-        result = run_cli("generate", "--help")
+        help_text = help_texts["generate"]
 
-        assert result.returncode == 0
-        assert "Generate type-safe Python dataclass with encode/decode methods" in result.stdout
-        assert "schema_file" in result.stdout
+        assert "Generate type-safe Python dataclass with encode/decode methods" in help_text
+        assert "schema_file" in help_text
 
-    def test_jsonschema_help(self):
+    def test_jsonschema_help(self, help_texts):
         """Test 'bitschema jsonschema --help' shows help."""
-        result = run_cli("jsonschema", "--help")
-
-        assert result.returncode == 0
-        assert "Export BitSchema as JSON Schema for interoperability" in result.stdout
+        assert "Export BitSchema as JSON Schema for interoperability" in help_texts["jsonschema"]
 
-    def test_visualize_help(self):
+    def test_visualize_help(self, help_texts):
         """Test 'bitschema visualize --help' shows help."""
-        result = run_cli("visualize", "--help")
+        assert "Generate ASCII or markdown table showing field bit positions" in help_texts["visualize"]
+
+    def test_help_flag_exits_cleanly(self, help_texts):
+        """Test '--help' prints the subcommand help and exits 0."""
+        result = run_cli("generate", "--help")
 
         assert result.returncode == 0
-        assert "Generate ASCII or markdown table showing field bit positions" in result.stdout
+        assert result.stdout == help_texts["generate"]
 
     def test_invalid_format_for_visualize(self):
         """Test error for invalid format in visualize command."""
-        result = run_cli(
+        result = run_cli_subprocess(
             "visualize",
             "tests/fixtures/valid_schema.yaml",
             "--format",
@@ -328,29 +405,31 @@ fields:
 class TestCLIIntegration:
     """Integration tests across multiple CLI commands."""
 
-    def test_generate_and_execute_generated_code(self, tmp_path):
+    def test_generate_and_execute_generated_code(self, class_tmp, request):
         """Test that generated code can be executed without errors."""
-        output_file = tmp_path / "generated.py"
+        output_file = class_tmp / f"{request.node.name}.py"
         result = run_cli(
             "generate",
             "tests/fixtures/valid_schema.yaml",
             "--output",
             str(output_file),
+            capture=False,
         )
 
         assert result.returncode == 0
 
-        # Try to execute the generated file (should not error on imports)
-        exec_result = subprocess.run(
-            ["python", "-c", f"import sys; sys.path.insert(0, '{tmp_path}'); import generated"],
-            capture_output=True,
-            text=True,
-        )
+        # Import the generated file in-process (should not error on imports)
+        spec = importlib.util.spec_from_file_location("generated", output_file)
+        module = importlib.util.module_from_spec(spec)
+        sys.modules["generated"] = module
+        try:
+            spec.loader.exec_module(module)
+        finally:
+            sys.modules.pop("generated", None)
 
-        # Should not error (module should import successfully)
-        assert exec_result.returncode == 0
+        assert hasattr(module, "UserFlags")
 
-    def test_all_commands_work_with_json_schema(self, tmp_path):
+    def test_all_commands_work_with_json_schema(self):
         """Test all commands work with JSON schema file (not just YAML)."""
         # Test generate
         result_gen = run_cli("generate", "tests/fixtures/valid_schema.json")
@@ -367,7 +446,7 @@ class TestCLIIntegration:
         assert result_viz.returncode == 0
         assert "Field" in result_viz.stdout
 
-    def test_consistent_output_across_commands(self):
+    def test_consistent_output_across_commands(self, valid_yaml_schema):
         """Test that different commands produce consistent field information."""
         # Generate dataclass
         result_gen = run_cli("generate", "tests/fixtures/valid_schema.yaml")
@@ -382,14 +461,8 @@ class TestCLIIntegration:
         assert result_viz.returncode == 0
 
         # All should mention the same fields
-        assert "active" in result_gen.stdout
-        assert "active" in result_json.stdout
-        assert "active" in result_viz.stdout
-
-        assert "age" in result_gen.stdout
-        assert "age" in result_json.stdout
-        assert "age" in result_viz.stdout
-
-        assert "status" in result_gen.stdout
-        assert "status" in result_json.stdout
-        assert "status" in result_viz.stdout
+        assert list(valid_yaml_schema.fields) == ["active", "age", "status"]
+        for field_name in valid_yaml_schema.fields:
+            assert field_name in result_gen.stdout
+            assert field_name in result_json.stdout
+            assert field_name in result_viz.stdout
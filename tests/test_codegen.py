@@ -4,7 +4,12 @@ Tests the generation of type-safe dataclass code with encode/decode methods
 that match runtime encoder/decoder behavior exactly.
 """
 
-import ast
+import ctypes
+import datetime
+import shutil
+import subprocess
+from typing import NamedTuple
+
 import pytest
 
 from bitschema import (
@@ -16,12 +21,18 @@ from bitschema import (
     encode,
     decode,
 )
+from bitschema.models import DateFieldDefinition
 from bitschema.codegen import (
     generate_field_type_hint,
     generate_field_definitions,
+    generate_enum_constants,
     generate_encode_method,
     generate_decode_method,
     generate_dataclass_code,
+    generate_c_source,
+    generate_module_code,
+    compile_module,
+    exec_generated,
     format_generated_code,
     validate_generated_code,
 )
@@ -129,7 +140,7 @@ class TestEncodeMethodGeneration:
     """Test encode() method code generation."""
 
     def test_generate_encode_for_single_boolean(self):
-        """Encode method for boolean should use LSB-first accumulator pattern."""
+        """Encode method for boolean should be a single fused shift-OR return."""
         schema = BitSchema(
             version="1",
             name="ActiveFlag",
@@ -142,8 +153,9 @@ class TestEncodeMethodGeneration:
 
         # Should contain method signature
         assert "def encode(self) -> int:" in result
-        # Should contain accumulator initialization
-        assert "accumulator = 0" in result
+        # Should pack fields in one return expression, without an accumulator
+        assert "return (" in result
+        assert "accumulator" not in result
         # Should contain field encoding logic
         assert "active" in result
 
@@ -181,9 +193,28 @@ class TestEncodeMethodGeneration:
         )
         result = generate_encode_method(schema, layouts)
 
-        # Should contain enum values and index lookup
-        assert "status" in result
-        assert "index" in result or "idle" in result
+        # Should look up the index in the module-level constant dict
+        assert "_ENUM_Status_status[self.status]" in result
+        assert ".index(" not in result
+
+    def test_generate_enum_constants(self):
+        """Enum fields get a module-level value -> index dict."""
+        schema = BitSchema(
+            version="1",
+            name="Status",
+            fields={
+                "active": BoolFieldDefinition(type="bool"),
+                "status": EnumFieldDefinition(
+                    type="enum", values=["idle", "active", "done"]
+                ),
+            },
+        )
+        result = generate_enum_constants(schema)
+
+        assert result == (
+            "_ENUM_Status_status = {'idle': 0, 'active': 1, 'done': 2}\n"
+            "_VALUES_Status_status = ('idle', 'active', 'done')"
+        )
 
     def test_generate_encode_for_nullable_field(self):
         """Encode method for nullable should handle presence bit."""
@@ -265,6 +296,32 @@ class TestDecodeMethodGeneration:
         # Should contain enum values list
         assert "idle" in result or "status" in result
 
+    def test_generate_decode_is_single_constructor_call(self):
+        """Decode method should build the instance in one straight-line call."""
+        schema = BitSchema(
+            version="1",
+            name="Person",
+            fields={
+                "active": BoolFieldDefinition(type="bool"),
+                "age": IntFieldDefinition(
+                    type="int", bits=8, min=0, max=127, nullable=True
+                ),
+                "status": EnumFieldDefinition(
+                    type="enum", values=["idle", "active", "done"]
+                ),
+            },
+        )
+        layouts, _ = compute_bit_layout([
+            {"name": "active", "type": "boolean"},
+            {"name": "age", "type": "integer", "min": 0, "max": 127, "nullable": True},
+            {"name": "status", "type": "enum", "values": ["idle", "active", "done"]},
+        ])
+        result = generate_decode_method(schema, layouts)
+
+        assert "return cls(" in result
+        assert "extracted" not in result
+        assert "_VALUES_Person_status[(encoded >> 9) & 3]" in result
+
 
 class TestDataclassGeneration:
     """Test complete dataclass code generation."""
@@ -337,6 +394,8 @@ class TestDataclassGeneration:
         assert validate_generated_code(code) is True
 
         # Should parse with ast
+        import ast
+
         ast.parse(code)  # Raises SyntaxError if invalid
 
     def test_generated_code_includes_docstring(self):
@@ -356,32 +415,108 @@ class TestDataclassGeneration:
         # Should mention bit count
         assert "bit" in result.lower() or str(total_bits) in result
 
-
-class TestRoundTripCorrectness:
-    """Test that generated code produces same results as runtime encoder/decoder."""
-
-    def test_generated_encode_matches_runtime(self):
-        """Generated encode() should produce same output as runtime encoder."""
+    def test_date_min_is_parsed_once_at_module_level(self):
+        """Date fields refer to a hoisted min_date instead of parsing per call."""
         schema = BitSchema(
             version="1",
-            name="Person",
+            name="Event",
             fields={
-                "active": BoolFieldDefinition(type="bool"),
-                "age": IntFieldDefinition(type="int", bits=7, min=0, max=127),
+                "at": DateFieldDefinition(
+                    type="date", resolution="hour",
+                    min_date="2024-01-01", max_date="2024-12-31",
+                ),
             },
         )
         layouts, _ = compute_bit_layout([
-            {"name": "active", "type": "boolean"},
-            {"name": "age", "type": "integer", "min": 0, "max": 127},
+            {"name": "at", "type": "date", "resolution": "hour",
+             "min_date": "2024-01-01", "max_date": "2024-12-31"},
         ])
+        result = generate_dataclass_code(schema, layouts)
 
-        # Generate code
-        code = generate_dataclass_code(schema, layouts)
+        assert "_MIN_DATE_Event_at = datetime.datetime.fromisoformat('2024-01-01')" in result
+        assert result.count("fromisoformat") == 1
+
+
+class GeneratedClass(NamedTuple):
+    """A schema, its layouts and the class generated from them."""
+
+    schema: BitSchema
+    layouts: list
+    cls: type
+
+
+def _compile_class(schema, layout_inputs):
+    """Generate and exec the dataclass for a schema."""
+    layouts, _ = compute_bit_layout(layout_inputs)
+
+    # Generate code and execute it to get the class
+    code = generate_dataclass_code(schema, layouts)
+    namespace = {}
+    exec(code, namespace)
+    return GeneratedClass(schema, layouts, namespace[schema.name])
+
+
+@pytest.fixture(scope="module")
+def person_class():
+    """Person (active, age) class, compiled once per module."""
+    schema = BitSchema(
+        version="1",
+        name="Person",
+        fields={
+            "active": BoolFieldDefinition(type="bool"),
+            "age": IntFieldDefinition(type="int", bits=7, min=0, max=127),
+        },
+    )
+    return _compile_class(schema, [
+        {"name": "active", "type": "boolean"},
+        {"name": "age", "type": "integer", "min": 0, "max": 127},
+    ])
+
+
+@pytest.fixture(scope="module")
+def status_person_class():
+    """Person (active, age, status) class, compiled once per module."""
+    schema = BitSchema(
+        version="1",
+        name="Person",
+        fields={
+            "active": BoolFieldDefinition(type="bool"),
+            "age": IntFieldDefinition(type="int", bits=7, min=0, max=127),
+            "status": EnumFieldDefinition(
+                type="enum", values=["idle", "active", "done"]
+            ),
+        },
+    )
+    return _compile_class(schema, [
+        {"name": "active", "type": "boolean"},
+        {"name": "age", "type": "integer", "min": 0, "max": 127},
+        {"name": "status", "type": "enum", "values": ["idle", "active", "done"]},
+    ])
+
+
+@pytest.fixture(scope="module")
+def optional_person_class():
+    """OptionalPerson (nullable age) class, compiled once per module."""
+    schema = BitSchema(
+        version="1",
+        name="OptionalPerson",
+        fields={
+            "age": IntFieldDefinition(
+                type="int", bits=8, min=0, max=127, nullable=True
+            ),
+        },
+    )
+    return _compile_class(schema, [
+        {"name": "age", "type": "integer", "min": 0, "max": 127, "nullable": True},
+    ])
 
-        # Execute generated code to get class
-        namespace = {}
-        exec(code, namespace)
-        PersonClass = namespace["Person"]
+
+class TestRoundTripCorrectness:
+    """Test that generated code produces same results as runtime encoder/decoder."""
+
+    def test_generated_encode_matches_runtime(self, person_class):
+        """Generated encode() should produce same output as runtime encoder."""
+        layouts, PersonClass = person_class.layouts, person_class.cls
 
         # Test data
         data = {"active": True, "age": 42}
@@ -396,28 +531,35 @@ class TestRoundTripCorrectness:
         # Should match
         assert generated_encoded == runtime_encoded
 
-    def test_generated_decode_matches_runtime(self):
-        """Generated decode() should produce same output as runtime decoder."""
+    @pytest.mark.parametrize("resolution", ["hour", "minute"])
+    def test_generated_date_encode_floors_like_runtime(self, resolution):
+        """Dates before min_date and off-step times round down like encode()."""
         schema = BitSchema(
             version="1",
-            name="Person",
+            name="Event",
             fields={
-                "active": BoolFieldDefinition(type="bool"),
-                "age": IntFieldDefinition(type="int", bits=7, min=0, max=127),
+                "at": DateFieldDefinition(
+                    type="date", resolution=resolution,
+                    min_date="2024-01-01", max_date="2024-12-31",
+                ),
             },
         )
-        layouts, _ = compute_bit_layout([
-            {"name": "active", "type": "boolean"},
-            {"name": "age", "type": "integer", "min": 0, "max": 127},
+        event = _compile_class(schema, [
+            {"name": "at", "type": "date", "resolution": resolution,
+             "min_date": "2024-01-01", "max_date": "2024-12-31"},
         ])
 
-        # Generate code
-        code = generate_dataclass_code(schema, layouts)
+        for at in [
+            datetime.datetime(2023, 12, 31, 22, 30, 15),  # before min_date
+            datetime.datetime(2024, 3, 5, 7, 59, 59, 999999),  # non-aligned
+        ]:
+            expected = encode({"at": at}, event.layouts)
+            assert event.cls(at=at).encode() == expected
+            assert event.cls.encode_many([event.cls(at=at)]) == [expected]
 
-        # Execute generated code to get class
-        namespace = {}
-        exec(code, namespace)
-        PersonClass = namespace["Person"]
+    def test_generated_decode_matches_runtime(self, person_class):
+        """Generated decode() should produce same output as runtime decoder."""
+        layouts, PersonClass = person_class.layouts, person_class.cls
 
         # Test encoded value
         encoded = 85  # active=True (bit 0), age=42 (bits 1-7)
@@ -435,32 +577,9 @@ class TestRoundTripCorrectness:
         # Should match
         assert generated_decoded == runtime_decoded
 
-    def test_round_trip_with_generated_code(self):
+    def test_round_trip_with_generated_code(self, status_person_class):
         """Generated encode → decode should return original values."""
-        schema = BitSchema(
-            version="1",
-            name="Person",
-            fields={
-                "active": BoolFieldDefinition(type="bool"),
-                "age": IntFieldDefinition(type="int", bits=7, min=0, max=127),
-                "status": EnumFieldDefinition(
-                    type="enum", values=["idle", "active", "done"]
-                ),
-            },
-        )
-        layouts, _ = compute_bit_layout([
-            {"name": "active", "type": "boolean"},
-            {"name": "age", "type": "integer", "min": 0, "max": 127},
-            {"name": "status", "type": "enum", "values": ["idle", "active", "done"]},
-        ])
-
-        # Generate code
-        code = generate_dataclass_code(schema, layouts)
-
-        # Execute generated code to get class
-        namespace = {}
-        exec(code, namespace)
-        PersonClass = namespace["Person"]
+        PersonClass = status_person_class.cls
 
         # Original data
         original = PersonClass(active=True, age=42, status="active")
@@ -474,28 +593,55 @@ class TestRoundTripCorrectness:
         assert decoded.age == original.age
         assert decoded.status == original.status
 
-    def test_round_trip_with_nullable_fields(self):
-        """Generated code should handle nullable fields correctly."""
+    def test_large_enum_matches_runtime(self):
+        """Every value of a large enum encodes/decodes like the runtime codec."""
+        values = [f"v{i}" for i in range(200)]
         schema = BitSchema(
             version="1",
-            name="OptionalPerson",
+            name="Large",
+            fields={"code": EnumFieldDefinition(type="enum", values=values)},
+        )
+        layouts, _ = compute_bit_layout(
+            [{"name": "code", "type": "enum", "values": values}]
+        )
+        LargeClass = exec_generated(schema, layouts)["Large"]
+
+        for value in values:
+            encoded = LargeClass(code=value).encode()
+            assert encoded == encode({"code": value}, layouts)
+            assert LargeClass.decode(encoded).code == value
+
+    def test_byte_aligned_decode_uses_struct(self):
+        """Byte-aligned layouts decode through struct and match the runtime."""
+        schema = BitSchema(
+            version="1",
+            name="Pixel",
             fields={
-                "age": IntFieldDefinition(
-                    type="int", bits=8, min=0, max=127, nullable=True
-                ),
+                "red": IntFieldDefinition(type="int", bits=8, min=0, max=255),
+                "depth": IntFieldDefinition(type="int", bits=16, min=0, max=65535),
             },
         )
         layouts, _ = compute_bit_layout([
-            {"name": "age", "type": "integer", "min": 0, "max": 127, "nullable": True},
+            {"name": "red", "type": "integer", "min": 0, "max": 255},
+            {"name": "depth", "type": "integer", "min": 0, "max": 65535},
         ])
-
-        # Generate code
         code = generate_dataclass_code(schema, layouts)
+        PixelClass = exec_generated(schema, layouts)["Pixel"]
+
+        assert "_STRUCT_Pixel = struct.Struct('<BHxxxxx')" in code
+        for red, depth in [(0, 0), (255, 65535), (17, 300)]:
+            encoded = encode({"red": red, "depth": depth}, layouts)
+            decoded = PixelClass.decode(encoded)
+            assert {"red": decoded.red, "depth": decoded.depth} == decode(encoded, layouts)
+
+    def test_unaligned_decode_keeps_shift_and_mask(self, person_class):
+        """Layouts with sub-byte fields do not use struct."""
+        code = generate_dataclass_code(person_class.schema, person_class.layouts)
+        assert "struct" not in code
 
-        # Execute generated code to get class
-        namespace = {}
-        exec(code, namespace)
-        OptionalPersonClass = namespace["OptionalPerson"]
+    def test_round_trip_with_nullable_fields(self, optional_person_class):
+        """Generated code should handle nullable fields correctly."""
+        OptionalPersonClass = optional_person_class.cls
 
         # Test with None
         none_instance = OptionalPersonClass(age=None)
@@ -510,6 +656,336 @@ class TestRoundTripCorrectness:
         assert value_decoded.age == 42
 
 
+class TestGenerationCache:
+    """Test caching of generated source and compiled code."""
+
+    def _person(self, name="Person"):
+        schema = BitSchema(
+            version="1",
+            name=name,
+            fields={
+                "active": BoolFieldDefinition(type="bool"),
+                "age": IntFieldDefinition(type="int", bits=7, min=0, max=127),
+            },
+        )
+        layouts, _ = compute_bit_layout([
+            {"name": "active", "type": "boolean"},
+            {"name": "age", "type": "integer", "min": 0, "max": 127},
+        ])
+        return schema, layouts
+
+    def test_identical_schemas_share_cached_source(self):
+        """Structurally identical schemas return the same cached source."""
+        first = generate_dataclass_code(*self._person())
+        second = generate_dataclass_code(*self._person())
+        assert first is second
+
+    def test_different_schema_names_are_cached_separately(self):
+        """The class name is part of the cache key."""
+        code = generate_dataclass_code(*self._person("Other"))
+        assert "class Other:" in code
+        assert "class Person:" not in code
+
+    def test_exec_generated_matches_runtime_encoder(self):
+        """exec_generated() yields a working class without exec of source."""
+        schema, layouts = self._person()
+        namespace = exec_generated(schema, layouts)
+        PersonClass = namespace["Person"]
+
+        instance = PersonClass(active=True, age=42)
+        assert instance.encode() == encode({"active": True, "age": 42}, layouts)
+
+    def test_generated_class_uses_slots(self):
+        """Generated instances use __slots__ instead of a per-instance dict."""
+        PersonClass = exec_generated(*self._person())["Person"]
+        instance = PersonClass(active=True, age=42)
+
+        assert PersonClass.__slots__ == ("active", "age")
+        assert not hasattr(instance, "__dict__")
+
+    def test_generated_class_has_eq_and_repr_by_default(self):
+        """Generated classes keep dataclass value equality, repr and match args."""
+        PersonClass = exec_generated(*self._person())["Person"]
+
+        assert PersonClass(active=True, age=1) == PersonClass(active=True, age=1)
+        assert repr(PersonClass(active=True, age=1)) == "Person(active=True, age=1)"
+        assert PersonClass.__match_args__ == ("active", "age")
+
+    def test_lean_flag_skips_eq_repr_and_match_args(self):
+        """lean=True omits __eq__, __repr__ and __match_args__."""
+        code = generate_dataclass_code(*self._person(), lean=True)
+        PersonClass = exec_generated(*self._person(), lean=True)["Person"]
+
+        assert "eq=False, repr=False, match_args=False" in code
+        assert "__eq__" not in PersonClass.__dict__
+        assert "__repr__" not in PersonClass.__dict__
+        assert "__match_args__" not in PersonClass.__dict__
+        assert PersonClass(active=True, age=42).encode() == 85
+
+    def test_exec_generated_uses_given_namespace(self):
+        """exec_generated() executes into and returns the given namespace."""
+        namespace = {"existing": 1}
+        assert exec_generated(*self._person(), namespace) is namespace
+        assert "Person" in namespace
+        assert namespace["existing"] == 1
+
+
+class TestModuleGeneration:
+    """Test generating and compiling several schemas as one module."""
+
+    def _status_schema(self, name, values):
+        schema = BitSchema(
+            version="1",
+            name=name,
+            fields={"status": EnumFieldDefinition(type="enum", values=values)},
+        )
+        layouts, _ = compute_bit_layout(
+            [{"name": "status", "type": "enum", "values": values}]
+        )
+        return schema, layouts
+
+    def test_generate_module_code_has_single_header(self):
+        """All classes share one import header."""
+        code = generate_module_code([
+            self._status_schema("Job", ["idle", "done"]),
+            self._status_schema("Light", ["red", "amber", "green"]),
+        ])
+
+        assert code.count("from dataclasses import dataclass") == 1
+        assert "class Job:" in code
+        assert "class Light:" in code
+        assert validate_generated_code(code) is True
+
+    def test_compile_module_keeps_same_named_enum_fields_apart(self):
+        """Enum constants are per class, so equal field names do not clash."""
+        items = [
+            self._status_schema("Job", ["idle", "done"]),
+            self._status_schema("Light", ["red", "amber", "green"]),
+        ]
+        classes = compile_module(items)
+
+        assert set(classes) == {"Job", "Light"}
+        for schema, layouts in items:
+            cls = classes[schema.name]
+            for value in schema.fields["status"].values:
+                encoded = cls(status=value).encode()
+                assert encoded == encode({"status": value}, layouts)
+                assert cls.decode(encoded).status == value
+
+    def test_identical_enums_share_module_constants(self):
+        """Classes with the same enum values reuse one pair of constants."""
+        items = [
+            self._status_schema("Job", ["idle", "done"]),
+            self._status_schema("Task", ["idle", "done"]),
+        ]
+        code = generate_module_code(items)
+
+        assert "_ENUM_Job_status = " in code
+        assert "_ENUM_Task_status" not in code
+        assert code.count("_ENUM_Job_status[self.status]") == 2
+
+        classes = compile_module(items)
+        for name in ("Job", "Task"):
+            assert classes[name](status="done").encode() == 1
+            assert classes[name].decode(1).status == "done"
+
+    def test_duplicate_schema_names_rejected(self):
+        """Two schemas with the same class name cannot share a module."""
+        with pytest.raises(ValueError, match="Duplicate schema names: Job"):
+            generate_module_code([
+                self._status_schema("Job", ["idle", "done"]),
+                self._status_schema("Job", ["new", "old"]),
+            ])
+
+
+class TestColumnarMethods:
+    """Test generated batch methods (encode_many, encode/decode_columns)."""
+
+    def _person(self):
+        schema = BitSchema(
+            version="1",
+            name="Person",
+            fields={
+                "active": BoolFieldDefinition(type="bool"),
+                "status": EnumFieldDefinition(type="enum", values=["idle", "busy", "away"]),
+                "age": IntFieldDefinition(type="int", bits=7, min=5, max=120, nullable=True),
+            },
+        )
+        layouts, _ = compute_bit_layout([
+            {"name": "active", "type": "boolean"},
+            {"name": "status", "type": "enum", "values": ["idle", "busy", "away"]},
+            {"name": "age", "type": "integer", "min": 5, "max": 120, "nullable": True},
+        ])
+        return schema, layouts
+
+    def test_encode_columns_matches_runtime_encoder(self):
+        """Each column row encodes exactly like the runtime encoder."""
+        schema, layouts = self._person()
+        PersonClass = exec_generated(schema, layouts)["Person"]
+        records = [
+            {"active": True, "status": "busy", "age": 42},
+            {"active": False, "status": "idle", "age": None},
+            {"active": True, "status": "away", "age": 120},
+        ]
+        columns = {name: [r[name] for r in records] for name in schema.fields}
+
+        assert PersonClass.encode_columns(columns) == [encode(r, layouts) for r in records]
+
+    def test_decode_columns_matches_runtime_decoder(self):
+        """Decoded columns hold the same values as per-record decoding."""
+        schema, layouts = self._person()
+        PersonClass = exec_generated(schema, layouts)["Person"]
+        records = [
+            {"active": True, "status": "busy", "age": 42},
+            {"active": False, "status": "idle", "age": None},
+        ]
+        encoded = [encode(r, layouts) for r in records]
+
+        columns = PersonClass.decode_columns(encoded)
+        assert columns == {name: [r[name] for r in records] for name in schema.fields}
+
+    def test_encode_many_matches_runtime_encoder(self):
+        """encode_many() over instances matches per-record runtime encoding."""
+        schema, layouts = self._person()
+        PersonClass = exec_generated(schema, layouts)["Person"]
+        records = [
+            {"active": True, "status": "busy", "age": 42},
+            {"active": False, "status": "idle", "age": None},
+        ]
+        instances = [PersonClass(**r) for r in records]
+
+        assert PersonClass.encode_many(instances) == [encode(r, layouts) for r in records]
+        assert PersonClass.encode_many(iter(instances)) == [i.encode() for i in instances]
+
+    def test_encode_many_single_field(self):
+        """A one-field attrgetter yields bare values, not 1-tuples."""
+        schema = BitSchema(
+            version="1",
+            name="Flag",
+            fields={"on": BoolFieldDefinition(type="bool")},
+        )
+        layouts, _ = compute_bit_layout([{"name": "on", "type": "boolean"}])
+        FlagClass = exec_generated(schema, layouts)["Flag"]
+
+        assert FlagClass.encode_many([FlagClass(on=True), FlagClass(on=False)]) == [1, 0]
+
+    def test_encode_columns_rejects_ragged_columns(self):
+        """Columns of different lengths are an error, not silently truncated."""
+        PersonClass = exec_generated(*self._person())["Person"]
+        with pytest.raises(ValueError):
+            PersonClass.encode_columns(
+                {"active": [True, False], "status": ["idle"], "age": [30, 40]}
+            )
+
+
+class TestCSourceGeneration:
+    """Test generation of C encode/decode kernels."""
+
+    def _person(self):
+        schema = BitSchema(
+            version="1",
+            name="Person",
+            fields={
+                "active": BoolFieldDefinition(type="bool"),
+                "status": EnumFieldDefinition(type="enum", values=["idle", "busy", "away"]),
+                "age": IntFieldDefinition(type="int", bits=7, min=5, max=120, nullable=True),
+            },
+        )
+        layouts, _ = compute_bit_layout([
+            {"name": "active", "type": "boolean"},
+            {"name": "status", "type": "enum", "values": ["idle", "busy", "away"]},
+            {"name": "age", "type": "integer", "min": 5, "max": 120, "nullable": True},
+        ])
+        return schema, layouts
+
+    def test_generate_c_source_signatures(self):
+        """One parameter per field, with a presence flag for nullable fields."""
+        source = generate_c_source(*self._person())
+
+        assert "#include <stdint.h>" in source
+        assert (
+            "uint64_t encode_Person(int active, int status, int age_present, int64_t age)"
+            in source
+        )
+        assert (
+            "void decode_Person(uint64_t encoded, int *active, int *status, "
+            "int *age_present, int64_t *age)" in source
+        )
+
+    def test_generate_c_source_rejects_date_fields(self):
+        """Date fields have no plain C representation."""
+        schema = BitSchema(
+            version="1",
+            name="Event",
+            fields={"when": {"type": "date", "resolution": "day",
+                             "min_date": "2020-01-01", "max_date": "2020-12-31"}},
+        )
+        layouts, _ = compute_bit_layout([
+            {"name": "when", "type": "date", "resolution": "day",
+             "min_date": "2020-01-01", "max_date": "2020-12-31"},
+        ])
+        with pytest.raises(ValueError, match="does not support date field 'when'"):
+            generate_c_source(schema, layouts)
+
+    @pytest.mark.parametrize("name", ["int", "default", "register", "encoded"])
+    def test_generate_c_source_rejects_reserved_field_names(self, name):
+        """Field names that would not compile as C parameters are rejected."""
+        schema = BitSchema(
+            version="1",
+            name="Flags",
+            fields={name: BoolFieldDefinition(type="bool")},
+        )
+        layouts, _ = compute_bit_layout([{"name": name, "type": "boolean"}])
+        with pytest.raises(ValueError, match=f"field name '{name}'.*reserved C identifier"):
+            generate_c_source(schema, layouts)
+
+    def test_generate_c_source_extracts_with_shift_and_mask(self):
+        """Decode extracts each field with a shift and a contiguous mask."""
+        source = generate_c_source(*self._person())
+
+        assert "*status = (int)((encoded >> 1) & 3ULL);" in source
+
+    def test_generate_c_source_selects_nullable_without_branch(self):
+        """Absent nullable values are zeroed by multiplying by the presence bit."""
+        source = generate_c_source(*self._person())
+
+        assert "*age = (int64_t)*age_present * (" in source
+        assert "?" not in source.split("void decode_Person")[1]
+
+    @pytest.mark.skipif(shutil.which("cc") is None, reason="no C compiler")
+    def test_compiled_c_matches_runtime(self, tmp_path):
+        """Compiled kernels encode and decode exactly like the runtime."""
+        schema, layouts = self._person()
+        c_file = tmp_path / "person.c"
+        lib_file = tmp_path / "person.so"
+        c_file.write_text(generate_c_source(schema, layouts))
+        subprocess.run(
+            ["cc", "-shared", "-fPIC", "-O2", "-o", str(lib_file), str(c_file)],
+            check=True,
+        )
+        lib = ctypes.CDLL(str(lib_file))
+        lib.encode_Person.restype = ctypes.c_uint64
+        lib.encode_Person.argtypes = [
+            ctypes.c_int, ctypes.c_int, ctypes.c_int, ctypes.c_int64,
+        ]
+
+        values = ["idle", "busy", "away"]
+        for active, status, age in [(True, "busy", 42), (False, "away", None), (True, "idle", 5)]:
+            record = {"active": active, "status": status, "age": age}
+            encoded = lib.encode_Person(
+                int(active), values.index(status), age is not None, age or 0
+            )
+            assert encoded == encode(record, layouts)
+
+            out = [ctypes.c_int(), ctypes.c_int(), ctypes.c_int(), ctypes.c_int64()]
+            lib.decode_Person(ctypes.c_uint64(encoded), *map(ctypes.byref, out))
+            active_out, status_out, present_out, age_out = (o.value for o in out)
+            assert bool(active_out) is active
+            assert values[status_out] == status
+            assert (age_out if present_out else None) == age
+            assert present_out or age_out == 0
+
+
 class TestCodeFormatting:
     """Test code formatting functionality."""
 
@@ -21,6 +21,22 @@ from bitschema.decoder import decode
 from bitschema.errors import SchemaError
 
 
+@pytest.fixture(scope="module")
+def day_layouts():
+    """Day-resolution event_date layout over 2020, built once per module."""
+    layouts, _ = compute_bit_layout([
+        {
+            "name": "event_date",
+            "type": "date",
+            "resolution": "day",
+            "min_date": "2020-01-01",
+            "max_date": "2020-12-31",
+            "nullable": False
+        }
+    ])
+    return layouts
+
+
 class TestDateFieldSchemaValidation:
     """Tests for date field schema validation."""
 
@@ -159,23 +175,11 @@ class TestDateFieldBitCalculation:
 class TestDateFieldEncoding:
     """Tests for date field encoding."""
 
-    def test_encode_day_resolution(self):
+    def test_encode_day_resolution(self, day_layouts):
         """Encoding date with day resolution should produce correct offset."""
-        fields = [
-            {
-                "name": "event_date",
-                "type": "date",
-                "resolution": "day",
-                "min_date": "2020-01-01",
-                "max_date": "2020-12-31",
-                "nullable": False
-            }
-        ]
-        layouts, _ = compute_bit_layout(fields)
-
         # January 10th is 9 days after January 1st
         data = {"event_date": date(2020, 1, 10)}
-        encoded = encode(data, layouts)
+        encoded = encode(data, day_layouts)
 
         # Should encode to offset of 9 days
         assert encoded == 9
@@ -200,47 +204,49 @@ class TestDateFieldEncoding:
 
         assert encoded == 5
 
-    def test_encode_accepts_iso_string(self):
+    def test_encode_accepts_iso_string(self, day_layouts):
         """Encoding should accept ISO 8601 string format."""
+        # Should accept ISO string
+        data = {"event_date": "2020-01-10"}
+        encoded = encode(data, day_layouts)
+
+        assert encoded == 9
+
+    def test_encode_second_resolution_wide_range_is_exact(self):
+        """Second offsets over decades are exact integers, not rounded floats."""
         fields = [
             {
-                "name": "event_date",
+                "name": "timestamp",
                 "type": "date",
-                "resolution": "day",
-                "min_date": "2020-01-01",
-                "max_date": "2020-12-31",
+                "resolution": "second",
+                "min_date": "1970-01-01T00:00:00",
+                "max_date": "2100-01-01T00:00:00",
                 "nullable": False
             }
         ]
         layouts, _ = compute_bit_layout(fields)
+        value = datetime(2099, 12, 31, 23, 59, 59)
 
-        # Should accept ISO string
-        data = {"event_date": "2020-01-10"}
-        encoded = encode(data, layouts)
+        encoded = encode({"timestamp": value}, layouts)
 
-        assert encoded == 9
+        assert encoded == int((value - datetime(1970, 1, 1)).total_seconds())
+        assert decode(encoded, layouts)["timestamp"] == value
+
+    def test_encode_rejects_invalid_iso_string_every_time(self, day_layouts):
+        """Parse failures are not cached; each bad string raises."""
+        for _ in range(2):
+            with pytest.raises(ValueError):
+                encode({"event_date": "not-a-date"}, day_layouts)
 
 
 class TestDateFieldDecoding:
     """Tests for date field decoding."""
 
-    def test_decode_day_resolution(self):
+    def test_decode_day_resolution(self, day_layouts):
         """Decoding offset with day resolution should return correct date."""
-        fields = [
-            {
-                "name": "event_date",
-                "type": "date",
-                "resolution": "day",
-                "min_date": "2020-01-01",
-                "max_date": "2020-12-31",
-                "nullable": False
-            }
-        ]
-        layouts, _ = compute_bit_layout(fields)
-
         # Offset of 9 days
         encoded = 9
-        decoded = decode(encoded, layouts)
+        decoded = decode(encoded, day_layouts)
 
         assert decoded["event_date"] == date(2020, 1, 10)
 
@@ -304,29 +310,35 @@ class TestDateFieldDecoding:
 
         assert decoded["timestamp"] == datetime(2025, 1, 1, 0, 1, 30)
 
-
-class TestDateFieldRoundTrip:
-    """Tests for date field round-trip correctness."""
-
-    def test_roundtrip_day_resolution(self):
-        """Encode then decode should return original date (day resolution)."""
+    def test_decode_day_resolution_min_date_with_time(self):
+        """Day offsets from a min_date with a time of day yield the calendar date."""
         fields = [
             {
                 "name": "event_date",
                 "type": "date",
                 "resolution": "day",
-                "min_date": "2020-01-01",
+                "min_date": "2020-02-28T18:30:00",
                 "max_date": "2020-12-31",
                 "nullable": False
             }
         ]
         layouts, _ = compute_bit_layout(fields)
 
+        decoded = decode(2, layouts)
+
+        assert decoded["event_date"] == date(2020, 3, 1)
+
+
+class TestDateFieldRoundTrip:
+    """Tests for date field round-trip correctness."""
+
+    def test_roundtrip_day_resolution(self, day_layouts):
+        """Encode then decode should return original date (day resolution)."""
         original_date = date(2020, 6, 15)
         data = {"event_date": original_date}
 
-        encoded = encode(data, layouts)
-        decoded = decode(encoded, layouts)
+        encoded = encode(data, day_layouts)
+        decoded = decode(encoded, day_layouts)
 
         assert decoded["event_date"] == original_date
 
@@ -352,33 +364,34 @@ class TestDateFieldRoundTrip:
 
         assert decoded["timestamp"] == original_datetime
 
-    def test_roundtrip_all_resolutions(self):
-        """Test round-trip for all resolution types."""
-        test_cases = [
+    @pytest.mark.parametrize(
+        "resolution,min_date,max_date,test_value",
+        [
             ("day", "2020-01-01", "2020-12-31", date(2020, 6, 15)),
             ("hour", "2025-01-01T00:00:00", "2025-01-31T23:00:00", datetime(2025, 1, 15, 12, 0, 0)),
             ("minute", "2025-01-01T00:00:00", "2025-01-02T00:00:00", datetime(2025, 1, 1, 12, 30, 0)),
             ("second", "2025-01-01T00:00:00", "2025-01-01T06:00:00", datetime(2025, 1, 1, 3, 15, 45)),
+        ],
+    )
+    def test_roundtrip_all_resolutions(self, resolution, min_date, max_date, test_value):
+        """Test round-trip for all resolution types."""
+        fields = [
+            {
+                "name": "timestamp",
+                "type": "date",
+                "resolution": resolution,
+                "min_date": min_date,
+                "max_date": max_date,
+                "nullable": False
+            }
         ]
+        layouts, _ = compute_bit_layout(fields)
 
-        for resolution, min_date, max_date, test_value in test_cases:
-            fields = [
-                {
-                    "name": "timestamp",
-                    "type": "date",
-                    "resolution": resolution,
-                    "min_date": min_date,
-                    "max_date": max_date,
-                    "nullable": False
-                }
-            ]
-            layouts, _ = compute_bit_layout(fields)
-
-            data = {"timestamp": test_value}
-            encoded = encode(data, layouts)
-            decoded = decode(encoded, layouts)
+        data = {"timestamp": test_value}
+        encoded = encode(data, layouts)
+        decoded = decode(encoded, layouts)
 
-            assert decoded["timestamp"] == test_value, f"Round-trip failed for resolution={resolution}"
+        assert decoded["timestamp"] == test_value
 
 
 class TestDateFieldNullable:
@@ -467,22 +480,10 @@ class TestDateFieldNullable:
 class TestDateFieldBoundaries:
     """Tests for date field boundary conditions."""
 
-    def test_encode_min_date_boundary(self):
+    def test_encode_min_date_boundary(self, day_layouts):
         """Encoding min_date should produce offset 0."""
-        fields = [
-            {
-                "name": "event_date",
-                "type": "date",
-                "resolution": "day",
-                "min_date": "2020-01-01",
-                "max_date": "2020-12-31",
-                "nullable": False
-            }
-        ]
-        layouts, _ = compute_bit_layout(fields)
-
         data = {"event_date": date(2020, 1, 1)}
-        encoded = encode(data, layouts)
+        encoded = encode(data, day_layouts)
 
         assert encoded == 0
 
@@ -506,28 +507,16 @@ class TestDateFieldBoundaries:
         # max_date - min_date = 30 days
         assert encoded == 30
 
-    def test_roundtrip_boundary_dates(self):
+    def test_roundtrip_boundary_dates(self, day_layouts):
         """Round-trip test for min_date and max_date boundaries."""
-        fields = [
-            {
-                "name": "event_date",
-                "type": "date",
-                "resolution": "day",
-                "min_date": "2020-01-01",
-                "max_date": "2020-12-31",
-                "nullable": False
-            }
-        ]
-        layouts, _ = compute_bit_layout(fields)
-
         # Test min_date boundary
         min_data = {"event_date": date(2020, 1, 1)}
-        min_encoded = encode(min_data, layouts)
-        min_decoded = decode(min_encoded, layouts)
+        min_encoded = encode(min_data, day_layouts)
+        min_decoded = decode(min_encoded, day_layouts)
         assert min_decoded["event_date"] == date(2020, 1, 1)
 
         # Test max_date boundary
         max_data = {"event_date": date(2020, 12, 31)}
-        max_encoded = encode(max_data, layouts)
-        max_decoded = decode(max_encoded, layouts)
+        max_encoded = encode(max_data, day_layouts)
+        max_decoded = decode(max_encoded, day_layouts)
         assert max_decoded["event_date"] == date(2020, 12, 31)
@@ -4,10 +4,21 @@ Verifies decoder extracts bits from 64-bit integer and converts to semantic valu
 Tests boolean, integer, enum, and nullable field decoding.
 """
 
+import sys
+
 import pytest
 
-from bitschema.decoder import decode, denormalize_value
-from bitschema.layout import FieldLayout
+from bitschema.decoder import (
+    compile_decoder,
+    compile_extractor,
+    compile_record_class,
+    decode,
+    decode_columns,
+    decode_many,
+    denormalize_value,
+    extract_columns,
+)
+from bitschema.layout import FieldLayout, compile_layouts, layout_constants
 
 
 class TestDenormalizeValue:
@@ -82,6 +93,19 @@ class TestDenormalizeValue:
         assert denormalize_value(1, layout) == "active"
         assert denormalize_value(2, layout) == "done"
 
+    def test_denormalize_unknown_type(self):
+        """A layout type with no denormalizer raises ValueError."""
+        layout = FieldLayout(
+            name="ratio",
+            type="float",
+            offset=0,
+            bits=8,
+            constraints={},
+            nullable=False,
+        )
+        with pytest.raises(ValueError, match="Unknown field type: float"):
+            denormalize_value(3, layout)
+
 
 class TestDecodeSingleField:
     """Test decoding single fields from 64-bit integer."""
@@ -166,6 +190,24 @@ class TestDecodeSingleField:
         result = decode(1, layouts)
         assert result == {"status": "active"}
 
+    def test_decode_enum_returns_cached_interned_values(self):
+        """Repeat decodes return the interned strings cached with the layout."""
+        layouts = [
+            FieldLayout(
+                name="status",
+                type="enum",
+                offset=0,
+                bits=1,
+                constraints={"values": ["".join(["id", "le"]), "busy"]},
+                nullable=False,
+            )
+        ]
+        first = decode(0, layouts)["status"]
+
+        assert first is decode(0, layouts)["status"]
+        assert first is layout_constants(layouts[0]).enum_values[0]
+        assert first is sys.intern("idle")
+
 
 class TestDecodeMultipleFields:
     """Test decoding multiple fields at different offsets."""
@@ -354,3 +396,286 @@ class TestDecodeNullableFields:
         # Calculation: (7 << 5) | (1 << 4) | 5 = 224 + 16 + 5 = 245
         result = decode(245, layouts)
         assert result == {"id": 5, "optional_count": 7}
+
+    def test_decode_derives_constants_once_per_layout(self, monkeypatch):
+        """Repeat decodes reuse cached constants instead of re-deriving them."""
+        import bitschema.layout as layout_module
+
+        calls = []
+        original = layout_module.field_constants
+        monkeypatch.setattr(
+            layout_module, "field_constants",
+            lambda layout: calls.append(layout) or original(layout),
+        )
+        layouts = [
+            FieldLayout(
+                name="count", type="integer", offset=0, bits=5,
+                constraints={"min": 0, "max": 15}, nullable=True,
+            ),
+        ]
+
+        for _ in range(3):
+            assert decode(0b1111, layouts) == {"count": 7}
+        assert len(calls) == 1
+
+
+class TestDecodeMany:
+    """Test batch decoding of multiple encoded values."""
+
+    def test_decode_many_matches_decode(self):
+        """Each batch result equals the single-value decoding."""
+        layouts = [
+            FieldLayout(
+                name="active", type="boolean", offset=0, bits=1,
+                constraints={}, nullable=False,
+            ),
+            FieldLayout(
+                name="age", type="integer", offset=1, bits=7,
+                constraints={"min": 0, "max": 127}, nullable=False,
+            ),
+        ]
+        values = [0, 85, 255]
+        assert decode_many(values, layouts) == [decode(v, layouts) for v in values]
+
+    def test_decode_many_empty(self):
+        """Empty input produces empty output."""
+        layouts = [
+            FieldLayout(
+                name="active", type="boolean", offset=0, bits=1,
+                constraints={}, nullable=False,
+            )
+        ]
+        assert decode_many([], layouts) == []
+
+
+class TestDecodeColumns:
+    """Test column-oriented batch decoding."""
+
+    LAYOUTS = [
+        FieldLayout(
+            name="active", type="boolean", offset=0, bits=1,
+            constraints={}, nullable=False,
+        ),
+        FieldLayout(
+            name="status", type="enum", offset=1, bits=2,
+            constraints={"values": ["idle", "busy", "away"]}, nullable=False,
+        ),
+        FieldLayout(
+            name="temp", type="integer", offset=3, bits=7,
+            constraints={"min": -20, "max": 40}, nullable=True,
+        ),
+    ]
+
+    def test_decode_columns_matches_decode(self):
+        """Each column entry equals the single-value decoding."""
+        values = [0, 0b1011, 0b1111111100, 0b0000001_1_10_1]
+        columns = decode_columns(values, self.LAYOUTS)
+
+        decoded = [decode(v, self.LAYOUTS) for v in values]
+        assert columns == {
+            name: [record[name] for record in decoded]
+            for name in ("active", "status", "temp")
+        }
+
+    def test_decode_columns_accepts_iterator(self):
+        """One-shot iterators are consumed once and decoded for every field."""
+        columns = decode_columns(iter([0b1011]), self.LAYOUTS)
+        assert columns == {"active": [True], "status": ["busy"], "temp": [-20]}
+
+    def test_decode_columns_accepts_compiled_layout(self):
+        """A CompiledLayout decodes the same as the layout list it came from."""
+        values = [0, 0b1011, 0b1111111100]
+        compiled = compile_layouts(self.LAYOUTS)
+        assert decode_columns(values, compiled) == decode_columns(values, self.LAYOUTS)
+
+    @pytest.mark.parametrize("resolution", ["day", "hour", "minute", "second"])
+    def test_decode_columns_dates_match_decode(self, resolution):
+        """Batch date decoding matches per-value decoding at every resolution."""
+        layouts = [
+            FieldLayout(
+                name="when", type="date", offset=0, bits=20,
+                constraints={
+                    "min_date": "2024-01-01T00:00:00",
+                    "max_date": "2024-01-10T00:00:00",
+                    "resolution": resolution,
+                },
+                nullable=True,
+            )
+        ]
+        values = [0, 1, 0b1011, 0b110101, (1 << 20) - 1]
+        assert decode_columns(values, layouts) == {
+            "when": [decode(v, layouts)["when"] for v in values]
+        }
+
+    @pytest.mark.parametrize("count", [0, 1, 7])
+    def test_decode_columns_parallel_matches_serial(self, count):
+        """Splitting the batch across worker processes keeps row order."""
+        # Skip status index 3, which is outside the 3-value enum
+        values = [v for v in range(0, 1024, 37) if (v >> 1) & 3 != 3][:count]
+        assert decode_columns(values, self.LAYOUTS, workers=2) == decode_columns(
+            values, self.LAYOUTS
+        )
+
+    def test_decode_columns_empty(self):
+        """Empty input produces an empty list per field."""
+        assert decode_columns([], self.LAYOUTS) == {
+            "active": [], "status": [], "temp": [],
+        }
+
+
+class TestExtractColumns:
+    """Test raw columnar extraction into typed arrays."""
+
+    LAYOUTS = [
+        FieldLayout(
+            name="active", type="boolean", offset=0, bits=1,
+            constraints={}, nullable=False,
+        ),
+        FieldLayout(
+            name="temp", type="integer", offset=1, bits=8,
+            constraints={"min": -20, "max": 40}, nullable=True,
+        ),
+        FieldLayout(
+            name="count", type="integer", offset=9, bits=12,
+            constraints={"min": 0, "max": 4000}, nullable=False,
+        ),
+    ]
+
+    def test_extract_columns_uses_narrowest_typecode(self):
+        """Columns are typed arrays sized to their value bits."""
+        encoded = [1 | (1 << 1) | (30 << 2) | (4000 << 9), 0]
+        columns = extract_columns(encoded, self.LAYOUTS)
+
+        assert columns.values["active"].itemsize == 1
+        assert columns.values["temp"].itemsize == 1
+        assert columns.values["count"].itemsize == 2
+        assert columns.values["active"].tolist() == [1, 0]
+        assert columns.values["temp"].tolist() == [30, 0]
+        assert columns.values["count"].tolist() == [4000, 0]
+
+    def test_extract_columns_packs_presence_bitmap(self):
+        """Nullable presence is one bit per row, LSB-first."""
+        present = 1 << 1
+        encoded = [present, 0, present, 0, 0, 0, 0, 0, present]
+        columns = extract_columns(encoded, compile_layouts(self.LAYOUTS))
+
+        assert list(columns.presence) == ["temp"]
+        assert columns.presence["temp"] == bytes([0b00000101, 0b00000001])
+
+    def test_extract_columns_empty(self):
+        """Empty input gives empty arrays and bitmaps."""
+        columns = extract_columns([], self.LAYOUTS)
+        assert len(columns.values["count"]) == 0
+        assert columns.presence["temp"] == b""
+
+
+class TestCompileDecoder:
+    """Test schema-specialized decoders."""
+
+    LAYOUTS = [
+        FieldLayout(
+            name="active", type="boolean", offset=0, bits=1,
+            constraints={}, nullable=False,
+        ),
+        FieldLayout(
+            name="status", type="enum", offset=1, bits=2,
+            constraints={"values": ["idle", "busy", "away"]}, nullable=False,
+        ),
+        FieldLayout(
+            name="temp", type="integer", offset=3, bits=7,
+            constraints={"min": -20, "max": 40}, nullable=True,
+        ),
+        FieldLayout(
+            name="day", type="date", offset=10, bits=9,
+            constraints={
+                "min_date": "2024-01-01", "max_date": "2024-12-31", "resolution": "day",
+            },
+            nullable=False,
+        ),
+        FieldLayout(
+            name="seen", type="date", offset=19, bits=14,
+            constraints={
+                "min_date": "2024-01-01T00:00:00",
+                "max_date": "2024-12-31T23:00:00",
+                "resolution": "hour",
+            },
+            nullable=True,
+        ),
+        FieldLayout(
+            name="perms", type="bitmask", offset=33, bits=3,
+            constraints={"flags": {"read": 0, "write": 1, "execute": 2}},
+            nullable=False,
+        ),
+    ]
+
+    @pytest.mark.parametrize(
+        "encoded",
+        [
+            0,
+            0b1011,
+            ((1 << 36) - 1) ^ 0b100,
+            (123 << 10) | (1 << 19) | (500 << 20) | (5 << 33),
+        ],
+    )
+    def test_compiled_decoder_matches_decode(self, encoded):
+        """The specialized decoder returns exactly what decode() returns."""
+        assert compile_decoder(self.LAYOUTS)(encoded) == decode(encoded, self.LAYOUTS)
+
+    def test_compile_decoder_is_cached(self):
+        """Equal layouts reuse one compiled function."""
+        copies = [layout._replace() for layout in self.LAYOUTS]
+        assert compile_decoder(copies) is compile_decoder(self.LAYOUTS)
+
+    def test_compile_decoder_rejects_unknown_type(self):
+        """Unknown field types fail when the decoder is built."""
+        layouts = [
+            FieldLayout(
+                name="x", type="float", offset=0, bits=8,
+                constraints={}, nullable=False,
+            )
+        ]
+        with pytest.raises(ValueError, match="Unknown field type: float"):
+            compile_decoder(layouts)
+
+    def test_compile_extractor_returns_raw_values(self):
+        """The extractor yields unsigned field bits in layout order."""
+        encoded = 0b1011 | (123 << 10) | (1 << 19) | (500 << 20) | (5 << 33)
+        assert compile_extractor(self.LAYOUTS)(encoded) == (1, 1, 0, 123, 500, 5)
+        assert compile_extractor(self.LAYOUTS)(0)[2] is None
+
+    def test_record_decoder_matches_decode(self):
+        """Record decoding holds the same values as the dict decoder."""
+        encoded = 0b1011 | (123 << 10) | (1 << 19) | (500 << 20) | (5 << 33)
+        record = compile_decoder(self.LAYOUTS, record=True)(encoded)
+
+        assert isinstance(record, compile_record_class(self.LAYOUTS))
+        assert record._fields == tuple(layout.name for layout in self.LAYOUTS)
+        assert record._asdict() == decode(encoded, self.LAYOUTS)
+        assert decode_many([encoded], self.LAYOUTS, record=True) == [record]
+
+    def test_compile_record_class_is_cached(self):
+        """Equal layouts reuse one record class."""
+        copies = [layout._replace() for layout in self.LAYOUTS]
+        assert compile_record_class(copies) is compile_record_class(self.LAYOUTS)
+
+    @pytest.mark.parametrize("encoded", [0, 0b1, 0b10, 0b101, 0b111111])
+    def test_fused_nullable_decode_matches_decode(self, encoded):
+        """Fused presence/value reads agree with decode() for nullable bitmasks and enums."""
+        layouts = [
+            FieldLayout(
+                name="perms", type="bitmask", offset=0, bits=3,
+                constraints={"flags": {"read": 0, "write": 1}}, nullable=True,
+            ),
+            FieldLayout(
+                name="kind", type="enum", offset=3, bits=1,
+                constraints={"values": ["only"]}, nullable=True,
+            ),
+            FieldLayout(
+                name="level", type="integer", offset=4, bits=3,
+                constraints={"min": 1, "max": 4}, nullable=True,
+            ),
+        ]
+        assert compile_decoder(layouts)(encoded) == decode(encoded, layouts)
+        assert decode_columns([encoded], layouts) == {
+            name: [value] for name, value in decode(encoded, layouts).items()
+        }
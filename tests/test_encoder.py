@@ -5,242 +5,169 @@ and nullable field presence bit handling.
 """
 
 import pytest
-from bitschema.encoder import encode, normalize_value
-from bitschema.layout import FieldLayout
+from bitschema.encoder import (
+    compile_encoder,
+    encode,
+    encode_columns,
+    encode_many,
+    normalize_value,
+)
+from bitschema.layout import FieldLayout, layout_constants
 from bitschema.errors import EncodingError
 
 
-class TestNormalizeValue:
-    """Test value normalization for different field types."""
-
-    def test_normalize_boolean_true(self):
-        """Boolean True normalizes to 1."""
-        layout = FieldLayout(
-            name="active", type="boolean", offset=0, bits=1, constraints={}
-        )
-        assert normalize_value(True, layout) == 1
-
-    def test_normalize_boolean_false(self):
-        """Boolean False normalizes to 0."""
-        layout = FieldLayout(
-            name="active", type="boolean", offset=0, bits=1, constraints={}
-        )
-        assert normalize_value(False, layout) == 0
-
-    def test_normalize_integer_unsigned(self):
-        """Integer with min=0 normalizes by subtracting min."""
-        layout = FieldLayout(
-            name="age",
-            type="integer",
-            offset=0,
-            bits=7,
-            constraints={"min": 0, "max": 127},
-        )
-        assert normalize_value(42, layout) == 42
+# Single-field layouts shared by the normalize and single-field encode tests
+_BOOL_LAYOUT = FieldLayout(name="active", type="boolean", offset=0, bits=1, constraints={})
+_AGE_LAYOUT = FieldLayout(
+    name="age", type="integer", offset=0, bits=7, constraints={"min": 0, "max": 127}
+)
+_TEMP_LAYOUT = FieldLayout(
+    name="temp", type="integer", offset=0, bits=5, constraints={"min": -10, "max": 10}
+)
+_STATUS_LAYOUT = FieldLayout(
+    name="status",
+    type="enum",
+    offset=0,
+    bits=2,
+    constraints={"values": ["idle", "active", "done"]},
+)
 
-    def test_normalize_integer_signed(self):
-        """Integer with negative min normalizes to unsigned."""
-        layout = FieldLayout(
-            name="temp",
-            type="integer",
-            offset=0,
-            bits=5,
-            constraints={"min": -10, "max": 10},
-        )
-        # -5 - (-10) = 5
-        assert normalize_value(-5, layout) == 5
 
-    def test_normalize_integer_at_min(self):
-        """Integer at minimum normalizes to 0."""
-        layout = FieldLayout(
-            name="temp",
-            type="integer",
-            offset=0,
-            bits=5,
-            constraints={"min": -10, "max": 10},
-        )
-        assert normalize_value(-10, layout) == 0
+class TestNormalizeValue:
+    """Test value normalization for different field types."""
 
-    def test_normalize_integer_at_max(self):
-        """Integer at maximum normalizes correctly."""
-        layout = FieldLayout(
-            name="temp",
-            type="integer",
-            offset=0,
-            bits=5,
-            constraints={"min": -10, "max": 10},
-        )
-        # 10 - (-10) = 20
-        assert normalize_value(10, layout) == 20
+    @pytest.mark.parametrize(
+        ("value", "layout", "expected"),
+        [
+            pytest.param(True, _BOOL_LAYOUT, 1, id="boolean-true"),
+            pytest.param(False, _BOOL_LAYOUT, 0, id="boolean-false"),
+            # Integers normalize by subtracting min
+            pytest.param(42, _AGE_LAYOUT, 42, id="integer-unsigned"),
+            pytest.param(-5, _TEMP_LAYOUT, 5, id="integer-signed"),
+            pytest.param(-10, _TEMP_LAYOUT, 0, id="integer-at-min"),
+            pytest.param(10, _TEMP_LAYOUT, 20, id="integer-at-max"),
+            # Enums normalize to their index in the values list
+            pytest.param("idle", _STATUS_LAYOUT, 0, id="enum-first"),
+            pytest.param("active", _STATUS_LAYOUT, 1, id="enum-middle"),
+            pytest.param("done", _STATUS_LAYOUT, 2, id="enum-last"),
+        ],
+    )
+    def test_normalize(self, value, layout, expected):
+        """Values normalize to the unsigned integer that gets packed."""
+        assert normalize_value(value, layout) == expected
+
+    def test_normalize_enum_unknown_value(self):
+        """Enum value outside the allowed list raises EncodingError."""
+        with pytest.raises(EncodingError, match="not in allowed values"):
+            normalize_value("paused", _STATUS_LAYOUT)
+
+    def test_normalize_enum_reads_cached_index(self):
+        """Enum lookups use the index dict cached with the layout's constants."""
+        index = layout_constants(_STATUS_LAYOUT).enum_index
+        assert index is layout_constants(_STATUS_LAYOUT).enum_index
+        assert index == {"idle": 0, "active": 1, "done": 2}
+        assert normalize_value("done", _STATUS_LAYOUT) == index["done"]
+
+    def test_normalize_unknown_type(self):
+        """A layout type with no normalizer raises ValueError."""
+        layout = FieldLayout(name="ratio", type="float", offset=0, bits=8, constraints={})
+        with pytest.raises(ValueError, match="Unknown field type: float"):
+            normalize_value(0.5, layout)
 
-    def test_normalize_enum_first_value(self):
-        """Enum first value normalizes to index 0."""
-        layout = FieldLayout(
-            name="status",
-            type="enum",
-            offset=0,
-            bits=2,
-            constraints={"values": ["idle", "active", "done"]},
-        )
-        assert normalize_value("idle", layout) == 0
 
-    def test_normalize_enum_middle_value(self):
-        """Enum middle value normalizes to correct index."""
-        layout = FieldLayout(
-            name="status",
-            type="enum",
-            offset=0,
-            bits=2,
-            constraints={"values": ["idle", "active", "done"]},
-        )
-        assert normalize_value("active", layout) == 1
+class TestEncodeSingleField:
+    """Test encoding single fields at offset 0."""
 
-    def test_normalize_enum_last_value(self):
-        """Enum last value normalizes to correct index."""
-        layout = FieldLayout(
+    @pytest.mark.parametrize(
+        ("layout", "value", "expected"),
+        [
+            pytest.param(_BOOL_LAYOUT, True, 1, id="boolean-true"),
+            pytest.param(_BOOL_LAYOUT, False, 0, id="boolean-false"),
+            pytest.param(_AGE_LAYOUT, 42, 42, id="integer-unsigned"),
+            # -5 - (-10) = 5
+            pytest.param(_TEMP_LAYOUT, -5, 5, id="integer-signed"),
+            pytest.param(_STATUS_LAYOUT, "idle", 0, id="enum-first"),
+            pytest.param(_STATUS_LAYOUT, "active", 1, id="enum-middle"),
+        ],
+    )
+    def test_encode_single_field(self, layout, value, expected):
+        """A single field at offset 0 encodes to its normalized value."""
+        assert encode({layout.name: value}, [layout]) == expected
+
+
+_ACTIVE = FieldLayout(name="active", type="boolean", offset=0, bits=1, constraints={})
+_AGE_AT_1 = FieldLayout(
+    name="age", type="integer", offset=1, bits=7, constraints={"min": 0, "max": 127}
+)
+
+
+@pytest.fixture(scope="class")
+def two_bool_layouts():
+    """active (offset 0) and enabled (offset 1), with their compiled encoder."""
+    layouts = [
+        _ACTIVE,
+        FieldLayout(name="enabled", type="boolean", offset=1, bits=1, constraints={}),
+    ]
+    return layouts, compile_encoder(layouts)
+
+
+@pytest.fixture(scope="class")
+def bool_int_layouts():
+    """active (offset 0) and age (offset 1), with their compiled encoder."""
+    layouts = [_ACTIVE, _AGE_AT_1]
+    return layouts, compile_encoder(layouts)
+
+
+@pytest.fixture(scope="class")
+def three_field_layouts():
+    """active, age and status (offset 8), with their compiled encoder."""
+    layouts = [
+        _ACTIVE,
+        _AGE_AT_1,
+        FieldLayout(
             name="status",
             type="enum",
-            offset=0,
+            offset=8,
             bits=2,
             constraints={"values": ["idle", "active", "done"]},
-        )
-        assert normalize_value("done", layout) == 2
-
-
-class TestEncodeSingleField:
-    """Test encoding single fields at offset 0."""
-
-    def test_encode_boolean_true(self):
-        """Encode True at offset 0 returns 1."""
-        layouts = [
-            FieldLayout(name="active", type="boolean", offset=0, bits=1, constraints={})
-        ]
-        data = {"active": True}
-        assert encode(data, layouts) == 1
-
-    def test_encode_boolean_false(self):
-        """Encode False at offset 0 returns 0."""
-        layouts = [
-            FieldLayout(name="active", type="boolean", offset=0, bits=1, constraints={})
-        ]
-        data = {"active": False}
-        assert encode(data, layouts) == 0
-
-    def test_encode_integer_unsigned(self):
-        """Encode unsigned integer at offset 0."""
-        layouts = [
-            FieldLayout(
-                name="age",
-                type="integer",
-                offset=0,
-                bits=7,
-                constraints={"min": 0, "max": 127},
-            )
-        ]
-        data = {"age": 42}
-        assert encode(data, layouts) == 42
-
-    def test_encode_integer_signed(self):
-        """Encode signed integer normalizes to unsigned."""
-        layouts = [
-            FieldLayout(
-                name="temp",
-                type="integer",
-                offset=0,
-                bits=5,
-                constraints={"min": -10, "max": 10},
-            )
-        ]
-        data = {"temp": -5}
-        # -5 - (-10) = 5
-        assert encode(data, layouts) == 5
-
-    def test_encode_enum_first(self):
-        """Encode enum first value to index 0."""
-        layouts = [
-            FieldLayout(
-                name="status",
-                type="enum",
-                offset=0,
-                bits=2,
-                constraints={"values": ["idle", "active", "done"]},
-            )
-        ]
-        data = {"status": "idle"}
-        assert encode(data, layouts) == 0
-
-    def test_encode_enum_middle(self):
-        """Encode enum middle value to correct index."""
-        layouts = [
-            FieldLayout(
-                name="status",
-                type="enum",
-                offset=0,
-                bits=2,
-                constraints={"values": ["idle", "active", "done"]},
-            )
-        ]
-        data = {"status": "active"}
-        assert encode(data, layouts) == 1
+        ),
+    ]
+    return layouts, compile_encoder(layouts)
 
 
 class TestEncodeMultipleFields:
-    """Test encoding multiple fields with correct offsets."""
+    """Test encoding multiple fields with correct offsets.
+
+    Layouts and compiled encoders come from class-scoped fixtures; each test
+    checks encode() and the compiled encoder agree on the expected value.
+    """
 
-    def test_encode_two_booleans(self):
+    def test_encode_two_booleans(self, two_bool_layouts):
         """Encode two boolean fields at different offsets."""
-        layouts = [
-            FieldLayout(name="active", type="boolean", offset=0, bits=1, constraints={}),
-            FieldLayout(name="enabled", type="boolean", offset=1, bits=1, constraints={}),
-        ]
+        layouts, encoder = two_bool_layouts
         # active=True (1 at offset 0), enabled=True (1 at offset 1)
         # Binary: 0b11 = 3
         data = {"active": True, "enabled": True}
-        assert encode(data, layouts) == 0b11
+        assert encode(data, layouts) == encoder(data) == 0b11
 
-    def test_encode_boolean_and_integer(self):
+    def test_encode_boolean_and_integer(self, bool_int_layouts):
         """Encode boolean at offset 0, integer at offset 1."""
-        layouts = [
-            FieldLayout(name="active", type="boolean", offset=0, bits=1, constraints={}),
-            FieldLayout(
-                name="age",
-                type="integer",
-                offset=1,
-                bits=7,
-                constraints={"min": 0, "max": 127},
-            ),
-        ]
+        layouts, encoder = bool_int_layouts
         # active=True (1 at offset 0), age=42 (42 at offset 1)
         # 1 | (42 << 1) = 1 | 84 = 85
         # Binary: 0b1010101 = 85
         data = {"active": True, "age": 42}
-        assert encode(data, layouts) == 85
+        assert encode(data, layouts) == encoder(data) == 85
 
-    def test_encode_three_fields(self):
+    def test_encode_three_fields(self, three_field_layouts):
         """Encode three fields with different types."""
-        layouts = [
-            FieldLayout(name="active", type="boolean", offset=0, bits=1, constraints={}),
-            FieldLayout(
-                name="age",
-                type="integer",
-                offset=1,
-                bits=7,
-                constraints={"min": 0, "max": 127},
-            ),
-            FieldLayout(
-                name="status",
-                type="enum",
-                offset=8,
-                bits=2,
-                constraints={"values": ["idle", "active", "done"]},
-            ),
-        ]
+        layouts, encoder = three_field_layouts
         # active=True (1 at offset 0)
         # age=42 (42 at offset 1)
         # status="done" (2 at offset 8)
         # 1 | (42 << 1) | (2 << 8) = 1 | 84 | 512 = 597
         data = {"active": True, "age": 42, "status": "done"}
-        assert encode(data, layouts) == 597
+        assert encode(data, layouts) == encoder(data) == 597
 
 
 class TestEncodeNullableFields:
@@ -381,6 +308,35 @@ class TestEncodeValidation:
         with pytest.raises(EncodingError, match="expected integer"):
             encode(data, layouts)
 
+    def test_encode_reports_missing_field_before_invalid_value(self):
+        """Missing required fields are reported first, as validate_data does."""
+        layouts = [
+            FieldLayout(
+                name="age",
+                type="integer",
+                offset=0,
+                bits=7,
+                constraints={"min": 0, "max": 127},
+            ),
+            FieldLayout(name="active", type="boolean", offset=7, bits=1, constraints={}),
+        ]
+        with pytest.raises(EncodingError, match="required field 'active' is missing"):
+            encode({"age": 200}, layouts)
+
+    def test_encode_accepts_values_the_validator_accepts(self):
+        """int subclasses and layouts without a max constraint still encode."""
+        import enum
+
+        class Level(enum.IntEnum):
+            HIGH = 3
+
+        layouts = [
+            FieldLayout(name="level", type="integer", offset=0, bits=2, constraints={"min": 0}),
+        ]
+        assert encode({"level": Level.HIGH}, layouts) == 3
+        # No max constraint: values beyond the field width are masked
+        assert encode({"level": 5}, layouts) == 1
+
 
 class TestEncodeEdgeCases:
     """Test edge cases and boundary conditions."""
@@ -420,3 +376,222 @@ class TestEncodeEdgeCases:
         ]
         data = {"active": True, "extra": "ignored"}
         assert encode(data, layouts) == 1
+
+    def test_encode_derives_constants_once_per_layout(self, monkeypatch):
+        """Repeat encodes reuse cached constants instead of re-deriving them."""
+        import bitschema.layout as layout_module
+
+        calls = []
+        original = layout_module.field_constants
+        monkeypatch.setattr(
+            layout_module, "field_constants",
+            lambda layout: calls.append(layout) or original(layout),
+        )
+        layouts = [
+            FieldLayout(name="active", type="boolean", offset=0, bits=1, constraints={}),
+            FieldLayout(
+                name="status", type="enum", offset=1, bits=2,
+                constraints={"values": ["idle", "active", "done"]},
+            ),
+        ]
+
+        for _ in range(3):
+            assert encode({"active": True, "status": "done"}, layouts) == 0b101
+        assert len(calls) == 2
+
+
+class TestEncodeMany:
+    """Test batch encoding of multiple records."""
+
+    def test_encode_many_matches_encode(self):
+        """Each batch result equals the single-record encoding."""
+        layouts = [
+            FieldLayout(name="active", type="boolean", offset=0, bits=1, constraints={}),
+            FieldLayout(
+                name="age",
+                type="integer",
+                offset=1,
+                bits=7,
+                constraints={"min": 0, "max": 127},
+            ),
+        ]
+        records = [{"active": True, "age": 42}, {"active": False, "age": 0}]
+        assert encode_many(records, layouts) == [encode(r, layouts) for r in records]
+
+    def test_encode_many_empty(self):
+        """Empty input produces empty output."""
+        layouts = [
+            FieldLayout(name="active", type="boolean", offset=0, bits=1, constraints={})
+        ]
+        assert encode_many([], layouts) == []
+
+    def test_encode_many_validates_each_record(self):
+        """Invalid record in batch raises EncodingError."""
+        layouts = [
+            FieldLayout(
+                name="age",
+                type="integer",
+                offset=0,
+                bits=7,
+                constraints={"min": 0, "max": 100},
+            )
+        ]
+        with pytest.raises(EncodingError, match="exceeds maximum"):
+            encode_many([{"age": 50}, {"age": 150}], layouts)
+
+    def test_encode_many_reports_first_bad_record(self):
+        """Errors match encode() for the first invalid record, in record order."""
+        layouts = [
+            FieldLayout(name="active", type="boolean", offset=0, bits=1, constraints={}),
+            FieldLayout(
+                name="age",
+                type="integer",
+                offset=1,
+                bits=7,
+                constraints={"min": 0, "max": 100},
+            ),
+        ]
+        records = [{"active": True, "age": 150}, {"age": 5}]
+        with pytest.raises(EncodingError, match="exceeds maximum"):
+            encode_many(records, layouts)
+        with pytest.raises(EncodingError, match="required field 'active' is missing"):
+            encode_many(records[::-1], layouts)
+
+
+class TestEncodeColumns:
+    """Test column-oriented batch encoding."""
+
+    LAYOUTS = [
+        FieldLayout(name="active", type="boolean", offset=0, bits=1, constraints={}),
+        FieldLayout(
+            name="status",
+            type="enum",
+            offset=1,
+            bits=2,
+            constraints={"values": ["idle", "busy", "away"]},
+        ),
+        FieldLayout(
+            name="temp",
+            type="integer",
+            offset=3,
+            bits=6,
+            constraints={"min": -20, "max": 40},
+            nullable=True,
+        ),
+    ]
+
+    def test_encode_columns_matches_encode(self):
+        """Each row encodes exactly like the single-record encoder."""
+        records = [
+            {"active": True, "status": "busy", "temp": -20},
+            {"active": False, "status": "away", "temp": None},
+            {"active": True, "status": "idle", "temp": 40},
+        ]
+        columns = {name: [r[name] for r in records] for name in ("active", "status", "temp")}
+
+        assert encode_columns(columns, self.LAYOUTS) == [
+            encode(r, self.LAYOUTS) for r in records
+        ]
+
+    def test_encode_columns_omitted_nullable_column(self):
+        """A missing nullable column encodes as None in every row."""
+        columns = {"active": [True, False], "status": ["idle", "busy"]}
+        expected = [
+            encode({"active": True, "status": "idle"}, self.LAYOUTS),
+            encode({"active": False, "status": "busy"}, self.LAYOUTS),
+        ]
+        assert encode_columns(columns, self.LAYOUTS) == expected
+
+    def test_encode_columns_empty(self):
+        """Empty columns produce empty output."""
+        assert encode_columns({"active": [], "status": []}, self.LAYOUTS) == []
+
+    def test_encode_columns_missing_required_column(self):
+        """A missing non-nullable column raises EncodingError."""
+        with pytest.raises(EncodingError, match="required field 'status' is missing"):
+            encode_columns({"active": [True]}, self.LAYOUTS)
+
+    def test_encode_columns_rejects_ragged_columns(self):
+        """Columns of different lengths raise EncodingError."""
+        with pytest.raises(EncodingError, match="different lengths"):
+            encode_columns({"active": [True, False], "status": ["idle"]}, self.LAYOUTS)
+
+    def test_encode_columns_validates_values(self):
+        """Invalid values anywhere in a column raise EncodingError."""
+        with pytest.raises(EncodingError, match="exceeds maximum"):
+            encode_columns(
+                {"active": [True, True], "status": ["idle", "busy"], "temp": [0, 41]},
+                self.LAYOUTS,
+            )
+
+
+class TestCompileEncoder:
+    """Test encoders specialized to a layout list."""
+
+    LAYOUTS = TestEncodeColumns.LAYOUTS + [
+        FieldLayout(
+            name="day",
+            type="date",
+            offset=10,
+            bits=9,
+            constraints={"resolution": "day", "min_date": "2024-01-01"},
+            nullable=True,
+        ),
+    ]
+
+    @pytest.mark.parametrize(
+        "data",
+        [
+            {"active": True, "status": "busy", "temp": -20, "day": "2024-03-01"},
+            {"active": False, "status": "away", "temp": None, "day": None},
+            {"active": True, "status": "idle", "temp": 40},
+        ],
+    )
+    def test_matches_encode(self, data):
+        """Compiled encoder packs exactly what encode() packs."""
+        assert compile_encoder(self.LAYOUTS)(data) == encode(data, self.LAYOUTS)
+
+    @pytest.mark.parametrize(
+        "perms",
+        [{"read": True, "admin": 1}, {}, None, {"read": False, "write": True}],
+    )
+    def test_bitmask_matches_encode(self, perms):
+        """Inlined bitmask packing matches encode(), including None and empty dicts."""
+        layouts = [
+            FieldLayout(name="active", type="boolean", offset=0, bits=1, constraints={}),
+            FieldLayout(
+                name="perms",
+                type="bitmask",
+                offset=1,
+                bits=5,
+                constraints={"flags": {"read": 0, "write": 1, "admin": 3}},
+                nullable=True,
+            ),
+        ]
+        data = {"active": True, "perms": perms}
+        assert compile_encoder(layouts)(data) == encode(data, layouts)
+
+    def test_compiled_encoder_is_cached(self):
+        """Equal layout lists share one compiled encoder."""
+        assert compile_encoder(self.LAYOUTS) is compile_encoder(list(self.LAYOUTS))
+
+    def test_no_fields(self):
+        """An empty layout list encodes to 0."""
+        assert compile_encoder([])({}) == 0
+
+    @pytest.mark.parametrize(
+        ("data", "message"),
+        [
+            ({"active": True, "status": "idle", "temp": 41}, "exceeds maximum"),
+            ({"active": 1, "status": "idle"}, "expected bool"),
+            ({"active": True, "status": "gone"}, "not in allowed values"),
+            ({"active": True}, "required field 'status' is missing"),
+        ],
+    )
+    def test_errors_match_encode(self, data, message):
+        """Invalid data raises the same EncodingError as encode()."""
+        with pytest.raises(EncodingError, match=message) as compiled:
+            compile_encoder(self.LAYOUTS)(data)
+        with pytest.raises(EncodingError) as reference:
+            encode(data, self.LAYOUTS)
+        assert str(compiled.value) == str(reference.value)
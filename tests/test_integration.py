@@ -10,45 +10,36 @@ Tests end-to-end workflow:
 
 import json
 import pytest
-from pathlib import Path
 
-from bitschema import BitSchema, encode, decode
+from bitschema import (
+    BitSchema,
+    compile_decoder,
+    compile_encoder,
+    decode,
+    decode_many,
+    encode,
+    encode_many,
+)
 from bitschema.parser import parse_schema_file
 from bitschema.layout import compute_bit_layout
 from bitschema.output import generate_output_schema
 from bitschema.models import IntFieldDefinition, BoolFieldDefinition, EnumFieldDefinition, BitmaskFieldDefinition
 
 
-def test_json_file_to_output_schema():
-    """Full pipeline: JSON file → parsed schema → layout → output."""
-    # Use existing test fixture
-    schema_path = Path("tests/fixtures/valid_schema.json")
+@pytest.mark.parametrize("fmt", ["json", "yaml"])
+def test_file_to_output_schema(fmt, request):
+    """Full pipeline: schema file → parsed schema → layout → output.
 
-    # Step 1: Parse schema file
-    schema = parse_schema_file(schema_path)
+    The JSON and YAML fixtures describe the same schema, so both formats
+    must produce the same output.
+    """
+    # Step 1: Parse schema file (session fixture)
+    schema = request.getfixturevalue(f"valid_{fmt}_schema")
     assert isinstance(schema, BitSchema)
     assert schema.name == "UserFlags"
 
     # Step 2: Convert to layout format and compute layout
-    fields_dict = []
-    for name, field_def in schema.fields.items():
-        field_dict = {"name": name}
-        if isinstance(field_def, BoolFieldDefinition):
-            field_dict["type"] = "boolean"
-        elif isinstance(field_def, IntFieldDefinition):
-            field_dict.update({
-                "type": "integer",
-                "min": field_def.min,
-                "max": field_def.max
-            })
-        elif isinstance(field_def, EnumFieldDefinition):
-            field_dict.update({
-                "type": "enum",
-                "values": field_def.values
-            })
-        fields_dict.append(field_dict)
-
-    layouts, total_bits = compute_bit_layout(fields_dict)
+    layouts, total_bits = compute_bit_layout(schema.to_layout_inputs())
     assert total_bits > 0
 
     # Step 3: Generate output schema
@@ -59,119 +50,11 @@ def test_json_file_to_output_schema():
     assert output["total_bits"] == total_bits
     assert len(output["fields"]) == 3
 
+    # Field names from the input file are preserved, in order
+    assert [field["name"] for field in output["fields"]] == list(schema.fields)
 
-def test_yaml_file_to_output_schema():
-    """Full pipeline: YAML file → parsed schema → layout → output."""
-    # Use existing YAML fixture (matches valid_schema.json)
-    yaml_path = Path("tests/fixtures/valid_schema.yaml")
-
-    # Step 1: Parse YAML schema file
-    schema = parse_schema_file(yaml_path)
-    assert isinstance(schema, BitSchema)
-    assert schema.name == "UserFlags"
-
-    # Step 2: Compute layout
-    fields_dict = []
-    for name, field_def in schema.fields.items():
-        field_dict = {"name": name}
-        if isinstance(field_def, BoolFieldDefinition):
-            field_dict["type"] = "boolean"
-        elif isinstance(field_def, IntFieldDefinition):
-            field_dict.update({
-                "type": "integer",
-                "min": field_def.min,
-                "max": field_def.max
-            })
-        elif isinstance(field_def, EnumFieldDefinition):
-            field_dict.update({
-                "type": "enum",
-                "values": field_def.values
-            })
-        fields_dict.append(field_dict)
-
-    layouts, total_bits = compute_bit_layout(fields_dict)
-
-    # Step 3: Generate output
-    output = generate_output_schema(schema, layouts, total_bits)
-
-    # Verify output matches JSON version
-    assert output["version"] == "1"
-    assert output["total_bits"] == total_bits
-    assert len(output["fields"]) == 3
-
-
-def test_pipeline_field_names_preserved():
-    """Field names from input file should match output field names."""
-    schema_path = Path("tests/fixtures/valid_schema.json")
-
-    schema = parse_schema_file(schema_path)
-
-    # Get input field names
-    input_names = list(schema.fields.keys())
-
-    # Compute layout
-    fields_dict = []
-    for name, field_def in schema.fields.items():
-        field_dict = {"name": name}
-        if isinstance(field_def, BoolFieldDefinition):
-            field_dict["type"] = "boolean"
-        elif isinstance(field_def, IntFieldDefinition):
-            field_dict.update({
-                "type": "integer",
-                "min": field_def.min,
-                "max": field_def.max
-            })
-        elif isinstance(field_def, EnumFieldDefinition):
-            field_dict.update({
-                "type": "enum",
-                "values": field_def.values
-            })
-        fields_dict.append(field_dict)
-
-    layouts, total_bits = compute_bit_layout(fields_dict)
-    output = generate_output_schema(schema, layouts, total_bits)
-
-    # Get output field names
-    output_names = [field["name"] for field in output["fields"]]
-
-    # Verify all input names present in output
-    assert input_names == output_names
-
-
-def test_pipeline_total_bits_correct():
-    """Computed total_bits should match output total_bits."""
-    schema_path = Path("tests/fixtures/valid_schema.json")
-
-    schema = parse_schema_file(schema_path)
-
-    # Compute layout
-    fields_dict = []
-    for name, field_def in schema.fields.items():
-        field_dict = {"name": name}
-        if isinstance(field_def, BoolFieldDefinition):
-            field_dict["type"] = "boolean"
-        elif isinstance(field_def, IntFieldDefinition):
-            field_dict.update({
-                "type": "integer",
-                "min": field_def.min,
-                "max": field_def.max
-            })
-        elif isinstance(field_def, EnumFieldDefinition):
-            field_dict.update({
-                "type": "enum",
-                "values": field_def.values
-            })
-        fields_dict.append(field_dict)
-
-    layouts, total_bits = compute_bit_layout(fields_dict)
-    output = generate_output_schema(schema, layouts, total_bits)
-
-    # Verify total_bits matches
-    assert output["total_bits"] == total_bits
-
-    # Verify total_bits equals sum of field bits
-    sum_of_bits = sum(field["bits"] for field in output["fields"])
-    assert output["total_bits"] == sum_of_bits
+    # total_bits equals the sum of field bits
+    assert output["total_bits"] == sum(field["bits"] for field in output["fields"])
 
 
 def test_public_api_imports():
@@ -346,11 +229,19 @@ def test_e2e_user_profile_schema_encode_decode():
         },
     ]
 
-    for test_user in test_cases:
-        encoded_test = encode(test_user, layouts)
-        decoded_test = decode(encoded_test, layouts)
-        assert decoded_test == test_user, f"Round-trip failed for {test_user}"
+    # Encode and decode the profiles as one batch; the columnar batch path
+    # must pack exactly what encode() packs record by record
+    encoded_values = encode_many(test_cases, layouts)
+    assert encoded_values == [encode(user, layouts) for user in test_cases]
+    assert decode_many(encoded_values, layouts) == test_cases
+
+    # The layout-specialized (runtime-compiled) encoder and decoder agree
+    # with the generic ones
+    encode_user = compile_encoder(layouts)
+    decode_user = compile_decoder(layouts)
+    for user, encoded_user in zip(test_cases, encoded_values):
+        assert encode_user(user) == encoded_user
+        assert decode_user(encoded_user) == user
 
     # Step 7: Verify each encoded value is unique
-    encoded_values = [encode(user, layouts) for user in test_cases]
     assert len(encoded_values) == len(set(encoded_values)), "Different users should encode to different integers"
@@ -11,17 +11,33 @@ from bitschema.layout import compute_bit_layout
 from bitschema.jsonschema import generate_json_schema
 
 
+def _schema_with_layouts(name, **fields):
+    """Build a BitSchema from field definitions and compute its layouts."""
+    schema = BitSchema(version="1", name=name, fields=fields)
+    layouts, total_bits = compute_bit_layout(schema.to_layout_inputs())
+    return schema, layouts, total_bits
+
+
+# Schemas shared by several tests, built once at import
+_ACTIVE = _schema_with_layouts(
+    "TestSchema", active=BoolFieldDefinition(type="bool", nullable=False)
+)
+_ACTIVE_PROFILE = _schema_with_layouts(
+    "UserProfile", active=BoolFieldDefinition(type="bool", nullable=False)
+)
+_ACTIVE_AGE = _schema_with_layouts(
+    "TestSchema",
+    active=BoolFieldDefinition(type="bool", nullable=False),
+    age=IntFieldDefinition(type="int", bits=7, signed=False, min=0, max=100),
+)
+
+
 class TestBooleanFieldMapping:
     """Test boolean field mapping to JSON Schema."""
 
     def test_non_nullable_boolean(self):
         """Boolean field maps to {"type": "boolean"}."""
-        schema = BitSchema(
-            version="1",
-            name="TestSchema",
-            fields={"active": BoolFieldDefinition(type="bool", nullable=False)},
-        )
-        layouts, _ = compute_bit_layout([{"name": "active", "type": "boolean"}])
+        schema, layouts, _ = _ACTIVE
 
         result = generate_json_schema(schema, layouts)
 
@@ -237,12 +253,7 @@ class TestSchemaMandatoryFields:
 
     def test_includes_mandatory_fields(self):
         """Generated schema includes all mandatory Draft 2020-12 fields."""
-        schema = BitSchema(
-            version="1",
-            name="UserProfile",
-            fields={"active": BoolFieldDefinition(type="bool", nullable=False)},
-        )
-        layouts, _ = compute_bit_layout([{"name": "active", "type": "boolean"}])
+        schema, layouts, _ = _ACTIVE_PROFILE
 
         result = generate_json_schema(schema, layouts)
 
@@ -254,12 +265,7 @@ class TestSchemaMandatoryFields:
 
     def test_includes_title_and_id(self):
         """Schema includes title and $id fields."""
-        schema = BitSchema(
-            version="1",
-            name="UserProfile",
-            fields={"active": BoolFieldDefinition(type="bool", nullable=False)},
-        )
-        layouts, _ = compute_bit_layout([{"name": "active", "type": "boolean"}])
+        schema, layouts, _ = _ACTIVE_PROFILE
 
         result = generate_json_schema(schema, layouts)
 
@@ -269,12 +275,7 @@ class TestSchemaMandatoryFields:
 
     def test_additional_properties_false(self):
         """Schema sets additionalProperties to false."""
-        schema = BitSchema(
-            version="1",
-            name="TestSchema",
-            fields={"active": BoolFieldDefinition(type="bool", nullable=False)},
-        )
-        layouts, _ = compute_bit_layout([{"name": "active", "type": "boolean"}])
+        schema, layouts, _ = _ACTIVE
 
         result = generate_json_schema(schema, layouts)
 
@@ -286,22 +287,7 @@ class TestMetadataFields:
 
     def test_includes_bitschema_metadata(self):
         """Schema includes x-bitschema-* metadata fields."""
-        schema = BitSchema(
-            version="1",
-            name="TestSchema",
-            fields={
-                "active": BoolFieldDefinition(type="bool", nullable=False),
-                "age": IntFieldDefinition(
-                    type="int", bits=7, signed=False, min=0, max=100
-                ),
-            },
-        )
-        layouts, total_bits = compute_bit_layout(
-            [
-                {"name": "active", "type": "boolean"},
-                {"name": "age", "type": "integer", "min": 0, "max": 100},
-            ]
-        )
+        schema, layouts, total_bits = _ACTIVE_AGE
 
         result = generate_json_schema(schema, layouts)
 
@@ -355,37 +341,27 @@ class TestSchemaValidation:
         """Generated schema can validate sample data."""
         try:
             import jsonschema
-            from jsonschema import validate
+            from jsonschema import Draft202012Validator
         except ImportError:
             pytest.skip("jsonschema library not installed")
 
-        schema = BitSchema(
-            version="1",
-            name="TestSchema",
-            fields={
-                "active": BoolFieldDefinition(type="bool", nullable=False),
-                "age": IntFieldDefinition(
-                    type="int", bits=7, signed=False, min=0, max=100
-                ),
-            },
-        )
-        layouts, _ = compute_bit_layout(
-            [
-                {"name": "active", "type": "boolean"},
-                {"name": "age", "type": "integer", "min": 0, "max": 100},
-            ]
-        )
+        schema, layouts, _ = _ACTIVE_AGE
 
         json_schema = generate_json_schema(schema, layouts)
 
+        # Check against the meta-schema once and build one validator;
+        # jsonschema.validate() would redo both for every instance
+        Draft202012Validator.check_schema(json_schema)
+        validator = Draft202012Validator(json_schema)
+
         # Valid data should pass
         valid_data = {"active": True, "age": 25}
-        validate(instance=valid_data, schema=json_schema)
+        validator.validate(valid_data)
 
         # Invalid data should fail
         invalid_data = {"active": True, "age": 200}  # age exceeds maximum
         with pytest.raises(jsonschema.ValidationError):
-            validate(instance=invalid_data, schema=json_schema)
+            validator.validate(invalid_data)
 
 
 class TestMultipleFields:
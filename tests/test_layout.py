@@ -1,9 +1,16 @@
 """Tests for bit layout computation."""
 
 import pytest
+from datetime import datetime
 
 from bitschema.errors import SchemaError
-from bitschema.layout import FieldLayout, compute_bit_layout
+from bitschema.layout import (
+    FieldLayout,
+    compile_layouts,
+    compute_bit_layout,
+    field_constants,
+    layout_constants,
+)
 
 
 # Mock field objects for testing without full Pydantic models
@@ -322,3 +329,211 @@ def test_64_bit_limit_includes_presence_bits():
     error = exc_info.value
     assert "exceeds 64-bit limit" in error.message.lower()
     assert "65 bits" in error.message
+
+
+def test_compile_layouts_precomputes_per_field_constants():
+    """compile_layouts() exposes offsets, masks and mins as parallel tuples."""
+    layouts, _ = compute_bit_layout([
+        {"name": "active", "type": "boolean"},
+        {"name": "temp", "type": "integer", "min": -10, "max": 10, "nullable": True},
+        {"name": "status", "type": "enum", "values": ["a", "b", "c"]},
+    ])
+    compiled = compile_layouts(layouts)
+
+    assert compiled.layouts == tuple(layouts)
+    assert compiled.constants == tuple(field_constants(layout) for layout in layouts)
+    assert compiled.names == ("active", "temp", "status")
+    assert compiled.types == ("boolean", "integer", "enum")
+    assert compiled.value_offsets == (0, 2, 7)
+    assert compiled.masks == (1, 31, 3)
+    assert compiled.presence_offsets == (None, 1, None)
+    assert compiled.min_values == (0, -10, 0)
+
+
+def test_compile_layouts_is_cached_per_layout_list():
+    """Repeat calls share one CompiledLayout; changing the list recompiles."""
+    layouts, _ = compute_bit_layout([
+        {"name": "active", "type": "boolean"},
+        {"name": "count", "type": "integer", "min": 0, "max": 7},
+    ])
+    compiled = compile_layouts(layouts)
+
+    assert compile_layouts(layouts) is compiled
+    assert compiled.fields == tuple(zip(layouts, compiled.constants))
+
+    layouts.pop()
+    assert compile_layouts(layouts).names == ("active",)
+
+
+def test_layout_constants_are_derived_once_per_layout(monkeypatch):
+    """layout_constants() calls field_constants() once per FieldLayout object."""
+    import bitschema.layout as layout_module
+
+    calls = []
+    original = layout_module.field_constants
+    monkeypatch.setattr(
+        layout_module, "field_constants",
+        lambda layout: calls.append(layout) or original(layout),
+    )
+    layout = FieldLayout(
+        name="n", type="integer", offset=0, bits=4, constraints={"min": 0, "max": 7},
+    )
+
+    assert layout_constants(layout) is layout_constants(layout)
+    assert layout_constants(layout._replace(offset=4)).value_offset == 4
+    assert len(calls) == 2
+
+
+def test_field_constants_derives_masks_offsets_and_enum_values():
+    """Masks, value offsets, mins and enum tuples are derived from the layout."""
+    temp = field_constants(FieldLayout(
+        name="temp", type="integer", offset=3, bits=6,
+        constraints={"min": -10, "max": 20}, nullable=True,
+    ))
+    status = field_constants(FieldLayout(
+        name="status", type="enum", offset=0, bits=2,
+        constraints={"values": ["a", "b", "c"]},
+    ))
+
+    assert (temp.value_offset, temp.mask, temp.min_value) == (4, 31, -10)
+    assert temp.enum_values is None
+    assert (status.value_offset, status.mask, status.min_value) == (0, 3, 0)
+    assert status.enum_values == ("a", "b", "c")
+    assert (temp.type_code, status.type_code) == (1, 2)
+    assert (temp.presence_bit, status.presence_bit) == (0b1000, 0)
+
+
+def test_field_layout_is_a_plain_named_tuple():
+    """FieldLayout keeps tuple unpacking, indexing, _replace and _asdict."""
+    layout = FieldLayout(name="flag", type="boolean", offset=0, bits=1, constraints={})
+
+    name, type_, offset, bits, constraints, nullable = layout
+    assert (name, type_, offset, bits, constraints, nullable) == (
+        "flag", "boolean", 0, 1, {}, False,
+    )
+    assert layout[2] == 0
+    assert layout._replace(offset=4).offset == 4
+    assert layout._asdict()["name"] == "flag"
+    assert repr(layout) == (
+        "FieldLayout(name='flag', type='boolean', offset=0, bits=1, "
+        "constraints={}, nullable=False)"
+    )
+
+
+def test_field_constants_tolerates_missing_optional_constraints():
+    """Layouts without optional constraints construct and derive defaults."""
+    enum = field_constants(FieldLayout(
+        name="e", type="enum", offset=0, bits=1, constraints={},
+    ))
+    when = field_constants(FieldLayout(
+        name="d", type="date", offset=0, bits=4, constraints={"resolution": "day"},
+    ))
+    count = field_constants(FieldLayout(
+        name="n", type="integer", offset=0, bits=4, constraints={"min": None},
+    ))
+
+    assert enum.enum_values == ()
+    assert (when.min_date, when.min_ordinal, when.step_seconds) == (None, None, 86400)
+    assert (count.min_value, count.max_value) == (0, 15)
+
+
+def test_field_constants_follows_constraint_changes():
+    """Constants are derived from the constraints as they are at call time."""
+    layout = FieldLayout(
+        name="n", type="integer", offset=0, bits=4, constraints={"min": 0, "max": 7},
+    )
+    assert field_constants(layout).max_value == 7
+
+    layout.constraints["max"] = 15
+    assert field_constants(layout).max_value == 15
+
+
+def test_field_constants_parses_date_and_bitmask_constraints():
+    """Date and bitmask constraints are exposed as typed scalar attributes."""
+    when = field_constants(FieldLayout(
+        name="when", type="date", offset=0, bits=9,
+        constraints={"min_date": "2024-01-01", "max_date": "2024-12-31", "resolution": "day"},
+    ))
+    perms = field_constants(FieldLayout(
+        name="perms", type="bitmask", offset=9, bits=2,
+        constraints={"flags": {"read": 0, "write": 1}},
+    ))
+
+    assert when.min_date == datetime(2024, 1, 1)
+    assert when.resolution == "day"
+    assert when.step_seconds == 86400
+    assert when.min_ordinal == datetime(2024, 1, 1).toordinal()
+    assert when.flags is None
+    assert perms.flags == (("read", 0), ("write", 1))
+    assert perms.min_date is None
+    assert perms.step_seconds is None
+
+
+def test_layout_constants_keep_parsed_date_and_bitmask_constraints():
+    """Date and bitmask constants are parsed once and shared across calls."""
+    when = FieldLayout(
+        name="when", type="date", offset=0, bits=9,
+        constraints={"min_date": "2024-01-01", "max_date": "2024-12-31", "resolution": "day"},
+    )
+    perms = FieldLayout(
+        name="perms", type="bitmask", offset=9, bits=2,
+        constraints={"flags": {"read": 0, "write": 1}},
+    )
+
+    assert layout_constants(when).min_date is layout_constants(when).min_date
+    assert layout_constants(perms).flags is layout_constants(perms).flags
+    assert layout_constants(when) == field_constants(when)
+    assert layout_constants(perms) == field_constants(perms)
+
+
+def test_field_constants_interns_enum_values():
+    """Equal enum values from separate layouts are the same string object."""
+    first = field_constants(FieldLayout(
+        name="a", type="enum", offset=0, bits=1,
+        constraints={"values": ["".join(["id", "le"]), "busy"]},
+    ))
+    second = field_constants(FieldLayout(
+        name="b", type="enum", offset=1, bits=1,
+        constraints={"values": ["".join(["i", "dle"]), "busy"]},
+    ))
+    assert first.enum_values[0] is second.enum_values[0]
+
+
+def test_compute_bit_layout_builds_fresh_layouts_for_equal_schemas():
+    """Equal schemas get equal layouts, but never shared objects."""
+    def fields():
+        return [
+            {"name": "status", "type": "enum", "values": ["idle", "busy"]},
+            {"name": "created", "type": "date", "min_date": "2020-01-01",
+             "max_date": "2030-01-01", "resolution": "day"},
+        ]
+
+    first, first_total = compute_bit_layout(fields())
+    second, second_total = compute_bit_layout(fields())
+
+    assert (first, first_total) == (second, second_total)
+    assert all(a.constraints is not b.constraints for a, b in zip(first, second))
+
+
+def test_compute_bit_layout_cache_ignores_caller_mutation():
+    """Mutating returned layouts or input fields does not leak into later calls."""
+    fields = [{"name": "count", "type": "integer", "min": 0, "max": 3}]
+    layouts, _ = compute_bit_layout(fields)
+    layouts[0].constraints["max"] = 1000
+
+    assert compute_bit_layout(fields)[0][0].constraints == {"min": 0, "max": 3}
+
+    fields[0]["max"] = 255
+    assert compute_bit_layout(fields)[0][0].bits == 8
+
+
+def test_compute_bit_layout_cache_keeps_flag_order():
+    """Bitmask specs differing only in flag order are cached separately."""
+    def fields(flags):
+        return [{"name": "perms", "type": "bitmask", "flags": flags}]
+
+    forward, _ = compute_bit_layout(fields({"read": 0, "write": 1}))
+    backward, _ = compute_bit_layout(fields({"write": 1, "read": 0}))
+
+    assert field_constants(forward[0]).flags == (("read", 0), ("write", 1))
+    assert field_constants(backward[0]).flags == (("write", 1), ("read", 0))
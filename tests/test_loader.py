@@ -56,6 +56,35 @@ class TestJSONParsing:
 
         assert "Invalid JSON" in str(exc_info.value)
 
+    def test_json_accepts_what_stdlib_accepts(self):
+        """Input a faster JSON backend rejects still parses like json.loads."""
+        content = json.dumps({
+            "version": "1",
+            "name": "Big",
+            "fields": {"n": {"type": "int", "bits": 8, "min": 0, "max": 255}},
+            "note": 2**70,
+        })
+        schema = load_from_json(content)
+        assert schema.fields["n"].max == 255
+
+    def test_json_bytes_match_text(self):
+        """UTF-8 bytes parse to the same schema as the decoded text."""
+        content = (FIXTURES_DIR / "valid_schema.json").read_bytes()
+        assert load_from_json(content) == load_from_json(content.decode("utf-8"))
+
+    def test_json_file_not_utf8(self, tmp_path):
+        """A JSON file that is not valid UTF-8 raises SchemaError."""
+        bad_file = tmp_path / "latin1.json"
+        bad_file.write_bytes('{"name": "Caf\u00e9"}'.encode("latin-1"))
+
+        with pytest.raises(SchemaError, match="Invalid JSON"):
+            load_schema(bad_file)
+
+    def test_json_error_message_is_stdlib(self):
+        """Syntax errors report json.loads' message."""
+        with pytest.raises(SchemaError, match="Expecting property name"):
+            load_from_json("{bad")
+
     def test_parse_json_with_invalid_schema(self):
         """JSON file with invalid schema (missing required field) raises SchemaError."""
         # Create a fixture with missing 'name' field
@@ -151,6 +180,23 @@ args: ['echo pwned']
         with pytest.raises(SchemaError):
             load_from_yaml(dangerous_yaml)
 
+    def test_yaml_without_libyaml_matches(self, monkeypatch):
+        """The pure-Python fallback parses YAML to the same schema."""
+        import yaml
+
+        content = (FIXTURES_DIR / "valid_schema.yaml").read_text()
+        fast = load_from_yaml(content)
+        monkeypatch.delattr(yaml, "CSafeLoader", raising=False)
+        assert load_from_yaml(content) == fast
+
+    def test_yaml_without_libyaml_rejects_python_objects(self, monkeypatch):
+        """The pure-Python fallback also refuses Python object tags."""
+        import yaml
+
+        monkeypatch.delattr(yaml, "CSafeLoader", raising=False)
+        with pytest.raises(SchemaError):
+            load_from_yaml("!!python/object/new:os.system\nargs: ['echo pwned']\n")
+
 
 class TestFileHandling:
     """Test file handling edge cases."""
@@ -162,31 +208,24 @@ class TestFileHandling:
 
         assert "does_not_exist.json" in str(exc_info.value)
 
-    def test_unsupported_extension(self):
+    def test_unsupported_extension(self, tmp_path):
         """Unsupported file extension (.txt) raises SchemaError with clear message."""
-        # Create a temporary .txt file
-        txt_file = FIXTURES_DIR / "test.txt"
+        txt_file = tmp_path / "test.txt"
         txt_file.write_text('{"version": "1", "name": "Test", "fields": {}}')
 
-        try:
-            with pytest.raises(SchemaError) as exc_info:
-                load_schema(txt_file)
+        with pytest.raises(SchemaError) as exc_info:
+            load_schema(txt_file)
 
-            assert "Unsupported file format" in str(exc_info.value)
-            assert ".txt" in str(exc_info.value)
-        finally:
-            txt_file.unlink()
+        assert "Unsupported file format" in str(exc_info.value)
+        assert ".txt" in str(exc_info.value)
 
-    def test_empty_file(self):
+    def test_empty_file(self, tmp_path):
         """Empty file raises SchemaError."""
-        empty_file = FIXTURES_DIR / "empty.json"
+        empty_file = tmp_path / "empty.json"
         empty_file.write_text("")
 
-        try:
-            with pytest.raises(SchemaError):
-                load_schema(empty_file)
-        finally:
-            empty_file.unlink()
+        with pytest.raises(SchemaError):
+            load_schema(empty_file)
 
 
 class TestPydanticIntegration:
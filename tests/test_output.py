@@ -29,23 +29,7 @@ def test_output_schema_structure():
 
     # Compute layout
     # Convert Pydantic models to dict format expected by layout module
-    fields_dict = []
-    for name, field_def in schema.fields.items():
-        field_dict = {"name": name}
-        if isinstance(field_def, BoolFieldDefinition):
-            field_dict["type"] = "boolean"
-        elif isinstance(field_def, IntFieldDefinition):
-            field_dict.update({
-                "type": "integer",
-                "min": field_def.min,
-                "max": field_def.max
-            })
-        elif isinstance(field_def, EnumFieldDefinition):
-            field_dict.update({
-                "type": "enum",
-                "values": field_def.values
-            })
-        fields_dict.append(field_dict)
+    fields_dict = schema.to_layout_inputs()
 
     layouts, total_bits = compute_bit_layout(fields_dict)
 
@@ -61,18 +61,15 @@ class TestParseSchemaFile:
         with pytest.raises(FileNotFoundError):
             parse_schema_file(FIXTURES_DIR / "does_not_exist.json")
 
-    def test_parse_unsupported_extension(self):
+    def test_parse_unsupported_extension(self, tmp_path):
         """Unsupported file extension raises SchemaError."""
-        txt_file = FIXTURES_DIR / "test.txt"
+        txt_file = tmp_path / "test.txt"
         txt_file.write_text('{"version": "1", "name": "Test", "fields": {}}')
 
-        try:
-            with pytest.raises(SchemaError) as exc_info:
-                parse_schema_file(txt_file)
+        with pytest.raises(SchemaError) as exc_info:
+            parse_schema_file(txt_file)
 
-            assert "Unsupported file format" in str(exc_info.value)
-        finally:
-            txt_file.unlink()
+        assert "Unsupported file format" in str(exc_info.value)
 
 
 class TestSecurityVerification:
@@ -681,7 +681,6 @@ class TestRoundTripIntegration:
     def test_full_pipeline_roundtrip(self, tmp_path):
         """Full pipeline from schema file to encode/decode round-trip."""
         from bitschema import parse_schema_file, compute_bit_layout
-        from bitschema import BoolFieldDefinition, IntFieldDefinition, EnumFieldDefinition
 
         # Create test schema file
         schema_file = tmp_path / "test_schema.json"
@@ -720,26 +719,7 @@ class TestRoundTripIntegration:
         schema = parse_schema_file(schema_file)
 
         # Convert schema.fields dict to list format for compute_bit_layout
-        fields_list = []
-        for name, field_def in schema.fields.items():
-            field_dict = {"name": name}
-            if isinstance(field_def, BoolFieldDefinition):
-                field_dict["type"] = "boolean"
-                field_dict["nullable"] = field_def.nullable
-            elif isinstance(field_def, IntFieldDefinition):
-                field_dict.update({
-                    "type": "integer",
-                    "min": field_def.min,
-                    "max": field_def.max,
-                    "nullable": field_def.nullable,
-                })
-            elif isinstance(field_def, EnumFieldDefinition):
-                field_dict.update({
-                    "type": "enum",
-                    "values": field_def.values,
-                    "nullable": field_def.nullable,
-                })
-            fields_list.append(field_dict)
+        fields_list = schema.to_layout_inputs()
 
         # Compute layout
         layouts, total_bits = compute_bit_layout(fields_list)
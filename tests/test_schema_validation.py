@@ -19,6 +19,7 @@ from bitschema import (
     schema_from_dict,
     load_from_json,
     SchemaError,
+    compute_bit_layout,
 )
 
 
@@ -309,6 +310,30 @@ class TestBitSchema:
         # 1 (a) + 1 (a presence) + 4 (b) + 1 (b presence) + 1 (c) + 1 (c presence) = 9 bits
         assert schema.calculate_total_bits() == 9
 
+    def test_to_layout_inputs_matches_computed_layout(self):
+        """Layout inputs cover every field type and agree with total bits."""
+        schema = schema_from_dict({
+            "name": "AllTypes",
+            "fields": {
+                "a": {"type": "bool", "nullable": True},
+                "b": {"type": "int", "bits": 4, "min": 0, "max": 15},
+                "c": {"type": "enum", "values": ["x", "y"]},
+                "d": {"type": "date", "resolution": "day",
+                      "min_date": "2024-01-01", "max_date": "2024-12-31"},
+                "e": {"type": "bitmask", "flags": {"read": 0, "write": 1}},
+            },
+        })
+        inputs = schema.to_layout_inputs()
+
+        assert [field["name"] for field in inputs] == ["a", "b", "c", "d", "e"]
+        assert [field["type"] for field in inputs] == [
+            "boolean", "integer", "enum", "date", "bitmask"
+        ]
+        assert inputs[0]["nullable"] is True
+        assert inputs[3]["resolution"] == "day"
+        _, total_bits = compute_bit_layout(inputs)
+        assert total_bits == schema.calculate_total_bits()
+
 
 class TestSchemaLoading:
     """Test schema loading from JSON and YAML."""